@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Migration script adding composite (user_email, created_at DESC, id DESC)
+indexes to every device-control and health-monitoring table.
+
+Every "latest" lookup and every history listing filters on user_email and
+orders by created_at (with id as the keyset tie-breaker), so these indexes
+let Postgres read the newest rows directly instead of sorting the user's
+whole history. Indexes are built CONCURRENTLY so ingestion keeps running.
+Safe to re-run: existing indexes are skipped.
+"""
+
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, text
+from app.core.config import settings
+
+TABLES = [
+    "sounds",
+    "steams",
+    "temp_tanks",
+    "water_pumps",
+    "nano_flickers",
+    "led_colors",
+    "biofeedbacks",
+    "burn_progresses",
+    "brain_monitorings",
+    "heart_brain_synchronicities",
+]
+
+
+def add_user_email_created_at_indexes():
+    """Create the composite user_email/created_at index on each telemetry and control table"""
+
+    engine = create_engine(settings.DATABASE_URL)
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        for table in TABLES:
+            index_name = f"ix_{table}_user_email_created_at"
+            try:
+                # A previously interrupted concurrent build leaves an INVALID index behind
+                invalid = connection.execute(text("""
+                    SELECT 1 FROM pg_class c
+                    JOIN pg_index i ON i.indexrelid = c.oid
+                    WHERE c.relname = :name AND NOT i.indisvalid
+                """), {"name": index_name}).fetchone()
+                if invalid:
+                    connection.execute(text(f"DROP INDEX CONCURRENTLY {index_name}"))
+
+                connection.execute(text(f"""
+                    CREATE INDEX CONCURRENTLY IF NOT EXISTS {index_name}
+                    ON {table} (user_email, created_at DESC, id DESC)
+                """))
+                connection.execute(text(f"ANALYZE {table}"))
+                print(f"✅ {index_name} is in place")
+            except Exception as e:
+                print(f"❌ Error creating {index_name}: {e}")
+                raise
+
+
+if __name__ == "__main__":
+    print("Starting user_email/created_at index migration...")
+    add_user_email_created_at_indexes()
@@ -1,11 +1,13 @@
 # app/api/admin_device_controls.py
 
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
 
+from app.core.serialization import rows_response
+from app.core.pagination import MAX_PAGE_SIZE, set_next_cursor
 from app.core.security import require_role
 from app.db.base import get_db
 from app.crud.device_controls import (
@@ -55,8 +57,16 @@ router = APIRouter(
     response_model=List[SoundOut],
     summary="Admin: List all Sound entries for a user",
 )
-def admin_list_sounds(user_email: str, db: Session = Depends(get_db)):
-    return get_sounds_by_user_email(db, user_email)
+def admin_list_sounds(
+    user_email: str,
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    db: Session = Depends(get_db),
+):
+    items = get_sounds_by_user_email(db, user_email, limit=limit, cursor=cursor)
+    set_next_cursor(response, items, limit)
+    return rows_response(items, SoundOut, response)
 
 @router.get(
     "/sound/{sound_id}",
@@ -96,8 +106,16 @@ def admin_delete_sound(sound_id: UUID, db: Session = Depends(get_db)):
     response_model=List[SteamOut],
     summary="Admin: List all Steam entries for a user",
 )
-def admin_list_steams(user_email: str, db: Session = Depends(get_db)):
-    return get_steams_by_user_email(db, user_email)
+def admin_list_steams(
+    user_email: str,
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    db: Session = Depends(get_db),
+):
+    items = get_steams_by_user_email(db, user_email, limit=limit, cursor=cursor)
+    set_next_cursor(response, items, limit)
+    return rows_response(items, SteamOut, response)
 
 @router.get(
     "/steam/{steam_id}",
@@ -137,8 +155,16 @@ def admin_delete_steam(steam_id: UUID, db: Session = Depends(get_db)):
     response_model=List[TempTankOut],
     summary="Admin: List all TempTank entries for a user",
 )
-def admin_list_temp_tanks(user_email: str, db: Session = Depends(get_db)):
-    return get_temp_tanks_by_user_email(db, user_email)
+def admin_list_temp_tanks(
+    user_email: str,
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    db: Session = Depends(get_db),
+):
+    items = get_temp_tanks_by_user_email(db, user_email, limit=limit, cursor=cursor)
+    set_next_cursor(response, items, limit)
+    return rows_response(items, TempTankOut, response)
 
 @router.get(
     "/temp-tank/{temp_tank_id}",
@@ -178,8 +204,16 @@ def admin_delete_temp_tank(temp_tank_id: UUID, db: Session = Depends(get_db)):
     response_model=List[WaterPumpOut],
     summary="Admin: List all WaterPump entries for a user",
 )
-def admin_list_water_pumps(user_email: str, db: Session = Depends(get_db)):
-    return get_water_pumps_by_user_email(db, user_email)
+def admin_list_water_pumps(
+    user_email: str,
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    db: Session = Depends(get_db),
+):
+    items = get_water_pumps_by_user_email(db, user_email, limit=limit, cursor=cursor)
+    set_next_cursor(response, items, limit)
+    return rows_response(items, WaterPumpOut, response)
 
 @router.get(
     "/water-pump/{water_pump_id}",
@@ -219,8 +253,16 @@ def admin_delete_water_pump(water_pump_id: UUID, db: Session = Depends(get_db)):
     response_model=List[NanoFlickerOut],
     summary="Admin: List all NanoFlicker entries for a user",
 )
-def admin_list_nano_flickers(user_email: str, db: Session = Depends(get_db)):
-    return get_nano_flickers_by_user_email(db, user_email)
+def admin_list_nano_flickers(
+    user_email: str,
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    db: Session = Depends(get_db),
+):
+    items = get_nano_flickers_by_user_email(db, user_email, limit=limit, cursor=cursor)
+    set_next_cursor(response, items, limit)
+    return rows_response(items, NanoFlickerOut, response)
 
 @router.get(
     "/nano-flicker/{nano_flicker_id}",
@@ -260,8 +302,16 @@ def admin_delete_nano_flicker(nano_flicker_id: UUID, db: Session = Depends(get_d
     response_model=List[LedColorOut],
     summary="Admin: List all LedColor entries for a user",
 )
-def admin_list_led_colors(user_email: str, db: Session = Depends(get_db)):
-    return get_led_colors_by_user_email(db, user_email)
+def admin_list_led_colors(
+    user_email: str,
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    db: Session = Depends(get_db),
+):
+    items = get_led_colors_by_user_email(db, user_email, limit=limit, cursor=cursor)
+    set_next_cursor(response, items, limit)
+    return rows_response(items, LedColorOut, response)
 
 @router.get(
     "/led-color/{led_color_id}",
@@ -1,11 +1,13 @@
 # app/api/admin_health_monitoring.py
 
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
 
+from app.core.serialization import rows_response
+from app.core.pagination import MAX_PAGE_SIZE, set_next_cursor
 from app.core.security import require_role
 from app.db.base import get_db
 from app.crud.health_monitoring import (
@@ -45,8 +47,16 @@ router = APIRouter(
     response_model=List[BiofeedbackOut],
     summary="Admin: List all Biofeedback entries for a user",
 )
-def admin_list_biofeedback(user_email: str, db: Session = Depends(get_db)):
-    return get_biofeedbacks_by_user_email(db, user_email)
+def admin_list_biofeedback(
+    user_email: str,
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    db: Session = Depends(get_db),
+):
+    items = get_biofeedbacks_by_user_email(db, user_email, limit=limit, cursor=cursor)
+    set_next_cursor(response, items, limit)
+    return rows_response(items, BiofeedbackOut, response)
 
 @router.get(
     "/biofeedback/{bio_id}",
@@ -90,8 +100,16 @@ def admin_delete_biofeedback(bio_id: UUID, db: Session = Depends(get_db)):
     response_model=List[BurnProgressOut],
     summary="Admin: List all BurnProgress entries for a user",
 )
-def admin_list_burn_progress(user_email: str, db: Session = Depends(get_db)):
-    return get_burn_progresses_by_user_email(db, user_email)
+def admin_list_burn_progress(
+    user_email: str,
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    db: Session = Depends(get_db),
+):
+    items = get_burn_progresses_by_user_email(db, user_email, limit=limit, cursor=cursor)
+    set_next_cursor(response, items, limit)
+    return rows_response(items, BurnProgressOut, response)
 
 @router.get(
     "/burn-progress/{bp_id}",
@@ -135,8 +153,16 @@ def admin_delete_burn_progress(bp_id: UUID, db: Session = Depends(get_db)):
     response_model=List[BrainMonitoringOut],
     summary="Admin: List all BrainMonitoring entries for a user",
 )
-def admin_list_brain_monitoring(user_email: str, db: Session = Depends(get_db)):
-    return get_brain_monitorings_by_user_email(db, user_email)
+def admin_list_brain_monitoring(
+    user_email: str,
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    db: Session = Depends(get_db),
+):
+    items = get_brain_monitorings_by_user_email(db, user_email, limit=limit, cursor=cursor)
+    set_next_cursor(response, items, limit)
+    return rows_response(items, BrainMonitoringOut, response)
 
 @router.get(
     "/brain-monitoring/{bm_id}",
@@ -180,8 +206,16 @@ def admin_delete_brain_monitoring(bm_id: UUID, db: Session = Depends(get_db)):
     response_model=List[HeartBrainSynchronicityOut],
     summary="Admin: List all HeartBrainSynchronicity entries for a user",
 )
-def admin_list_heart_brain(user_email: str, db: Session = Depends(get_db)):
-    return get_heart_brain_synchronicities_by_user_email(db, user_email)
+def admin_list_heart_brain(
+    user_email: str,
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    db: Session = Depends(get_db),
+):
+    items = get_heart_brain_synchronicities_by_user_email(db, user_email, limit=limit, cursor=cursor)
+    set_next_cursor(response, items, limit)
+    return rows_response(items, HeartBrainSynchronicityOut, response)
 
 @router.get(
     "/heart-brain-synchronicity/{hb_id}",
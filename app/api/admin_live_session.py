@@ -1,11 +1,13 @@
 # app/api/admin_live_session.py
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
 from fastapi import Body
 from uuid import UUID
-from typing import List
+from typing import List, Optional
 
+from app.core.cache import PUBLIC_LIVE_SESSION, invalidate_public
+from app.core.pagination import MAX_PAGE_SIZE, set_next_cursor
 from app.core.security import require_role
 from app.db.base import get_db
 from app.schemas.live_session import (
@@ -32,8 +34,15 @@ def admin_create_live_session(payload: LiveSessionCreate, db: Session = Depends(
     return create_live_session(db, payload)
 
 @router.get("/", response_model=List[LiveSessionOut])
-def admin_list_live_sessions(db: Session = Depends(get_db)):
-    return get_all_live_sessions(db)
+def admin_list_live_sessions(
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    db: Session = Depends(get_db),
+):
+    sessions = get_all_live_sessions(db, limit=limit, cursor=cursor)
+    set_next_cursor(response, sessions, limit, sort_attr="date_time")
+    return sessions
 
 @router.get("/{live_session_id}", response_model=LiveSessionOut)
 def admin_get_live_session(live_session_id: UUID, db: Session = Depends(get_db)):
@@ -70,5 +79,6 @@ def toggle_live_status(
         raise HTTPException(status_code=404, detail="LiveSession not found")
     session.livestatus = livestatus
     db.commit()
+    invalidate_public(PUBLIC_LIVE_SESSION)
     db.refresh(session)
     return session
\ No newline at end of file
@@ -0,0 +1,24 @@
+from fastapi import APIRouter, Depends
+
+from app.core.security import require_role
+from app.db.base import async_engine, engine
+
+router = APIRouter(
+    prefix="/admin/metrics",
+    tags=["admin-metrics"],
+    dependencies=[Depends(require_role(["Admin"]))]
+)
+
+
+@router.get("/db-pool", summary="Admin: Connection pool usage and checkout wait times")
+async def admin_db_pool_metrics():
+    """
+    Per engine: connections checked out, overflow in use and how long
+    callers waited for a connection. Long checkout waits or timeouts mean
+    the pool is exhausted; short waits with slow requests point at the
+    database itself.
+    """
+    return {
+        "sync": engine.pool.metrics.snapshot(engine.pool),
+        "async": async_engine.pool.metrics.snapshot(async_engine.pool),
+    }
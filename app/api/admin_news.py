@@ -1,9 +1,10 @@
 # app/api/admin_news.py
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
 from uuid import UUID
-from typing import List
+from typing import List, Optional
 
+from app.core.pagination import MAX_PAGE_SIZE, set_next_cursor
 from app.core.security import require_role
 from app.db.base import get_db
 from app.schemas.news import NewsCreate, NewsUpdate, NewsOut
@@ -20,8 +21,15 @@ def admin_create_news(payload: NewsCreate, db: Session = Depends(get_db)):
     return create_news(db, payload)
 
 @router.get("/", response_model=List[NewsOut])
-def admin_list_news(db: Session = Depends(get_db)):
-    return get_all_news(db)
+def admin_list_news(
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    db: Session = Depends(get_db),
+):
+    news = get_all_news(db, limit=limit, cursor=cursor)
+    set_next_cursor(response, news, limit, sort_attr="publish_date")
+    return news
 
 @router.get("/{news_id}", response_model=NewsOut)
 def admin_get_news(news_id: UUID, db: Session = Depends(get_db)):
@@ -1,9 +1,10 @@
 # app/api/admin_user_hub.py
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
 from uuid import UUID
 from typing import List, Optional
 
+from app.core.pagination import MAX_PAGE_SIZE, set_next_cursor
 from app.core.security import require_role
 from app.db.base import get_db
 from app.schemas.user_hub import UserHubCreate, UserHubUpdate, UserHubOut
@@ -34,23 +35,31 @@ def admin_create_user_hub(payload: UserHubCreate, db: Session = Depends(get_db))
 
 @router.get("/", response_model=List[UserHubOut])
 def admin_list_user_hubs(
+    response: Response,
     skip: int = 0, 
-    limit: int = 100, 
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE), 
     status: Optional[bool] = None,
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db)
 ):
     """Get all user hub entries with optional status filter"""
-    return get_all_user_hubs(db, skip=skip, limit=limit, status_filter=status)
+    hubs = get_all_user_hubs(db, skip=skip, limit=limit, status_filter=status, cursor=cursor)
+    set_next_cursor(response, hubs, limit)
+    return hubs
 
 @router.get("/category/{category}", response_model=List[UserHubOut])
 def admin_get_user_hubs_by_category(
     category: str, 
+    response: Response,
     skip: int = 0, 
-    limit: int = 100,
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db)
 ):
     """Get user hub entries by category"""
-    return get_user_hubs_by_category(db, category, skip=skip, limit=limit)
+    hubs = get_user_hubs_by_category(db, category, skip=skip, limit=limit, cursor=cursor)
+    set_next_cursor(response, hubs, limit)
+    return hubs
 
 @router.get("/{hub_id}", response_model=UserHubOut)
 def admin_get_user_hub(hub_id: UUID, db: Session = Depends(get_db)):
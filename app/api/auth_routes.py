@@ -1,12 +1,12 @@
-from app.core.security import authenticate_user, create_access_token, create_refresh_token, get_current_user
-from app.db.base import get_db
+from app.core.security import authenticate_user_async, password_hash_async, create_access_token, create_refresh_token, get_current_user
+from app.db.base import get_async_db, get_db
 from app.models import User, UserRole
 from app.schemas import Token, UserCreate, UserOut, TokenAdmin
 from app.services.user_service import (handle_login, handle_logout,
                                      handle_signup, handle_token_refresh)
 from fastapi import APIRouter, Depends, HTTPException, Security, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi.responses import JSONResponse
 from app.models.user import UserStatus
 from app.crud import user as user_crud  # Add this import
@@ -17,17 +17,22 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/login")
 
 # Reusable dependencies
 get_db_dep = Depends(get_db)
+get_async_db_dep = Depends(get_async_db)
 get_current_user_dep = Depends(get_current_user)
 
 
 @router.post("/signup", response_model=UserOut)
-def signup(user: UserCreate, db: Session = get_db_dep):
-    return handle_signup(user, db)
+async def signup(user: UserCreate, db: AsyncSession = get_async_db_dep):
+    # Hashing costs a bcrypt round, so only pay it for new addresses; handle_signup checks again before inserting
+    if await db.run_sync(user_crud.get_user_by_email, user.email):
+        raise HTTPException(status_code=400, detail="Email already registered")
+    hashed_password = await password_hash_async(user.password)
+    return await db.run_sync(lambda session: handle_signup(user, session, hashed_password))
 
 
 @router.post("/login", response_model=Token)
-def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = get_db_dep):
-    user = authenticate_user(db, form_data.username, form_data.password)
+async def login(form_data: OAuth2PasswordRequestForm = Depends(), db: AsyncSession = get_async_db_dep):
+    user = await authenticate_user_async(db, form_data.username, form_data.password)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -49,7 +54,7 @@ def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = get_db
 
     access_token = create_access_token(data={"sub": user.email})
     refresh_token = create_refresh_token(data={"sub": user.email})
-    user_crud.set_refresh_token(db, user, refresh_token)  # Now this will work
+    await db.run_sync(user_crud.set_refresh_token, user, refresh_token)
 
     return {
         "access_token": access_token,
@@ -62,11 +67,11 @@ def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = get_db
     response_model=TokenAdmin,
     summary="Login as admin and get tokens + is_admin flag",
 )
-def admin_login(
+async def admin_login(
     form_data: OAuth2PasswordRequestForm = Depends(),
-    db: Session = Depends(get_db),
+    db: AsyncSession = get_async_db_dep,
 ):
-    user = authenticate_user(db, form_data.username, form_data.password)
+    user = await authenticate_user_async(db, form_data.username, form_data.password)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -103,14 +108,14 @@ def admin_login(
     }
 
 @router.post("/refresh", response_model=Token)
-def refresh_token(refresh_token: str, db: Session = get_db_dep):
-    return handle_token_refresh(refresh_token, db)
+async def refresh_token(refresh_token: str, db: AsyncSession = get_async_db_dep):
+    return await db.run_sync(lambda session: handle_token_refresh(refresh_token, session))
 
 
 @router.post("/logout")
-def logout(
+async def logout(
     current_user: User = get_current_user_dep,
-    db: Session = get_db_dep,
+    db: AsyncSession = get_async_db_dep,
     token: str = Security(oauth2_scheme),
 ):
-    return handle_logout(current_user, db)
+    return await db.run_sync(lambda session: handle_logout(current_user, session))
@@ -1,11 +1,16 @@
+import asyncio
 from typing import List,Optional
-from fastapi import APIRouter, Depends, HTTPException
-from .. import models, schemas
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, WebSocket, WebSocketDisconnect, WebSocketException, status
+from .. import schemas
+from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 
-from app.db.base import get_db
-from app.core.security import get_current_user
+from app.db.base import AsyncSessionLocal, get_async_db
+from app.core.conditional import is_not_modified, not_modified, validators_for
+from app.core.serialization import rows_response
+from app.core.pagination import MAX_PAGE_SIZE, set_next_cursor
+from app.core.security import get_current_user, get_user_from_token
+from app.services.device_events import device_events
 from app.models import User
 from app.crud import device_controls as crud
 from app.schemas import (
@@ -25,14 +30,211 @@ router = APIRouter(prefix="/device-controls", tags=["Device Controls"])
 def user_dep():
     return Depends(get_current_user)
 
+# Define a response model for the consolidated endpoint
+class DeviceControlsLatest(BaseModel):
+    sound: Optional[SoundOut] = None
+    steam: Optional[SteamOut] = None
+    temp_tank: Optional[TempTankOut] = None
+    water_pump: Optional[WaterPumpOut] = None
+    nano_flicker: Optional[NanoFlickerOut] = None
+    led_color: Optional[LedColorOut] = None
+
+    model_config = {"from_attributes": True}
+
+# The "latest" routes are registered before the "/{id}" routes below,
+# otherwise "/sound/latest" would be captured by "/sound/{sound_id}".
+@router.get(
+    "/latest",
+    response_model=DeviceControlsLatest,
+    summary="Get latest values for all device controls",
+)
+async def get_latest_device_controls(
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Get the latest value for each device control for the current user.
+    Served from the user's device_state row by primary key; a poll carrying
+    the ETag (or Last-Modified) of the current state gets 304 after reading
+    only its updated_at.
+    """
+    version = await db.run_sync(crud.get_device_state_version, current_user.email)
+    if version is not None:
+        validators = validators_for(version, current_user.email)
+        if is_not_modified(request, validators):
+            return not_modified(validators)
+        validators.apply(response)
+    return DeviceControlsLatest(**await db.run_sync(crud.get_device_state, current_user.email))
+
+@router.get(
+    "/sound/latest",
+    response_model=SoundOut,
+    summary="Get the latest sound setting",
+)
+async def get_latest_sound(
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Get the latest sound setting for the current user.
+    """
+    latest_sound = (await db.run_sync(crud.get_device_state, current_user.email))["sound"]
+    if not latest_sound:
+        raise HTTPException(status_code=404, detail="No sound settings found")
+    return latest_sound
+
+@router.get(
+    "/steam/latest",
+    response_model=SteamOut,
+    summary="Get the latest steam setting",
+)
+async def get_latest_steam(
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Get the latest steam setting for the current user.
+    """
+    latest_steam = (await db.run_sync(crud.get_device_state, current_user.email))["steam"]
+    if not latest_steam:
+        raise HTTPException(status_code=404, detail="No steam settings found")
+    return latest_steam
+
+@router.get(
+    "/temp-tank/latest",
+    response_model=TempTankOut,
+    summary="Get the latest temperature tank setting",
+)
+async def get_latest_temp_tank(
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Get the latest temperature tank setting for the current user.
+    """
+    latest_temp_tank = (await db.run_sync(crud.get_device_state, current_user.email))["temp_tank"]
+    if not latest_temp_tank:
+        raise HTTPException(status_code=404, detail="No temperature tank settings found")
+    return latest_temp_tank
+
+@router.get(
+    "/water-pump/latest",
+    response_model=WaterPumpOut,
+    summary="Get the latest water pump setting",
+)
+async def get_latest_water_pump(
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Get the latest water pump setting for the current user.
+    """
+    latest_water_pump = (await db.run_sync(crud.get_device_state, current_user.email))["water_pump"]
+    if not latest_water_pump:
+        raise HTTPException(status_code=404, detail="No water pump settings found")
+    return latest_water_pump
+
+@router.get(
+    "/nano-flicker/latest",
+    response_model=NanoFlickerOut,
+    summary="Get the latest nano flicker setting",
+)
+async def get_latest_nano_flicker(
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Get the latest nano flicker setting for the current user.
+    """
+    latest_nano_flicker = (await db.run_sync(crud.get_device_state, current_user.email))["nano_flicker"]
+    if not latest_nano_flicker:
+        raise HTTPException(status_code=404, detail="No nano flicker settings found")
+    return latest_nano_flicker
+
+@router.get(
+    "/led-color/latest",
+    response_model=LedColorOut,
+    summary="Get the latest LED color setting",
+)
+async def get_latest_led_color(
+    db: AsyncSession = Depends(get_async_db),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Get the latest LED color setting for the current user.
+    """
+    latest_led_color = (await db.run_sync(crud.get_device_state, current_user.email))["led_color"]
+    if not latest_led_color:
+        raise HTTPException(status_code=404, detail="No LED color settings found")
+    return latest_led_color
+
+
+async def _user_email_for_token(token: str) -> str:
+    async with AsyncSessionLocal() as db:
+        return (await db.run_sync(get_user_from_token, token)).email
+
+
+async def _load_device_state(user_email: str) -> dict:
+    async with AsyncSessionLocal() as db:
+        return await db.run_sync(crud.get_device_state, user_email)
+
+
+async def _wait_for_disconnect(websocket: WebSocket):
+    # Clients have nothing to send on this channel; just notice when they leave
+    while (await websocket.receive())["type"] != "websocket.disconnect":
+        pass
+
+
+@router.websocket("/ws")
+async def device_controls_ws(websocket: WebSocket, token: str = Query(...)):
+    """
+    Push device-control changes for the current user as soon as they commit.
+    Sends the full current state on connect, then one message per change.
+    Browsers cannot set headers on WebSockets, so the access token is passed
+    as the ``token`` query parameter.
+    """
+    try:
+        user_email = await _user_email_for_token(token)
+    except HTTPException as e:
+        raise WebSocketException(code=status.WS_1008_POLICY_VIOLATION, reason=e.detail)
+
+    # Subscribe before reading the snapshot so a change committed in between is
+    # queued rather than lost; replaying it on top of the snapshot is harmless
+    queue = device_events.subscribe(user_email)
+    disconnected = None
+    try:
+        state = await _load_device_state(user_email)
+        await websocket.accept()
+        await websocket.send_json({
+            "type": "snapshot",
+            "state": DeviceControlsLatest(**state).model_dump(mode="json"),
+        })
+        disconnected = asyncio.create_task(_wait_for_disconnect(websocket))
+        while True:
+            next_event = asyncio.create_task(queue.get())
+            done, _ = await asyncio.wait({next_event, disconnected}, return_when=asyncio.FIRST_COMPLETED)
+            if disconnected in done:
+                next_event.cancel()
+                break
+            await websocket.send_json(next_event.result())
+    except WebSocketDisconnect:
+        pass
+    finally:
+        device_events.unsubscribe(user_email, queue)
+        if disconnected:
+            disconnected.cancel()
+
+
 # === SOUND ===
 @router.post("/sound", response_model=SoundOut)
-def create_sound(sound: SoundCreate, db: Session = Depends(get_db), current_user: User = Depends(get_current_user)):
-    return crud.create_sound(db, sound,current_user.email)
+async def create_sound(sound: SoundCreate, db: AsyncSession = Depends(get_async_db), current_user: User = Depends(get_current_user)):
+    return await db.run_sync(crud.create_sound, sound,current_user.email)
 
 @router.get("/sound/{sound_id}", response_model=SoundOut)
-def get_sound(sound_id: UUID, db: Session = Depends(get_db), user: User = Depends(get_current_user)):
-    sound = crud.get_sound(db, sound_id)
+async def get_sound(sound_id: UUID, db: AsyncSession = Depends(get_async_db), user: User = Depends(get_current_user)):
+    sound = await db.run_sync(crud.get_sound, sound_id)
     if not sound:
         raise HTTPException(status_code=404, detail="Sound not found")
     return sound
@@ -42,25 +244,25 @@ def get_sound(sound_id: UUID, db: Session = Depends(get_db), user: User = Depend
     response_model=List[schemas.SoundOut],
     summary="List sound entries for this user",
 )
-def list_led_color(
-    db: Session = Depends(get_db),
+async def list_sounds(
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    db: AsyncSession = Depends(get_async_db),
     current_user=Depends(get_current_user),
 ):
-    return (
-        db.query(models.Sound)
-        .filter(models.Sound.user_email == current_user.email)
-        .order_by(models.Sound.created_at.desc())
-        .all()
-    )
+    items = await db.run_sync(crud.get_sounds_by_user_email, current_user.email, limit=limit, cursor=cursor)
+    set_next_cursor(response, items, limit)
+    return rows_response(items, SoundOut, response)
 
 
 @router.put("/sound/{sound_id}", response_model=SoundOut)
-def update_sound(sound_id: UUID, sound: SoundUpdate, db: Session = Depends(get_db), user: User = Depends(get_current_user)):
-    return crud.update_sound(db, sound_id, sound)
+async def update_sound(sound_id: UUID, sound: SoundUpdate, db: AsyncSession = Depends(get_async_db), user: User = Depends(get_current_user)):
+    return await db.run_sync(crud.update_sound, sound_id, sound)
 
 @router.delete("/sound/{sound_id}")
-def delete_sound(sound_id: UUID, db: Session = Depends(get_db), user: User = Depends(get_current_user)):
-    success = crud.delete_sound(db, sound_id)
+async def delete_sound(sound_id: UUID, db: AsyncSession = Depends(get_async_db), user: User = Depends(get_current_user)):
+    success = await db.run_sync(crud.delete_sound, sound_id)
     if not success:
         raise HTTPException(status_code=404, detail="Sound not found")
     return {"detail": "Sound deleted successfully"}
@@ -68,12 +270,12 @@ def delete_sound(sound_id: UUID, db: Session = Depends(get_db), user: User = Dep
 
 # === STEAM ===
 @router.post("/steam", response_model=SteamOut)
-def create_steam(steam: SteamCreate, db: Session = Depends(get_db), user: User = Depends(get_current_user)):
-    return crud.create_steam(db, steam)
+async def create_steam(steam: SteamCreate, db: AsyncSession = Depends(get_async_db), user: User = Depends(get_current_user)):
+    return await db.run_sync(crud.create_steam, steam)
 
 @router.get("/steam/{steam_id}", response_model=SteamOut)
-def get_steam(steam_id: UUID, db: Session = Depends(get_db), user: User = Depends(get_current_user)):
-    steam = crud.get_steam(db, steam_id)
+async def get_steam(steam_id: UUID, db: AsyncSession = Depends(get_async_db), user: User = Depends(get_current_user)):
+    steam = await db.run_sync(crud.get_steam, steam_id)
     if not steam:
         raise HTTPException(status_code=404, detail="Steam not found")
     return steam
@@ -83,24 +285,24 @@ def get_steam(steam_id: UUID, db: Session = Depends(get_db), user: User = Depend
     response_model=List[schemas.SteamOut],
     summary="List steam entries for this user",
 )
-def list_led_color(
-    db: Session = Depends(get_db),
+async def list_steams(
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    db: AsyncSession = Depends(get_async_db),
     current_user=Depends(get_current_user),
 ):
-    return (
-        db.query(models.Steam)
-        .filter(models.Steam.user_email == current_user.email)
-        .order_by(models.Steam.created_at.desc())
-        .all()
-    )
+    items = await db.run_sync(crud.get_steams_by_user_email, current_user.email, limit=limit, cursor=cursor)
+    set_next_cursor(response, items, limit)
+    return rows_response(items, SteamOut, response)
 
 @router.put("/steam/{steam_id}", response_model=SteamOut)
-def update_steam(steam_id: UUID, steam: SteamUpdate, db: Session = Depends(get_db), user: User = Depends(get_current_user)):
-    return crud.update_steam(db, steam_id, steam)
+async def update_steam(steam_id: UUID, steam: SteamUpdate, db: AsyncSession = Depends(get_async_db), user: User = Depends(get_current_user)):
+    return await db.run_sync(crud.update_steam, steam_id, steam)
 
 @router.delete("/steam/{steam_id}")
-def delete_steam(steam_id: UUID, db: Session = Depends(get_db), user: User = Depends(get_current_user)):
-    success = crud.delete_steam(db, steam_id)
+async def delete_steam(steam_id: UUID, db: AsyncSession = Depends(get_async_db), user: User = Depends(get_current_user)):
+    success = await db.run_sync(crud.delete_steam, steam_id)
     if not success:
         raise HTTPException(status_code=404, detail="Steam not found")
     return {"detail": "Steam deleted successfully"}
@@ -108,12 +310,12 @@ def delete_steam(steam_id: UUID, db: Session = Depends(get_db), user: User = Dep
 
 # === TEMP TANK ===
 @router.post("/temp-tank", response_model=TempTankOut)
-def create_temp_tank(data: TempTankCreate, db: Session = Depends(get_db), user: User = Depends(get_current_user)):
-    return crud.create_temp_tank(db, data)
+async def create_temp_tank(data: TempTankCreate, db: AsyncSession = Depends(get_async_db), user: User = Depends(get_current_user)):
+    return await db.run_sync(crud.create_temp_tank, data)
 
 @router.get("/temp-tank/{id}", response_model=TempTankOut)
-def get_temp_tank(id: UUID, db: Session = Depends(get_db), user: User = Depends(get_current_user)):
-    obj = crud.get_temp_tank(db, id)
+async def get_temp_tank(id: UUID, db: AsyncSession = Depends(get_async_db), user: User = Depends(get_current_user)):
+    obj = await db.run_sync(crud.get_temp_tank, id)
     if not obj:
         raise HTTPException(status_code=404, detail="TempTank not found")
     return obj
@@ -123,24 +325,24 @@ def get_temp_tank(id: UUID, db: Session = Depends(get_db), user: User = Depends(
     response_model=List[schemas.TempTankOut],
     summary="List temperature tank entries for this user",
 )
-def list_led_color(
-    db: Session = Depends(get_db),
+async def list_temp_tanks(
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    db: AsyncSession = Depends(get_async_db),
     current_user=Depends(get_current_user),
 ):
-    return (
-        db.query(models.TempTank)
-        .filter(models.TempTank.user_email == current_user.email)
-        .order_by(models.TempTank.created_at.desc())
-        .all()
-    )
+    items = await db.run_sync(crud.get_temp_tanks_by_user_email, current_user.email, limit=limit, cursor=cursor)
+    set_next_cursor(response, items, limit)
+    return rows_response(items, TempTankOut, response)
 
 @router.put("/temp-tank/{id}", response_model=TempTankOut)
-def update_temp_tank(id: UUID, update: TempTankUpdate, db: Session = Depends(get_db), user: User = Depends(get_current_user)):
-    return crud.update_temp_tank(db, id, update)
+async def update_temp_tank(id: UUID, update: TempTankUpdate, db: AsyncSession = Depends(get_async_db), user: User = Depends(get_current_user)):
+    return await db.run_sync(crud.update_temp_tank, id, update)
 
 @router.delete("/temp-tank/{id}")
-def delete_temp_tank(id: UUID, db: Session = Depends(get_db), user: User = Depends(get_current_user)):
-    success = crud.delete_temp_tank(db, id)
+async def delete_temp_tank(id: UUID, db: AsyncSession = Depends(get_async_db), user: User = Depends(get_current_user)):
+    success = await db.run_sync(crud.delete_temp_tank, id)
     if not success:
         raise HTTPException(status_code=404, detail="TempTank not found")
     return {"detail": "TempTank deleted successfully"}
@@ -148,12 +350,12 @@ def delete_temp_tank(id: UUID, db: Session = Depends(get_db), user: User = Depen
 
 # === WATER PUMP ===
 @router.post("/water-pump", response_model=WaterPumpOut)
-def create_water_pump(data: WaterPumpCreate, db: Session = Depends(get_db), user: User = Depends(get_current_user)):
-    return crud.create_water_pump(db, data)
+async def create_water_pump(data: WaterPumpCreate, db: AsyncSession = Depends(get_async_db), user: User = Depends(get_current_user)):
+    return await db.run_sync(crud.create_water_pump, data)
 
 @router.get("/water-pump/{id}", response_model=WaterPumpOut)
-def get_water_pump(id: UUID, db: Session = Depends(get_db), user: User = Depends(get_current_user)):
-    obj = crud.get_water_pump(db, id)
+async def get_water_pump(id: UUID, db: AsyncSession = Depends(get_async_db), user: User = Depends(get_current_user)):
+    obj = await db.run_sync(crud.get_water_pump, id)
     if not obj:
         raise HTTPException(status_code=404, detail="WaterPump not found")
     return obj
@@ -163,24 +365,24 @@ def get_water_pump(id: UUID, db: Session = Depends(get_db), user: User = Depends
     response_model=List[schemas.WaterPumpOut],
     summary="List water pump entries for this user",
 )
-def list_led_color(
-    db: Session = Depends(get_db),
+async def list_water_pumps(
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    db: AsyncSession = Depends(get_async_db),
     current_user=Depends(get_current_user),
 ):
-    return (
-        db.query(models.WaterPump)
-        .filter(models.WaterPump.user_email == current_user.email)
-        .order_by(models.WaterPump.created_at.desc())
-        .all()
-    )
+    items = await db.run_sync(crud.get_water_pumps_by_user_email, current_user.email, limit=limit, cursor=cursor)
+    set_next_cursor(response, items, limit)
+    return rows_response(items, WaterPumpOut, response)
 
 @router.put("/water-pump/{id}", response_model=WaterPumpOut)
-def update_water_pump(id: UUID, update: WaterPumpUpdate, db: Session = Depends(get_db), user: User = Depends(get_current_user)):
-    return crud.update_water_pump(db, id, update)
+async def update_water_pump(id: UUID, update: WaterPumpUpdate, db: AsyncSession = Depends(get_async_db), user: User = Depends(get_current_user)):
+    return await db.run_sync(crud.update_water_pump, id, update)
 
 @router.delete("/water-pump/{id}")
-def delete_water_pump(id: UUID, db: Session = Depends(get_db), user: User = Depends(get_current_user)):
-    success = crud.delete_water_pump(db, id)
+async def delete_water_pump(id: UUID, db: AsyncSession = Depends(get_async_db), user: User = Depends(get_current_user)):
+    success = await db.run_sync(crud.delete_water_pump, id)
     if not success:
         raise HTTPException(status_code=404, detail="WaterPump not found")
     return {"detail": "WaterPump deleted successfully"}
@@ -188,12 +390,12 @@ def delete_water_pump(id: UUID, db: Session = Depends(get_db), user: User = Depe
 
 # === NANO FLICKER ===
 @router.post("/nano-flicker", response_model=NanoFlickerOut)
-def create_nano_flicker(data: NanoFlickerCreate, db: Session = Depends(get_db), user: User = Depends(get_current_user)):
-    return crud.create_nano_flicker(db, data)
+async def create_nano_flicker(data: NanoFlickerCreate, db: AsyncSession = Depends(get_async_db), user: User = Depends(get_current_user)):
+    return await db.run_sync(crud.create_nano_flicker, data)
 
 @router.get("/nano-flicker/{id}", response_model=NanoFlickerOut)
-def get_nano_flicker(id: UUID, db: Session = Depends(get_db), user: User = Depends(get_current_user)):
-    obj = crud.get_nano_flicker(db, id)
+async def get_nano_flicker(id: UUID, db: AsyncSession = Depends(get_async_db), user: User = Depends(get_current_user)):
+    obj = await db.run_sync(crud.get_nano_flicker, id)
     if not obj:
         raise HTTPException(status_code=404, detail="NanoFlicker not found")
     return obj
@@ -203,24 +405,24 @@ def get_nano_flicker(id: UUID, db: Session = Depends(get_db), user: User = Depen
     response_model=List[schemas.NanoFlickerOut],
     summary="List Nano Flicker entries for this user",
 )
-def list_nano_flicker(
-    db: Session = Depends(get_db),
+async def list_nano_flickers(
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    db: AsyncSession = Depends(get_async_db),
     current_user=Depends(get_current_user),
 ):
-    return (
-        db.query(models.NanoFlicker)
-        .filter(models.NanoFlicker.user_email == current_user.email)
-        .order_by(models.NanoFlicker.created_at.desc())
-        .all()
-    )
+    items = await db.run_sync(crud.get_nano_flickers_by_user_email, current_user.email, limit=limit, cursor=cursor)
+    set_next_cursor(response, items, limit)
+    return rows_response(items, NanoFlickerOut, response)
 
 @router.put("/nano-flicker/{id}", response_model=NanoFlickerOut)
-def update_nano_flicker(id: UUID, update: NanoFlickerUpdate, db: Session = Depends(get_db), user: User = Depends(get_current_user)):
-    return crud.update_nano_flicker(db, id, update)
+async def update_nano_flicker(id: UUID, update: NanoFlickerUpdate, db: AsyncSession = Depends(get_async_db), user: User = Depends(get_current_user)):
+    return await db.run_sync(crud.update_nano_flicker, id, update)
 
 @router.delete("/nano-flicker/{id}")
-def delete_nano_flicker(id: UUID, db: Session = Depends(get_db), user: User = Depends(get_current_user)):
-    success = crud.delete_nano_flicker(db, id)
+async def delete_nano_flicker(id: UUID, db: AsyncSession = Depends(get_async_db), user: User = Depends(get_current_user)):
+    success = await db.run_sync(crud.delete_nano_flicker, id)
     if not success:
         raise HTTPException(status_code=404, detail="NanoFlicker not found")
     return {"detail": "NanoFlicker deleted successfully"}
@@ -228,12 +430,12 @@ def delete_nano_flicker(id: UUID, db: Session = Depends(get_db), user: User = De
 
 # === LED COLOR ===
 @router.post("/led-color", response_model=LedColorOut)
-def create_led_color(data: LedColorCreate, db: Session = Depends(get_db), user: User = Depends(get_current_user)):
-    return crud.create_led_color(db, data)
+async def create_led_color(data: LedColorCreate, db: AsyncSession = Depends(get_async_db), user: User = Depends(get_current_user)):
+    return await db.run_sync(crud.create_led_color, data)
 
 @router.get("/led-color/{id}", response_model=LedColorOut)
-def get_led_color(id: UUID, db: Session = Depends(get_db), user: User = Depends(get_current_user)):
-    obj = crud.get_led_color(db, id)
+async def get_led_color(id: UUID, db: AsyncSession = Depends(get_async_db), user: User = Depends(get_current_user)):
+    obj = await db.run_sync(crud.get_led_color, id)
     if not obj:
         raise HTTPException(status_code=404, detail="LedColor not found")
     return obj
@@ -243,176 +445,25 @@ def get_led_color(id: UUID, db: Session = Depends(get_db), user: User = Depends(
     response_model=List[schemas.LedColorOut],
     summary="List LED Color entries for this user",
 )
-def list_led_color(
-    db: Session = Depends(get_db),
+async def list_led_colors(
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    db: AsyncSession = Depends(get_async_db),
     current_user=Depends(get_current_user),
 ):
-    return (
-        db.query(models.LedColor)
-        .filter(models.LedColor.user_email == current_user.email)
-        .order_by(models.LedColor.created_at.desc())
-        .all()
-    )
+    items = await db.run_sync(crud.get_led_colors_by_user_email, current_user.email, limit=limit, cursor=cursor)
+    set_next_cursor(response, items, limit)
+    return rows_response(items, LedColorOut, response)
 
 @router.put("/led-color/{id}", response_model=LedColorOut)
-def update_led_color(id: UUID, update: LedColorUpdate, db: Session = Depends(get_db), user: User = Depends(get_current_user)):
-    return crud.update_led_color(db, id, update)
+async def update_led_color(id: UUID, update: LedColorUpdate, db: AsyncSession = Depends(get_async_db), user: User = Depends(get_current_user)):
+    return await db.run_sync(crud.update_led_color, id, update)
 
 @router.delete("/led-color/{id}")
-def delete_led_color(id: UUID, db: Session = Depends(get_db), user: User = Depends(get_current_user)):
-    success = crud.delete_led_color(db, id)
+async def delete_led_color(id: UUID, db: AsyncSession = Depends(get_async_db), user: User = Depends(get_current_user)):
+    success = await db.run_sync(crud.delete_led_color, id)
     if not success:
         raise HTTPException(status_code=404, detail="LedColor not found")
     return {"detail": "LedColor deleted successfully"}
 
-
-
-
-
-
-# Define a response model for the consolidated endpoint
-class DeviceControlsLatest(BaseModel):
-    sound: Optional[SoundOut] = None
-    steam: Optional[SteamOut] = None
-    temp_tank: Optional[TempTankOut] = None
-    water_pump: Optional[WaterPumpOut] = None
-    nano_flicker: Optional[NanoFlickerOut] = None
-    led_color: Optional[LedColorOut] = None
-
-    model_config = {"from_attributes": True}
-
-# Add this to your existing router
-@router.get(
-    "/latest",
-    response_model=DeviceControlsLatest,
-    summary="Get latest values for all device controls",
-)
-def get_latest_device_controls(
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-):
-    """
-    Get the latest value for each device control for the current user.
-    """
-    user_email = current_user.email
-    
-    # Get the latest entry for each device control
-    latest_sound = crud.get_sound_by_user_email(db, user_email)
-    latest_steam = crud.get_steam_by_user_email(db, user_email)
-    latest_temp_tank = crud.get_temp_tank_by_user_email(db, user_email)
-    latest_water_pump = crud.get_water_pump_by_user_email(db, user_email)
-    latest_nano_flicker = crud.get_nano_flicker_by_user_email(db, user_email)
-    latest_led_color = crud.get_led_color_by_user_email(db, user_email)
-    
-    # Construct the response
-    return DeviceControlsLatest(
-        sound=latest_sound,
-        steam=latest_steam,
-        temp_tank=latest_temp_tank,
-        water_pump=latest_water_pump,
-        nano_flicker=latest_nano_flicker,
-        led_color=latest_led_color,
-    )
-
-# Individual latest endpoints for each device control
-@router.get(
-    "/sound/latest",
-    response_model=SoundOut,
-    summary="Get the latest sound setting",
-)
-def get_latest_sound(
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-):
-    """
-    Get the latest sound setting for the current user.
-    """
-    latest_sound = crud.get_sound_by_user_email(db, current_user.email)
-    if not latest_sound:
-        raise HTTPException(status_code=404, detail="No sound settings found")
-    return latest_sound
-
-@router.get(
-    "/steam/latest",
-    response_model=SteamOut,
-    summary="Get the latest steam setting",
-)
-def get_latest_steam(
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-):
-    """
-    Get the latest steam setting for the current user.
-    """
-    latest_steam = crud.get_steam_by_user_email(db, current_user.email)
-    if not latest_steam:
-        raise HTTPException(status_code=404, detail="No steam settings found")
-    return latest_steam
-
-@router.get(
-    "/temp-tank/latest",
-    response_model=TempTankOut,
-    summary="Get the latest temperature tank setting",
-)
-def get_latest_temp_tank(
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-):
-    """
-    Get the latest temperature tank setting for the current user.
-    """
-    latest_temp_tank = crud.get_temp_tank_by_user_email(db, current_user.email)
-    if not latest_temp_tank:
-        raise HTTPException(status_code=404, detail="No temperature tank settings found")
-    return latest_temp_tank
-
-@router.get(
-    "/water-pump/latest",
-    response_model=WaterPumpOut,
-    summary="Get the latest water pump setting",
-)
-def get_latest_water_pump(
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-):
-    """
-    Get the latest water pump setting for the current user.
-    """
-    latest_water_pump = crud.get_water_pump_by_user_email(db, current_user.email)
-    if not latest_water_pump:
-        raise HTTPException(status_code=404, detail="No water pump settings found")
-    return latest_water_pump
-
-@router.get(
-    "/nano-flicker/latest",
-    response_model=NanoFlickerOut,
-    summary="Get the latest nano flicker setting",
-)
-def get_latest_nano_flicker(
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-):
-    """
-    Get the latest nano flicker setting for the current user.
-    """
-    latest_nano_flicker = crud.get_nano_flicker_by_user_email(db, current_user.email)
-    if not latest_nano_flicker:
-        raise HTTPException(status_code=404, detail="No nano flicker settings found")
-    return latest_nano_flicker
-
-@router.get(
-    "/led-color/latest",
-    response_model=LedColorOut,
-    summary="Get the latest LED color setting",
-)
-def get_latest_led_color(
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
-):
-    """
-    Get the latest LED color setting for the current user.
-    """
-    latest_led_color = crud.get_led_color_by_user_email(db, current_user.email)
-    if not latest_led_color:
-        raise HTTPException(status_code=404, detail="No LED color settings found")
-    return latest_led_color
\ No newline at end of file
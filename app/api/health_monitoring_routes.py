@@ -1,11 +1,19 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+import asyncio
+import json
+import logging
+from datetime import datetime, timezone
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, WebSocket, WebSocketDisconnect, WebSocketException, status
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
-from .. import models, schemas
+from .. import schemas
 
-from app.db.base import get_db
-from app.core.security import get_current_user
+from app.db.base import AsyncSessionLocal, get_async_db
+from app.core.conditional import is_not_modified, not_modified, rows_validators
+from app.core.serialization import rows_response
+from app.core.pagination import MAX_PAGE_SIZE, set_next_cursor
+from app.core.security import get_current_user, get_user_from_token
 from app.models import User
 from app.crud import health_monitoring as crud
 from app.schemas import (
@@ -13,18 +21,204 @@ from app.schemas import (
     BurnProgressCreate, BurnProgressUpdate, BurnProgressOut,
     BrainMonitoringCreate, BrainMonitoringUpdate, BrainMonitoringOut,
     HeartBrainSynchronicityCreate, HeartBrainSynchronicityUpdate, HeartBrainSynchronicityOut,
+    BiofeedbackBulkCreate, BurnProgressBulkCreate, BrainMonitoringBulkCreate,
+    HeartBrainSynchronicityBulkCreate, HealthMonitoringBulkOut,
+    SeriesBucket, HealthMonitoringSeriesOut,
 )
+from app.schemas.health_monitoring import MAX_BULK_READINGS, MAX_SERIES_BUCKETS, SERIES_BUCKET_SECONDS
 
 router = APIRouter(prefix="/health-monitoring", tags=["Health Monitoring"])
 
+logger = logging.getLogger(__name__)
+
+
+async def series_window(
+    start: datetime = Query(..., alias="from"),
+    end: datetime = Query(..., alias="to"),
+    bucket: SeriesBucket = Query(SeriesBucket.one_minute),
+) -> dict:
+    """Validate a from/to/bucket query and cap the number of buckets it can produce"""
+    # Timestamps are stored in UTC; a value without an offset is taken as UTC
+    start, end = (value if value.tzinfo else value.replace(tzinfo=timezone.utc) for value in (start, end))
+    if end <= start:
+        raise HTTPException(status_code=400, detail="'to' must be after 'from'")
+    bucket_seconds = SERIES_BUCKET_SECONDS[bucket]
+    if (end - start).total_seconds() / bucket_seconds > MAX_SERIES_BUCKETS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Range too large for bucket '{bucket.value}'. Maximum {MAX_SERIES_BUCKETS} buckets allowed",
+        )
+    return {"start": start, "end": end, "bucket": bucket, "bucket_seconds": bucket_seconds}
+
+
+def series_response(window: dict, points: list) -> dict:
+    return {"bucket": window["bucket"], "start": window["start"], "end": window["end"], "points": points}
+
+
+# === STREAMING INGESTION ===
+# Frame "type" -> (schema of one reading, bulk writer)
+STREAM_FAMILIES = {
+    "biofeedback": (BiofeedbackCreate, crud.create_biofeedbacks_bulk),
+    "burn_progress": (BurnProgressCreate, crud.create_burn_progresses_bulk),
+    "brain_monitoring": (BrainMonitoringCreate, crud.create_brain_monitorings_bulk),
+    "heart_brain_synchronicity": (HeartBrainSynchronicityCreate, crud.create_heart_brain_synchronicities_bulk),
+}
+# Buffered readings are written once either bound is reached
+STREAM_FLUSH_SIZE = 500
+STREAM_FLUSH_SECONDS = 1.0
+
+
+async def _authenticate_stream(token: str) -> str:
+    async with AsyncSessionLocal() as db:
+        return (await db.run_sync(get_user_from_token, token)).email
+
+
+class _StreamFlushError(Exception):
+    """Writing buffered stream readings failed after ``inserted`` of them were committed"""
+
+    def __init__(self, inserted: int):
+        super().__init__(f"{inserted} readings were stored before the write failed")
+        self.inserted = inserted
+
+
+async def _flush_stream(buffers: dict) -> int:
+    inserted = 0
+    try:
+        async with AsyncSessionLocal() as db:
+            for family, readings in buffers.items():
+                # Same statement size as the bulk endpoints, however much piled up before the flush
+                for start in range(0, len(readings), STREAM_FLUSH_SIZE):
+                    inserted += len(await db.run_sync(STREAM_FAMILIES[family][1], readings[start:start + STREAM_FLUSH_SIZE]))
+    except Exception as e:
+        # Each chunk commits on its own, so report what made it in
+        raise _StreamFlushError(inserted) from e
+    return inserted
+
+
+async def _receive_text(websocket: WebSocket) -> Optional[str]:
+    """Next text frame, or None for a binary one; raises WebSocketDisconnect when the client leaves"""
+    message = await websocket.receive()
+    if message["type"] == "websocket.disconnect":
+        raise WebSocketDisconnect(message.get("code", status.WS_1000_NORMAL_CLOSURE), message.get("reason"))
+    return message.get("text")
+
+
+def _parse_frame(raw: str, user_email: str) -> tuple:
+    """Validate one frame into ``(family, [readings])``; raises ValueError with a client-facing message"""
+    try:
+        frame = json.loads(raw)
+    except json.JSONDecodeError:
+        raise ValueError("Frame is not valid JSON")
+    if not isinstance(frame, dict) or frame.get("type") not in STREAM_FAMILIES:
+        raise ValueError(f"Frame 'type' must be one of: {', '.join(STREAM_FAMILIES)}")
+    data = frame.get("data")
+    items = data if isinstance(data, list) else [data]
+    if len(items) > MAX_BULK_READINGS:
+        raise ValueError(f"A frame may carry at most {MAX_BULK_READINGS} readings")
+    schema = STREAM_FAMILIES[frame["type"]][0]
+    try:
+        # Readings always belong to the authenticated user, whatever the frame says
+        return frame["type"], [schema(**{**(item or {}), "user_email": user_email}) for item in items]
+    except (TypeError, ValidationError) as e:
+        raise ValueError(f"Invalid {frame['type']} reading: {e}")
+
+
+@router.websocket("/ws")
+async def stream_readings(websocket: WebSocket, token: str = Query(...)):
+    """
+    Long-lived ingestion channel for live sessions.
+    The token is checked once on connect; after that each text frame is
+    ``{"type": "biofeedback", "data": {...}}`` (``data`` may also be a list
+    of up to MAX_BULK_READINGS readings).
+    Readings are buffered and written with one bulk insert per family every
+    STREAM_FLUSH_SIZE readings or STREAM_FLUSH_SECONDS, whichever comes
+    first, and each write is acknowledged with ``{"type": "ack", "inserted": n}``.
+    If a write fails the client gets an error frame with the number of readings
+    that were stored, and the socket is closed.
+    """
+    try:
+        user_email = await _authenticate_stream(token)
+    except HTTPException as e:
+        raise WebSocketException(code=status.WS_1008_POLICY_VIOLATION, reason=e.detail)
+
+    await websocket.accept()
+    loop = asyncio.get_running_loop()
+    buffers = {family: [] for family in STREAM_FAMILIES}
+    buffered = 0
+    deadline = loop.time() + STREAM_FLUSH_SECONDS
+    receive = None
+    try:
+        receive = asyncio.create_task(_receive_text(websocket))
+        while True:
+            # Waiting on the same receive task across timeouts means no frame is lost to cancellation
+            done, _ = await asyncio.wait({receive}, timeout=max(0, deadline - loop.time()))
+            if receive in done:
+                raw = receive.result()
+                receive = asyncio.create_task(_receive_text(websocket))
+                try:
+                    if raw is None:
+                        raise ValueError("Frames must be JSON text, not binary")
+                    family, readings = _parse_frame(raw, user_email)
+                except ValueError as e:
+                    await websocket.send_json({"type": "error", "detail": str(e)})
+                else:
+                    buffers[family].extend(readings)
+                    buffered += len(readings)
+            if buffered >= STREAM_FLUSH_SIZE or loop.time() >= deadline:
+                if buffered:
+                    pending, pending_count = buffers, buffered
+                    buffers, buffered = {family: [] for family in STREAM_FAMILIES}, 0
+                    try:
+                        inserted = await _flush_stream(pending)
+                    except _StreamFlushError as e:
+                        logger.exception("Storing streamed readings for %s failed", user_email)
+                        await websocket.send_json({
+                            "type": "error",
+                            "detail": f"Storing readings failed; {e.inserted} of {pending_count} were stored",
+                            "inserted": e.inserted,
+                        })
+                        await websocket.close(code=status.WS_1011_INTERNAL_ERROR)
+                        break
+                    await websocket.send_json({"type": "ack", "inserted": inserted})
+                deadline = loop.time() + STREAM_FLUSH_SECONDS
+    except WebSocketDisconnect:
+        pass
+    finally:
+        if receive:
+            receive.cancel()
+        if buffered:
+            # The client is gone, but what it already sent still gets stored
+            try:
+                await _flush_stream(buffers)
+            except _StreamFlushError:
+                logger.exception("Storing streamed readings for %s after disconnect failed", user_email)
+
 # === BIOFEEDBACK ===
 @router.post("/biofeedback", response_model=BiofeedbackOut)
-def create_biofeedback(data: BiofeedbackCreate, db: Session = Depends(get_db), user: User = Depends(get_current_user)):
-    return crud.create_biofeedback(db, data)
+async def create_biofeedback(data: BiofeedbackCreate, db: AsyncSession = Depends(get_async_db), user: User = Depends(get_current_user)):
+    return await db.run_sync(crud.create_biofeedback, data)
+
+@router.post("/biofeedback/bulk", response_model=HealthMonitoringBulkOut, summary="Ingest a batch of Biofeedback readings")
+async def create_biofeedback_bulk(data: BiofeedbackBulkCreate, db: AsyncSession = Depends(get_async_db), user: User = Depends(get_current_user)):
+    items = await db.run_sync(crud.create_biofeedbacks_bulk, data.readings)
+    return {"inserted": len(items), "items": items}
+
+@router.get(
+    "/biofeedback/series",
+    response_model=HealthMonitoringSeriesOut,
+    summary="Downsampled Biofeedback history for this user",
+)
+async def biofeedback_series(
+    window: dict = Depends(series_window),
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_user),
+):
+    points = await db.run_sync(crud.get_biofeedback_series, current_user.email, window["start"], window["end"], window["bucket_seconds"])
+    return series_response(window, points)
 
 @router.get("/biofeedback/{id}", response_model=BiofeedbackOut)
-def get_biofeedback(id: UUID, db: Session = Depends(get_db), user: User = Depends(get_current_user)):
-    obj = crud.get_biofeedback(db, id)
+async def get_biofeedback(id: UUID, db: AsyncSession = Depends(get_async_db), user: User = Depends(get_current_user)):
+    obj = await db.run_sync(crud.get_biofeedback, id)
     if not obj:
         raise HTTPException(status_code=404, detail="Biofeedback not found")
     return obj
@@ -34,24 +228,30 @@ def get_biofeedback(id: UUID, db: Session = Depends(get_db), user: User = Depend
     response_model=List[schemas.BiofeedbackOut],
     summary="List Biofeedback entries for this user",
 )
-def list_biofeedback(
-    db: Session = Depends(get_db),
+async def list_biofeedbacks(
+    request: Request,
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    db: AsyncSession = Depends(get_async_db),
     current_user=Depends(get_current_user),
 ):
-    return (
-        db.query(models.Biofeedback)
-        .filter(models.Biofeedback.user_email == current_user.email)
-        .order_by(models.Biofeedback.created_at.desc())
-        .all()
-    )
+    items = await db.run_sync(crud.get_biofeedbacks_by_user_email, current_user.email, limit=limit, cursor=cursor)
+    # Validators come from the page itself: the query is an index seek, serializing is what a 304 saves
+    validators = rows_validators(items, current_user.email, cursor, limit)
+    if is_not_modified(request, validators):
+        return not_modified(validators)
+    set_next_cursor(response, items, limit)
+    validators.apply(response)
+    return rows_response(items, BiofeedbackOut, response)
 
 @router.put("/biofeedback/{id}", response_model=BiofeedbackOut)
-def update_biofeedback(id: UUID, update: BiofeedbackUpdate, db: Session = Depends(get_db), user: User = Depends(get_current_user)):
-    return crud.update_biofeedback(db, id, update)
+async def update_biofeedback(id: UUID, update: BiofeedbackUpdate, db: AsyncSession = Depends(get_async_db), user: User = Depends(get_current_user)):
+    return await db.run_sync(crud.update_biofeedback, id, update)
 
 @router.delete("/biofeedback/{id}")
-def delete_biofeedback(id: UUID, db: Session = Depends(get_db), user: User = Depends(get_current_user)):
-    success = crud.delete_biofeedback(db, id)
+async def delete_biofeedback(id: UUID, db: AsyncSession = Depends(get_async_db), user: User = Depends(get_current_user)):
+    success = await db.run_sync(crud.delete_biofeedback, id)
     if not success:
         raise HTTPException(status_code=404, detail="Biofeedback not found")
     return {"detail": "Biofeedback deleted successfully"}
@@ -59,12 +259,30 @@ def delete_biofeedback(id: UUID, db: Session = Depends(get_db), user: User = Dep
 
 # === BURN PROGRESS ===
 @router.post("/burn-progress", response_model=BurnProgressOut)
-def create_burn_progress(data: BurnProgressCreate, db: Session = Depends(get_db), user: User = Depends(get_current_user)):
-    return crud.create_burn_progress(db, data)
+async def create_burn_progress(data: BurnProgressCreate, db: AsyncSession = Depends(get_async_db), user: User = Depends(get_current_user)):
+    return await db.run_sync(crud.create_burn_progress, data)
+
+@router.post("/burn-progress/bulk", response_model=HealthMonitoringBulkOut, summary="Ingest a batch of Burn Progress readings")
+async def create_burn_progress_bulk(data: BurnProgressBulkCreate, db: AsyncSession = Depends(get_async_db), user: User = Depends(get_current_user)):
+    items = await db.run_sync(crud.create_burn_progresses_bulk, data.readings)
+    return {"inserted": len(items), "items": items}
+
+@router.get(
+    "/burn-progress/series",
+    response_model=HealthMonitoringSeriesOut,
+    summary="Downsampled Burn Progress history for this user",
+)
+async def burn_progress_series(
+    window: dict = Depends(series_window),
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_user),
+):
+    points = await db.run_sync(crud.get_burn_progress_series, current_user.email, window["start"], window["end"], window["bucket_seconds"])
+    return series_response(window, points)
 
 @router.get("/burn-progress/{id}", response_model=BurnProgressOut)
-def get_burn_progress(id: UUID, db: Session = Depends(get_db), user: User = Depends(get_current_user)):
-    obj = crud.get_burn_progress(db, id)
+async def get_burn_progress(id: UUID, db: AsyncSession = Depends(get_async_db), user: User = Depends(get_current_user)):
+    obj = await db.run_sync(crud.get_burn_progress, id)
     if not obj:
         raise HTTPException(status_code=404, detail="BurnProgress not found")
     return obj
@@ -74,24 +292,29 @@ def get_burn_progress(id: UUID, db: Session = Depends(get_db), user: User = Depe
     response_model=List[schemas.BurnProgressOut],
     summary="List Burn Progress entries for this user",
 )
-def list_burn_progress(
-    db: Session = Depends(get_db),
+async def list_burn_progresses(
+    request: Request,
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    db: AsyncSession = Depends(get_async_db),
     current_user=Depends(get_current_user),
 ):
-    return (
-        db.query(models.BurnProgress)
-        .filter(models.BurnProgress.user_email == current_user.email)
-        .order_by(models.BurnProgress.created_at.desc())
-        .all()
-    )
+    items = await db.run_sync(crud.get_burn_progresses_by_user_email, current_user.email, limit=limit, cursor=cursor)
+    validators = rows_validators(items, current_user.email, cursor, limit)
+    if is_not_modified(request, validators):
+        return not_modified(validators)
+    set_next_cursor(response, items, limit)
+    validators.apply(response)
+    return rows_response(items, BurnProgressOut, response)
 
 @router.put("/burn-progress/{id}", response_model=BurnProgressOut)
-def update_burn_progress(id: UUID, update: BurnProgressUpdate, db: Session = Depends(get_db), user: User = Depends(get_current_user)):
-    return crud.update_burn_progress(db, id, update)
+async def update_burn_progress(id: UUID, update: BurnProgressUpdate, db: AsyncSession = Depends(get_async_db), user: User = Depends(get_current_user)):
+    return await db.run_sync(crud.update_burn_progress, id, update)
 
 @router.delete("/burn-progress/{id}")
-def delete_burn_progress(id: UUID, db: Session = Depends(get_db), user: User = Depends(get_current_user)):
-    success = crud.delete_burn_progress(db, id)
+async def delete_burn_progress(id: UUID, db: AsyncSession = Depends(get_async_db), user: User = Depends(get_current_user)):
+    success = await db.run_sync(crud.delete_burn_progress, id)
     if not success:
         raise HTTPException(status_code=404, detail="BurnProgress not found")
     return {"detail": "BurnProgress deleted successfully"}
@@ -99,12 +322,30 @@ def delete_burn_progress(id: UUID, db: Session = Depends(get_db), user: User = D
 
 # === BRAIN MONITORING ===
 @router.post("/brain-monitoring", response_model=BrainMonitoringOut)
-def create_brain_monitoring(data: BrainMonitoringCreate, db: Session = Depends(get_db), user: User = Depends(get_current_user)):
-    return crud.create_brain_monitoring(db, data)
+async def create_brain_monitoring(data: BrainMonitoringCreate, db: AsyncSession = Depends(get_async_db), user: User = Depends(get_current_user)):
+    return await db.run_sync(crud.create_brain_monitoring, data)
+
+@router.post("/brain-monitoring/bulk", response_model=HealthMonitoringBulkOut, summary="Ingest a batch of Brain Monitoring readings")
+async def create_brain_monitoring_bulk(data: BrainMonitoringBulkCreate, db: AsyncSession = Depends(get_async_db), user: User = Depends(get_current_user)):
+    items = await db.run_sync(crud.create_brain_monitorings_bulk, data.readings)
+    return {"inserted": len(items), "items": items}
+
+@router.get(
+    "/brain-monitoring/series",
+    response_model=HealthMonitoringSeriesOut,
+    summary="Downsampled Brain Monitoring history for this user",
+)
+async def brain_monitoring_series(
+    window: dict = Depends(series_window),
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_user),
+):
+    points = await db.run_sync(crud.get_brain_monitoring_series, current_user.email, window["start"], window["end"], window["bucket_seconds"])
+    return series_response(window, points)
 
 @router.get("/brain-monitoring/{id}", response_model=BrainMonitoringOut)
-def get_brain_monitoring(id: UUID, db: Session = Depends(get_db), user: User = Depends(get_current_user)):
-    obj = crud.get_brain_monitoring(db, id)
+async def get_brain_monitoring(id: UUID, db: AsyncSession = Depends(get_async_db), user: User = Depends(get_current_user)):
+    obj = await db.run_sync(crud.get_brain_monitoring, id)
     if not obj:
         raise HTTPException(status_code=404, detail="BrainMonitoring not found")
     return obj
@@ -114,24 +355,29 @@ def get_brain_monitoring(id: UUID, db: Session = Depends(get_db), user: User = D
     response_model=List[schemas.BrainMonitoringOut],
     summary="List Brain monitoring entries for this user",
 )
-def list_burn_progress(
-    db: Session = Depends(get_db),
+async def list_brain_monitorings(
+    request: Request,
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    db: AsyncSession = Depends(get_async_db),
     current_user=Depends(get_current_user),
 ):
-    return (
-        db.query(models.BrainMonitoring)
-        .filter(models.BrainMonitoring.user_email == current_user.email)
-        .order_by(models.BrainMonitoring.created_at.desc())
-        .all()
-    )
+    items = await db.run_sync(crud.get_brain_monitorings_by_user_email, current_user.email, limit=limit, cursor=cursor)
+    validators = rows_validators(items, current_user.email, cursor, limit)
+    if is_not_modified(request, validators):
+        return not_modified(validators)
+    set_next_cursor(response, items, limit)
+    validators.apply(response)
+    return rows_response(items, BrainMonitoringOut, response)
 
 @router.put("/brain-monitoring/{id}", response_model=BrainMonitoringOut)
-def update_brain_monitoring(id: UUID, update: BrainMonitoringUpdate, db: Session = Depends(get_db), user: User = Depends(get_current_user)):
-    return crud.update_brain_monitoring(db, id, update)
+async def update_brain_monitoring(id: UUID, update: BrainMonitoringUpdate, db: AsyncSession = Depends(get_async_db), user: User = Depends(get_current_user)):
+    return await db.run_sync(crud.update_brain_monitoring, id, update)
 
 @router.delete("/brain-monitoring/{id}")
-def delete_brain_monitoring(id: UUID, db: Session = Depends(get_db), user: User = Depends(get_current_user)):
-    success = crud.delete_brain_monitoring(db, id)
+async def delete_brain_monitoring(id: UUID, db: AsyncSession = Depends(get_async_db), user: User = Depends(get_current_user)):
+    success = await db.run_sync(crud.delete_brain_monitoring, id)
     if not success:
         raise HTTPException(status_code=404, detail="BrainMonitoring not found")
     return {"detail": "BrainMonitoring deleted successfully"}
@@ -139,12 +385,30 @@ def delete_brain_monitoring(id: UUID, db: Session = Depends(get_db), user: User
 
 # === HEART-BRAIN SYNCHRONICITY ===
 @router.post("/heart-brain-synchronicity", response_model=HeartBrainSynchronicityOut)
-def create_heart_brain(data: HeartBrainSynchronicityCreate, db: Session = Depends(get_db), user: User = Depends(get_current_user)):
-    return crud.create_heart_brain_synchronicity(db, data)
+async def create_heart_brain(data: HeartBrainSynchronicityCreate, db: AsyncSession = Depends(get_async_db), user: User = Depends(get_current_user)):
+    return await db.run_sync(crud.create_heart_brain_synchronicity, data)
+
+@router.post("/heart-brain-synchronicity/bulk", response_model=HealthMonitoringBulkOut, summary="Ingest a batch of Heart Brain Synchronicity readings")
+async def create_heart_brain_bulk(data: HeartBrainSynchronicityBulkCreate, db: AsyncSession = Depends(get_async_db), user: User = Depends(get_current_user)):
+    items = await db.run_sync(crud.create_heart_brain_synchronicities_bulk, data.readings)
+    return {"inserted": len(items), "items": items}
+
+@router.get(
+    "/heart-brain-synchronicity/series",
+    response_model=HealthMonitoringSeriesOut,
+    summary="Downsampled Heart Brain Synchronicity history for this user",
+)
+async def heart_brain_series(
+    window: dict = Depends(series_window),
+    db: AsyncSession = Depends(get_async_db),
+    current_user=Depends(get_current_user),
+):
+    points = await db.run_sync(crud.get_heart_brain_synchronicity_series, current_user.email, window["start"], window["end"], window["bucket_seconds"])
+    return series_response(window, points)
 
 @router.get("/heart-brain-synchronicity/{id}", response_model=HeartBrainSynchronicityOut)
-def get_heart_brain(id: UUID, db: Session = Depends(get_db), user: User = Depends(get_current_user)):
-    obj = crud.get_heart_brain_synchronicity(db, id)
+async def get_heart_brain(id: UUID, db: AsyncSession = Depends(get_async_db), user: User = Depends(get_current_user)):
+    obj = await db.run_sync(crud.get_heart_brain_synchronicity, id)
     if not obj:
         raise HTTPException(status_code=404, detail="HeartBrainSynchronicity not found")
     return obj
@@ -154,24 +418,29 @@ def get_heart_brain(id: UUID, db: Session = Depends(get_db), user: User = Depend
     response_model=List[schemas.HeartBrainSynchronicityOut],
     summary="List Heart Brain synchronicities entries for this user",
 )
-def list_burn_progress(
-    db: Session = Depends(get_db),
+async def list_heart_brain_synchronicities(
+    request: Request,
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    db: AsyncSession = Depends(get_async_db),
     current_user=Depends(get_current_user),
 ):
-    return (
-        db.query(models.HeartBrainSynchronicity)
-        .filter(models.HeartBrainSynchronicity.user_email == current_user.email)
-        .order_by(models.HeartBrainSynchronicity.created_at.desc())
-        .all()
-    )
+    items = await db.run_sync(crud.get_heart_brain_synchronicities_by_user_email, current_user.email, limit=limit, cursor=cursor)
+    validators = rows_validators(items, current_user.email, cursor, limit)
+    if is_not_modified(request, validators):
+        return not_modified(validators)
+    set_next_cursor(response, items, limit)
+    validators.apply(response)
+    return rows_response(items, HeartBrainSynchronicityOut, response)
 
 @router.put("/heart-brain-synchronicity/{id}", response_model=HeartBrainSynchronicityOut)
-def update_heart_brain(id: UUID, update: HeartBrainSynchronicityUpdate, db: Session = Depends(get_db), user: User = Depends(get_current_user)):
-    return crud.update_heart_brain_synchronicity(db, id, update)
+async def update_heart_brain(id: UUID, update: HeartBrainSynchronicityUpdate, db: AsyncSession = Depends(get_async_db), user: User = Depends(get_current_user)):
+    return await db.run_sync(crud.update_heart_brain_synchronicity, id, update)
 
 @router.delete("/heart-brain-synchronicity/{id}")
-def delete_heart_brain(id: UUID, db: Session = Depends(get_db), user: User = Depends(get_current_user)):
-    success = crud.delete_heart_brain_synchronicity(db, id)
+async def delete_heart_brain(id: UUID, db: AsyncSession = Depends(get_async_db), user: User = Depends(get_current_user)):
+    success = await db.run_sync(crud.delete_heart_brain_synchronicity, id)
     if not success:
         raise HTTPException(status_code=404, detail="HeartBrainSynchronicity not found")
     return {"detail": "HeartBrainSynchronicity deleted successfully"}
@@ -0,0 +1,16 @@
+from typing import Optional
+
+from fastapi import APIRouter, Query, Request
+
+from app.services.media import serve_upload
+
+router = APIRouter(tags=["media"])
+
+
+@router.api_route("/uploads/{filename}", methods=["GET", "HEAD"], summary="Serve an uploaded image")
+async def get_upload(
+    request: Request,
+    filename: str,
+    w: Optional[int] = Query(None, ge=1, le=4096, description="Smallest acceptable width; the nearest generated variant is served"),
+):
+    return serve_upload(request, filename, w)
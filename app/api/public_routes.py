@@ -1,7 +1,12 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request, Response
+from pydantic import BaseModel, TypeAdapter
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import Callable, List, Optional
 
+from app.core.cache import (
+    PUBLIC_ABOUT, PUBLIC_ADMIN_HUB, PUBLIC_CONTACT, PUBLIC_LANDING, PUBLIC_LIVE_SESSION, PUBLIC_NEWS, public_cache,
+)
+from app.core.conditional import PUBLIC_REVALIDATE, is_not_modified, not_modified, rows_validators
 from app.db.base import get_db
 from app.schemas.news import NewsOut
 from app.schemas.live_session import LiveSessionOut
@@ -21,53 +26,114 @@ router = APIRouter(
     tags=["public"]
 )
 
+LATEST_NEWS_LIMIT = 2
+
+news_list_adapter = TypeAdapter(List[NewsOut])
+live_session_adapter = TypeAdapter(Optional[LiveSessionOut])
+contact_adapter = TypeAdapter(Optional[ContactOut])
+about_adapter = TypeAdapter(Optional[AboutOut])
+admin_hub_list_adapter = TypeAdapter(List[AdminHubOut])
+
+
+# Everything the landing page renders, in one document
+class LandingOut(BaseModel):
+    latest_news: List[NewsOut]
+    live_session: Optional[LiveSessionOut] = None
+    contact: Optional[ContactOut] = None
+    about: Optional[AboutOut] = None
+    hub_categories: List[AdminHubOut]
+
+
+landing_adapter = TypeAdapter(LandingOut)
+
+
+def _loaded_rows(loaded) -> list:
+    if isinstance(loaded, dict):
+        return [row for value in loaded.values() for row in _loaded_rows(value)]
+    return loaded if isinstance(loaded, list) else [loaded]
+
+
+def cached_json(request: Request, section: str, adapter: TypeAdapter, load: Callable[[], object]) -> Response:
+    """
+    Serve ``section`` from ``public_cache`` as ready-made JSON, running
+    ``load`` and serializing through ``adapter`` only on a miss. Validators
+    come from the loaded rows' timestamps and are cached with the body, so a
+    revalidating client gets 304 without touching the database.
+    """
+    entry = public_cache.get(section)
+    if entry is None:
+        loaded = load()
+        body = adapter.dump_json(adapter.validate_python(loaded, from_attributes=True))
+        entry = (body, rows_validators(_loaded_rows(loaded), section))
+        public_cache.set(section, entry)
+    body, validators = entry
+    if is_not_modified(request, validators):
+        return not_modified(validators, PUBLIC_REVALIDATE)
+    return Response(content=body, media_type="application/json", headers=validators.headers(PUBLIC_REVALIDATE))
+
+
+@router.get("/landing", response_model=LandingOut, summary="Get everything the landing page renders")
+def get_landing_public(request: Request, db: Session = Depends(get_db)):
+    """
+    Latest news, live session, contact, about and hub categories in one
+    response, read in a single session and cached as one snapshot that any
+    admin change to those sections invalidates.
+    """
+    return cached_json(request, PUBLIC_LANDING, landing_adapter, lambda: {
+        "latest_news": get_latest_news(db, limit=LATEST_NEWS_LIMIT),
+        "live_session": get_latest_live_session(db),
+        "contact": get_latest_contact(db),
+        "about": get_latest_about(db),
+        "hub_categories": get_all_admin_hubs(db),
+    })
+
 @router.get("/latest-news", response_model=List[NewsOut], summary="Get latest 2 news items for landing page")
-def get_latest_news_public(db: Session = Depends(get_db)):
+def get_latest_news_public(request: Request, db: Session = Depends(get_db)):
     """
     Get the latest 2 news items without authentication.
     This endpoint is designed for use on the landing page.
     """
-    return get_latest_news(db, limit=2)
+    return cached_json(request, PUBLIC_NEWS, news_list_adapter, lambda: get_latest_news(db, limit=LATEST_NEWS_LIMIT))
 
 @router.get("/latest-live-session", response_model=Optional[LiveSessionOut], summary="Get latest live session for landing page")
-def get_latest_live_session_public(db: Session = Depends(get_db)):
+def get_latest_live_session_public(request: Request, db: Session = Depends(get_db)):
     """
     Get the latest live session without authentication.
     This endpoint is designed for use on the landing page.
     """
-    return get_latest_live_session(db)
+    return cached_json(request, PUBLIC_LIVE_SESSION, live_session_adapter, lambda: get_latest_live_session(db))
 
 @router.get("/contact", response_model=Optional[ContactOut], summary="Get contact information")
-def get_contact_info_public(db: Session = Depends(get_db)):
+def get_contact_info_public(request: Request, db: Session = Depends(get_db)):
     """
     Get contact information without authentication.
     This endpoint is designed for use on the landing page.
     """
-    return get_latest_contact(db)
+    return cached_json(request, PUBLIC_CONTACT, contact_adapter, lambda: get_latest_contact(db))
 
 @router.get("/about", response_model=Optional[AboutOut], summary="Get about us information")
-def get_about_info_public(db: Session = Depends(get_db)):
+def get_about_info_public(request: Request, db: Session = Depends(get_db)):
     """
     Get about us information without authentication.
     This endpoint is designed for use on the landing page.
     """
-    return get_latest_about(db)
+    return cached_json(request, PUBLIC_ABOUT, about_adapter, lambda: get_latest_about(db))
 
 @router.get("/hub-categories", response_model=List[AdminHubOut], summary="Get hub categories for public use")
-def get_hub_categories_public(db: Session = Depends(get_db)):
+def get_hub_categories_public(request: Request, db: Session = Depends(get_db)):
     """
     Get hub categories without authentication.
     This endpoint is designed for use in the contact form dropdown.
     """
-    return get_all_admin_hubs(db)
+    return cached_json(request, PUBLIC_ADMIN_HUB, admin_hub_list_adapter, lambda: get_all_admin_hubs(db))
 
 @router.get("/admin-hub/categories", response_model=List[AdminHubOut], summary="Get admin hub categories for public use")
-def get_admin_hub_categories_public(db: Session = Depends(get_db)):
+def get_admin_hub_categories_public(request: Request, db: Session = Depends(get_db)):
     """
     Get admin hub categories without authentication.
     This endpoint is designed for use in the hub pages.
     """
-    return get_all_admin_hubs(db)
+    return cached_json(request, PUBLIC_ADMIN_HUB, admin_hub_list_adapter, lambda: get_all_admin_hubs(db))
 
 @router.get("/user-hub/category/{category}", response_model=List[UserHubOut], summary="Get user submissions by category")
 def get_user_hub_by_category_public(category: str, db: Session = Depends(get_db)):
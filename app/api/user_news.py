@@ -1,11 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 
 from app.db.base import get_db
 from app.schemas.news import NewsOut
 from app.crud.news import get_all_news, get_news
+from app.core.pagination import MAX_PAGE_SIZE, set_next_cursor
 from app.core.security import require_role
 
 router = APIRouter(
@@ -15,8 +16,15 @@ router = APIRouter(
 )
 
 @router.get("/", response_model=List[NewsOut], summary="User: List all news")
-def user_list_news(db: Session = Depends(get_db)):
-    return get_all_news(db)
+def user_list_news(
+    response: Response,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    db: Session = Depends(get_db),
+):
+    news = get_all_news(db, limit=limit, cursor=cursor)
+    set_next_cursor(response, news, limit, sort_attr="publish_date")
+    return news
 
 @router.get("/{news_id}", response_model=NewsOut, summary="User: Get a specific news entry")
 def user_get_news(news_id: UUID, db: Session = Depends(get_db)):
@@ -1,14 +1,18 @@
 from app.core.security import get_current_user
 from app.db.base import get_db
 from app.models import User
-from app.schemas.user import UserOut, UserUpdate
-from fastapi import APIRouter, Depends, HTTPException, status
+from app.schemas.user import UserDeletionJobOut, UserOut, UserUpdate
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from app.core.security import require_role, get_current_user
 from app.models.user import UserRole
 from sqlalchemy.orm import Session
 from uuid import UUID
+from typing import Optional
+from app.core.serialization import rows_response
+from app.core.pagination import MAX_PAGE_SIZE, set_next_cursor
 from app.crud.user import (
-    get_user_by_id, list_users, update_user, delete_user_and_related
+    get_user_by_email, get_user_by_id, list_users, update_user, request_user_deletion, get_user_deletion_job,
+    UserDeletionInProgress,
 )
 from app.schemas.live_session import LiveSessionOut
 from app.crud.live_session import get_all_live_sessions, get_live_session
@@ -19,23 +23,28 @@ router = APIRouter(tags=["users"])
 
 
 @router.get("/me", response_model=UserOut)
-def read_users_me(current_user: User = Depends(get_current_user)):
-    return current_user
+def read_users_me(current_user: User = Depends(get_current_user), db: Session = Depends(get_db)):
+    # get_current_user only carries the cached authorization fields
+    return get_user_by_email(db, current_user.email)
 
 
 # Place these BEFORE any "/{user_id}" or similar catch-all routes
 
 @router.get("/live-sessions", response_model=list[LiveSessionOut])
 async def list_live_sessions(
+    response: Response,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
     skip: int = Query(0, ge=0),
-    limit: int = Query(100, ge=1, le=1000)
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
 ):
     """
     List live sessions for general users.
     """
-    return get_all_live_sessions(db, skip=skip, limit=limit)
+    sessions = get_all_live_sessions(db, skip=skip, limit=limit, cursor=cursor)
+    set_next_cursor(response, sessions, limit, sort_attr="date_time")
+    return sessions
 
 @router.get("/live-sessions/{live_session_id}", response_model=LiveSessionOut)
 async def get_live_session_detail(
@@ -56,8 +65,16 @@ async def get_live_session_detail(
 admin_dep = Depends(require_role([UserRole.admin]))
 
 @router.get("", response_model=list[UserOut], dependencies=[admin_dep])
-def admin_list_users(db: Session = Depends(get_db), skip: int = 0, limit: int = 100):
-    return list_users(db, skip, limit)
+def admin_list_users(
+    response: Response,
+    db: Session = Depends(get_db),
+    skip: int = 0,
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+):
+    users = list_users(db, skip, limit, cursor)
+    set_next_cursor(response, users, limit)
+    return rows_response(users, UserOut, response)
 
 @router.get("/{user_id}", response_model=UserOut, dependencies=[admin_dep])
 def admin_get_user(user_id: UUID, db: Session = Depends(get_db)):
@@ -80,14 +97,33 @@ def admin_update_user(
         data["user_status"] = data.pop("status")
 
     data["updated_by"] = admin.email
-    updated = update_user(db, user_id, data)
+    try:
+        updated = update_user(db, user_id, data)
+    except UserDeletionInProgress:
+        raise HTTPException(status_code=409, detail="User deletion in progress; status and email cannot be changed")
     if not updated:
         raise HTTPException(status_code=404, detail="User not found")
     return updated
 
-@router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT, dependencies=[admin_dep])
-def admin_delete_user(user_id: UUID, db: Session = Depends(get_db)):
-    success = delete_user_and_related(db, user_id)
-    if not success:
+@router.delete(
+    "/{user_id}",
+    response_model=UserDeletionJobOut,
+    status_code=status.HTTP_202_ACCEPTED,
+    dependencies=[admin_dep],
+)
+def admin_delete_user(user_id: UUID, db: Session = Depends(get_db), admin=Depends(get_current_user)):
+    """
+    Deactivate the user at once and queue the deletion of their account and
+    data, which runs in the background; poll the returned job for progress.
+    """
+    job = request_user_deletion(db, user_id, requested_by=admin.email)
+    if not job:
         raise HTTPException(status_code=404, detail="User not found")
-    return
\ No newline at end of file
+    return job
+
+@router.get("/deletion-jobs/{job_id}", response_model=UserDeletionJobOut, dependencies=[admin_dep])
+def admin_get_user_deletion_job(job_id: UUID, db: Session = Depends(get_db)):
+    job = get_user_deletion_job(db, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Deletion job not found")
+    return job
@@ -1,9 +1,10 @@
 # app/api/user_user_hub.py
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
 from uuid import UUID
-from typing import List
+from typing import List, Optional
 
+from app.core.pagination import MAX_PAGE_SIZE, set_next_cursor
 from app.core.security import get_current_user
 from app.db.base import get_db
 from app.schemas.user_hub import UserHubCreate, UserHubUpdate, UserHubOut
@@ -33,24 +34,32 @@ def create_user_hub_entry(
 
 @router.get("/", response_model=List[UserHubOut])
 def list_active_user_hubs(
+    response: Response,
     skip: int = 0, 
-    limit: int = 100, 
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE), 
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db),
     current_user = Depends(get_current_user)
 ):
     """Get all active user hub entries (status=True only)"""
-    return get_all_user_hubs(db, skip=skip, limit=limit, status_filter=True)
+    hubs = get_all_user_hubs(db, skip=skip, limit=limit, status_filter=True, cursor=cursor)
+    set_next_cursor(response, hubs, limit)
+    return hubs
 
 @router.get("/category/{category}", response_model=List[UserHubOut])
 def get_user_hubs_by_category_public(
     category: str, 
+    response: Response,
     skip: int = 0, 
-    limit: int = 100,
+    limit: int = Query(100, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db),
     current_user = Depends(get_current_user)
 ):
     """Get active user hub entries by category"""
-    return get_user_hubs_by_category(db, category, skip=skip, limit=limit)
+    hubs = get_user_hubs_by_category(db, category, skip=skip, limit=limit, cursor=cursor)
+    set_next_cursor(response, hubs, limit)
+    return hubs
 
 @router.get("/{hub_id}", response_model=UserHubOut)
 def get_user_hub_entry(
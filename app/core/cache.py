@@ -0,0 +1,74 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+from app.core.config import settings
+
+
+class TTLCache:
+    """Thread-safe in-process cache bounded by entry age and entry count.
+
+    Entries expire ``ttl`` seconds after they were stored; once ``maxsize``
+    entries are held the least recently used one is evicted. ``get`` returns
+    None for a missing or expired key, so None itself is never cached.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        if self.maxsize <= 0 or self.ttl <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Authorization fields of authenticated users, keyed by email (see get_current_user)
+user_cache = TTLCache(settings.USER_CACHE_MAX_SIZE, settings.USER_CACHE_TTL_SECONDS)
+
+# Serialized JSON bodies (with their validators) of the anonymous /public endpoints, keyed by section.
+# Admin writes invalidate their section; the TTL bounds staleness on other workers.
+PUBLIC_NEWS = "news"
+PUBLIC_LIVE_SESSION = "live_session"
+PUBLIC_CONTACT = "contact"
+PUBLIC_ABOUT = "about"
+PUBLIC_ADMIN_HUB = "admin_hub"
+# Snapshot of all the above for /public/landing, dropped whenever any section changes
+PUBLIC_LANDING = "landing"
+
+public_cache = TTLCache(settings.PUBLIC_CACHE_MAX_SIZE, settings.PUBLIC_CACHE_TTL_SECONDS)
+
+
+def invalidate_public(section: str) -> None:
+    public_cache.invalidate(section)
+    public_cache.invalidate(PUBLIC_LANDING)
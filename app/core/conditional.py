@@ -0,0 +1,83 @@
+import hashlib
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Iterable, Optional
+
+from fastapi import Request, Response
+
+# Authenticated JSON: the browser may keep it but must revalidate, shared caches must not
+PRIVATE_REVALIDATE = "private, no-cache"
+PUBLIC_REVALIDATE = "public, no-cache"
+
+
+@dataclass(frozen=True)
+class Validators:
+    """ETag and Last-Modified of one representation of a resource"""
+    etag: str
+    last_modified: Optional[datetime] = None
+
+    def headers(self, cache_control: str = PRIVATE_REVALIDATE) -> dict:
+        headers = {"ETag": self.etag, "Cache-Control": cache_control}
+        if self.last_modified is not None:
+            headers["Last-Modified"] = format_datetime(_as_utc(self.last_modified), usegmt=True)
+        return headers
+
+    def apply(self, response: Response, cache_control: str = PRIVATE_REVALIDATE) -> None:
+        response.headers.update(self.headers(cache_control))
+
+
+def _as_utc(value: datetime) -> datetime:
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value.astimezone(timezone.utc)
+
+
+def validators_for(last_modified: Optional[datetime], *parts) -> Validators:
+    """
+    Build validators from a version timestamp plus whatever else identifies
+    the representation (user, page cursor, row count...). The ETag is weak:
+    the same JSON may be sent with different content encodings.
+    """
+    base = "|".join(str(part) for part in (last_modified.isoformat() if last_modified else None, *parts))
+    return Validators(f'W/"{hashlib.md5(base.encode(), usedforsecurity=False).hexdigest()}"', last_modified)
+
+
+def row_timestamp(row) -> Optional[datetime]:
+    """When a row last changed: ``updated_at`` is only set by updates, so fall back to ``created_at``"""
+    return getattr(row, "updated_at", None) or getattr(row, "created_at", None)
+
+
+def rows_validators(rows: Iterable, *parts) -> Validators:
+    """Validators for a response built from already loaded ``rows``"""
+    rows = [row for row in rows if row is not None]
+    stamps = [stamp for stamp in map(row_timestamp, rows) if stamp is not None]
+    return validators_for(max(stamps, default=None), *parts, *(row.id for row in rows))
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    # If-None-Match uses weak comparison
+    opaque = etag.removeprefix("W/")
+    return opaque in (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+
+
+def is_not_modified(request: Request, validators: Validators) -> bool:
+    """Evaluate If-None-Match, or If-Modified-Since when no ETag was sent (RFC 9110 13.2.2)"""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return etag_matches(if_none_match, validators.etag)
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and validators.last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            return False
+        # HTTP dates have whole-second precision
+        return _as_utc(validators.last_modified).replace(microsecond=0) <= since
+    return False
+
+
+def not_modified(validators: Validators, cache_control: str = PRIVATE_REVALIDATE) -> Response:
+    return Response(status_code=304, headers=validators.headers(cache_control))
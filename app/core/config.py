@@ -7,6 +7,16 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 15
     REFRESH_TOKEN_EXPIRE_MINUTES: int = 1440
+
+    # Database engine and connection pool (applied to the sync and async engines alike)
+    DB_ECHO: bool = False
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_PRE_PING: bool = True
+    DB_POOL_RECYCLE: int = 1800
+    # Server-side statement_timeout in milliseconds; 0 disables it
+    DB_STATEMENT_TIMEOUT_MS: int = 0
     
     # Email settings
     SMTP_SERVER: str = "smtp.gmail.com"
@@ -14,7 +24,63 @@ class Settings(BaseSettings):
     EMAIL_SENDER: str
     EMAIL_PASSWORD: str
     ADMIN_EMAIL: str
-    
+    # Turn both off to deliver through a plain local SMTP server, e.g.
+    # `python -m aiosmtpd -n -l localhost:1025` with SMTP_SERVER=localhost SMTP_PORT=1025
+    SMTP_STARTTLS: bool = True
+    SMTP_LOGIN: bool = True
+    SMTP_TIMEOUT_SECONDS: int = 30
+
+    # Processes generating resized/WebP variants of uploaded images
+    IMAGE_PROCESS_WORKERS: int = 2
+
+    # Orphaned uploads are swept this often, once untouched for the grace period
+    UPLOAD_SWEEP_INTERVAL_SECONDS: int = 6 * 3600
+    UPLOAD_ORPHAN_GRACE_SECONDS: int = 24 * 3600
+
+    # Email outbox delivery worker
+    EMAIL_OUTBOX_POLL_SECONDS: float = 5
+    EMAIL_OUTBOX_BATCH_SIZE: int = 20
+    EMAIL_OUTBOX_MAX_ATTEMPTS: int = 8
+    EMAIL_OUTBOX_BACKOFF_SECONDS: int = 30
+
+    # bcrypt runs on this many dedicated threads; past PASSWORD_HASH_MAX_PENDING
+    # queued calls, login and signup answer 503 right away
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_MAX_PENDING: int = 16
+
+    # User deletions run in the background, one short transaction per chunk of rows.
+    # A failing job backs off and is marked Failed after USER_DELETION_MAX_ATTEMPTS steps in a row.
+    USER_DELETION_CHUNK_SIZE: int = 5000
+    USER_DELETION_POLL_SECONDS: int = 5
+    USER_DELETION_MAX_ATTEMPTS: int = 5
+    USER_DELETION_BACKOFF_SECONDS: int = 60
+
+    # Telemetry retention is opt-in: 0 keeps data forever, and raw readings and
+    # device-control history are kept unless RETENTION_RAW_DAYS / RETENTION_CONTROL_DAYS
+    # are set. Raw biofeedback / brain monitoring / heart-brain readings older than
+    # RETENTION_RAW_DAYS are compacted into per-minute rollups, which are compacted
+    # into per-hour rollups after RETENTION_MINUTE_ROLLUP_DAYS.
+    # Device-control history is only trimmed, always keeping each user's newest row.
+    RETENTION_RAW_DAYS: int = 0
+    RETENTION_MINUTE_ROLLUP_DAYS: int = 365
+    RETENTION_HOUR_ROLLUP_DAYS: int = 0
+    RETENTION_CONTROL_DAYS: int = 0
+    RETENTION_BATCH_SIZE: int = 5000
+    RETENTION_INTERVAL_SECONDS: int = 3600
+
+    # Authenticated-user cache used by get_current_user
+    USER_CACHE_TTL_SECONDS: int = 60
+    USER_CACHE_MAX_SIZE: int = 10000
+
+    # Cached /public responses; admin edits invalidate them immediately
+    PUBLIC_CACHE_TTL_SECONDS: int = 300
+    PUBLIC_CACHE_MAX_SIZE: int = 64
+
+    # Response compression; smaller bodies are not worth the CPU or the header bytes
+    COMPRESSION_MINIMUM_SIZE: int = 1024
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 4
+    COMPRESSION_ZSTD_LEVEL: int = 3
 
     class Config:
         env_file = ".env"
@@ -1,8 +1,13 @@
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+from typing import Optional
+from uuid import UUID
 
+from app.core.cache import user_cache
 from app.core.config import settings
+from app.core.hashing import password_hashing_pool
 from app.crud.user import get_user_by_email
-from app.db.base import get_db
+from app.db.base import get_async_db, get_db
 from app.models import User
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
@@ -10,6 +15,7 @@ from jose import JWTError, jwt
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from passlib.context import CryptContext
 from app.models.user import UserRole, UserStatus
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
@@ -24,6 +30,10 @@ def password_hash(password):
     return pwd_context.hash(password)
 
 
+async def password_hash_async(password: str) -> str:
+    return await password_hashing_pool.run(password_hash, password)
+
+
 def create_jwt_token(data: dict, expiry_minutes: int) -> str:
     to_encode = data.copy()
     expire = datetime.now(timezone.utc) + timedelta(minutes=expiry_minutes)
@@ -48,6 +58,16 @@ def authenticate_user(db: Session, email: str, password: str):
     return user
 
 
+async def authenticate_user_async(db: AsyncSession, email: str, password: str):
+    """``authenticate_user`` for async routes; bcrypt runs on the bounded hashing pool, off the event loop"""
+    user = await db.run_sync(get_user_by_email, email)
+    if not user:
+        return False
+    if not await password_hashing_pool.run(verify_password, password, user.password_hash):
+        return False
+    return user
+
+
 def extract_email_from_token(token: str) -> str:
     try:
         payload = jwt.decode(
@@ -66,42 +86,76 @@ def extract_email_from_token(token: str) -> str:
 db_dependency = Depends(get_db)
 
 
-def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(oauth2_scheme), db: Session = db_dependency):
-    try:
-        token = credentials.credentials
-        email = extract_email_from_token(token)
-        user = get_user_by_email(db, email=email)
-        if not user:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Could not validate credentials",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
-            
-        # Check if user is inactive
-        if user.user_status == UserStatus.inactive:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Account is deactivated"
-            )
-            
-        if user.user_status == UserStatus.pending:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Account is pending activation"
-            )
-            
-        return user
-    except JWTError:
+@dataclass(frozen=True)
+class CurrentUser:
+    """Authorization-relevant fields of a user, as cached by get_current_user.
+    Handlers that need the full row should load it with ``get_user_by_email``."""
+    id: UUID
+    email: str
+    role: UserRole
+    user_status: UserStatus
+    full_name: Optional[str] = None
+
+    @classmethod
+    def from_user(cls, user: User) -> "CurrentUser":
+        return cls(id=user.id, email=user.email, role=user.role, user_status=user.user_status, full_name=user.full_name)
+
+
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
+def check_user_status(user) -> None:
+    # Check if user is inactive
+    if user.user_status == UserStatus.inactive:
         raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Could not validate credentials",
-            headers={"WWW-Authenticate": "Bearer"},
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Account is deactivated"
         )
 
+    if user.user_status == UserStatus.pending:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Account is pending activation"
+        )
+
+
+def get_user_from_token(db: Session, token: str) -> User:
+    """Resolve an access token to an active user, for HTTP and WebSocket callers alike"""
+    email = extract_email_from_token(token)
+    user = get_user_by_email(db, email=email)
+    if not user:
+        raise _credentials_exception()
+    check_user_status(user)
+    return user
+
+
+async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(oauth2_scheme), db: AsyncSession = Depends(get_async_db)) -> CurrentUser:
+    """
+    Authenticate the bearer token. The user's authorization fields are served
+    from ``user_cache`` for up to USER_CACHE_TTL_SECONDS, so most requests do
+    not touch the users table; ``update_user`` and ``request_user_deletion``
+    invalidate the entry so status and role changes apply immediately.
+    Async so that authenticating never takes a threadpool slot.
+    """
+    email = extract_email_from_token(credentials.credentials)
+    current_user = user_cache.get(email)
+    if current_user is None:
+        user = await db.run_sync(get_user_by_email, email)
+        if not user:
+            raise _credentials_exception()
+        current_user = CurrentUser.from_user(user)
+        user_cache.set(email, current_user)
+    check_user_status(current_user)
+    return current_user
+
 
 def require_role(required_roles: list[UserRole]):
-    def role_checker(current_user: User = Depends(get_current_user)):
+    async def role_checker(current_user: CurrentUser = Depends(get_current_user)):
         if current_user.role not in required_roles:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
@@ -0,0 +1,49 @@
+from starlette.datastructures import Headers
+from starlette.exceptions import HTTPException
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class UploadLimitMiddleware:
+    """
+    Bound multipart/form-data request bodies before they are parsed.
+
+    Starlette spools the whole multipart body while building the form, before
+    the endpoint runs, so a size check in the endpoint comes too late. A
+    declared Content-Length over ``max_body_bytes`` is refused without reading
+    the body; otherwise the body is counted as it arrives and parsing is
+    aborted with 413 once it crosses the limit. Other requests pass through.
+    """
+
+    def __init__(self, app: ASGIApp, max_body_bytes: int, detail: str = "Request body too large"):
+        self.app = app
+        self.max_body_bytes = max_body_bytes
+        self.detail = detail
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        headers = Headers(scope=scope)
+        if not headers.get("content-type", "").lower().startswith("multipart/form-data"):
+            await self.app(scope, receive, send)
+            return
+
+        content_length = headers.get("content-length", "")
+        if content_length.isdigit() and int(content_length) > self.max_body_bytes:
+            await JSONResponse({"detail": self.detail}, status_code=413)(scope, receive, send)
+            return
+
+        received = 0
+
+        async def limited_receive() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_body_bytes:
+                    # Raised inside the form parser; the exception handlers turn it into the response
+                    raise HTTPException(status_code=413, detail=self.detail)
+            return message
+
+        await self.app(scope, limited_receive, send)
@@ -1,5 +1,6 @@
 # app/crud/about.py
 from sqlalchemy.orm import Session
+from app.core.cache import PUBLIC_ABOUT, invalidate_public
 from app.models.about import About
 from app.schemas.about import AboutCreate, AboutUpdate
 from uuid import UUID
@@ -9,6 +10,7 @@ def create_about(db: Session, about: AboutCreate) -> About:
     db_about = About(**about.dict())
     db.add(db_about)
     db.commit()
+    invalidate_public(PUBLIC_ABOUT)
     db.refresh(db_about)
     return db_about
 
@@ -25,6 +27,7 @@ def update_about(db: Session, about_id: UUID, about_update: AboutUpdate) -> Opti
         for key, value in about_update.dict(exclude_unset=True).items():
             setattr(db_about, key, value)
         db.commit()
+        invalidate_public(PUBLIC_ABOUT)
         db.refresh(db_about)
     return db_about
 
@@ -33,5 +36,6 @@ def delete_about(db: Session, about_id: UUID) -> bool:
     if db_about:
         db.delete(db_about)
         db.commit()
+        invalidate_public(PUBLIC_ABOUT)
         return True
     return False
@@ -1,22 +1,26 @@
 # app/crud/admin_hub.py
 from sqlalchemy.orm import Session
+from app.core.cache import PUBLIC_ADMIN_HUB, invalidate_public
+from app.core.pagination import paginate
 from app.models.admin_hub import AdminHub
 from app.models.user_hub import UserHub
 from app.schemas.admin_hub import AdminHubCreate, AdminHubUpdate
 from uuid import UUID
+from typing import Optional
 
 def create_admin_hub(db: Session, admin_hub: AdminHubCreate) -> AdminHub:
     db_admin_hub = AdminHub(**admin_hub.dict())
     db.add(db_admin_hub)
     db.commit()
+    invalidate_public(PUBLIC_ADMIN_HUB)
     db.refresh(db_admin_hub)
     return db_admin_hub
 
 def get_admin_hub(db: Session, hub_id: UUID) -> AdminHub:
     return db.query(AdminHub).filter(AdminHub.id == hub_id).first()
 
-def get_all_admin_hubs(db: Session, skip: int = 0, limit: int = 100):
-    return db.query(AdminHub).order_by(AdminHub.created_at.desc()).offset(skip).limit(limit).all()
+def get_all_admin_hubs(db: Session, skip: int = 0, limit: int = 100, cursor: Optional[str] = None):
+    return paginate(db.query(AdminHub), AdminHub.created_at, AdminHub.id, cursor, skip, limit)
 
 def update_admin_hub(db: Session, hub_id: UUID, hub_update: AdminHubUpdate) -> AdminHub:
     db_admin_hub = get_admin_hub(db, hub_id)
@@ -35,6 +39,7 @@ def update_admin_hub(db: Session, hub_id: UUID, hub_update: AdminHubUpdate) -> A
             )
         
         db.commit()
+        invalidate_public(PUBLIC_ADMIN_HUB)
         db.refresh(db_admin_hub)
     return db_admin_hub
 
@@ -52,5 +57,6 @@ def delete_admin_hub(db: Session, hub_id: UUID):
         db.query(UserHub).filter(UserHub.category == category_name).delete()
         
         db.commit()
+        invalidate_public(PUBLIC_ADMIN_HUB)
         return True
     return False
\ No newline at end of file
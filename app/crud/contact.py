@@ -1,5 +1,6 @@
 # app/crud/contact.py
 from sqlalchemy.orm import Session
+from app.core.cache import PUBLIC_CONTACT, invalidate_public
 from app.models.contact import Contact
 from app.schemas.contact import ContactCreate, ContactUpdate
 from uuid import UUID
@@ -9,6 +10,7 @@ def create_contact(db: Session, contact: ContactCreate) -> Contact:
     db_contact = Contact(**contact.dict())
     db.add(db_contact)
     db.commit()
+    invalidate_public(PUBLIC_CONTACT)
     db.refresh(db_contact)
     return db_contact
 
@@ -25,6 +27,7 @@ def update_contact(db: Session, contact_id: UUID, contact_update: ContactUpdate)
         for key, value in contact_update.dict(exclude_unset=True).items():
             setattr(db_contact, key, value)
         db.commit()
+        invalidate_public(PUBLIC_CONTACT)
         db.refresh(db_contact)
     return db_contact
 
@@ -33,5 +36,6 @@ def delete_contact(db: Session, contact_id: UUID) -> bool:
     if db_contact:
         db.delete(db_contact)
         db.commit()
+        invalidate_public(PUBLIC_CONTACT)
         return True
     return False
@@ -1,18 +1,154 @@
+from datetime import datetime
 from uuid import UUID
 from typing import List, Optional
 
+from sqlalchemy import DateTime, case, cast, func, or_, select, tuple_
+from sqlalchemy.dialects.postgresql import JSON, UUID as PG_UUID, insert as pg_insert
 from sqlalchemy.orm import Session
 
-from app.models import Sound, Steam, TempTank, WaterPump, NanoFlicker, LedColor
+from app.core.pagination import paginate
+from app.services.device_events import device_events
+
+from app.models import Sound, Steam, TempTank, WaterPump, NanoFlicker, LedColor, DeviceState
 from app.schemas.device_controls import (
-    SoundCreate, SoundUpdate,
-    SteamCreate, SteamUpdate,
-    TempTankCreate, TempTankUpdate,
-    WaterPumpCreate, WaterPumpUpdate,
-    NanoFlickerCreate, NanoFlickerUpdate,
-    LedColorCreate, LedColorUpdate
+    SoundCreate, SoundUpdate, SoundOut,
+    SteamCreate, SteamUpdate, SteamOut,
+    TempTankCreate, TempTankUpdate, TempTankOut,
+    WaterPumpCreate, WaterPumpUpdate, WaterPumpOut,
+    NanoFlickerCreate, NanoFlickerUpdate, NanoFlickerOut,
+    LedColorCreate, LedColorUpdate, LedColorOut
 )
 
+# Every device control, keyed by the field name used in "latest" payloads
+DEVICE_CONTROL_MODELS = {
+    "sound": Sound,
+    "steam": Steam,
+    "temp_tank": TempTank,
+    "water_pump": WaterPump,
+    "nano_flicker": NanoFlicker,
+    "led_color": LedColor,
+}
+
+DEVICE_CONTROL_SCHEMAS = {
+    "sound": SoundOut,
+    "steam": SteamOut,
+    "temp_tank": TempTankOut,
+    "water_pump": WaterPumpOut,
+    "nano_flicker": NanoFlickerOut,
+    "led_color": LedColorOut,
+}
+
+
+def get_latest_device_controls(db: Session, user_email: str) -> dict:
+    """Fetch the newest row of every device control for a user in a single query.
+
+    Each control becomes one scalar subquery that returns its latest row as
+    JSON (or NULL), so the dashboard poll is one round trip however many
+    device types exist.
+    """
+    columns = []
+    for name, model in DEVICE_CONTROL_MODELS.items():
+        latest = model.__table__.alias(f"latest_{name}")
+        columns.append(
+            select(func.row_to_json(latest.table_valued(), type_=JSON))
+            .where(latest.c.user_email == user_email)
+            .order_by(latest.c.created_at.desc(), latest.c.id.desc())
+            .limit(1)
+            .scalar_subquery()
+            .label(name)
+        )
+    return dict(db.execute(select(*columns)).one()._mapping)
+
+
+def _payload_key(payload):
+    return tuple_(
+        cast(payload["created_at"].astext, DateTime(timezone=True)),
+        cast(payload["id"].astext, PG_UUID),
+    )
+
+
+def _upsert_device_state(db: Session, user_email: str, values: dict, only_newer: bool = False) -> dict:
+    """
+    Write ``values`` into the user's device_state row. A missing row is
+    seeded with the full history snapshot (which already includes anything
+    flushed in this transaction), so the first write after the table appeared
+    does not leave the other controls empty. With ``only_newer`` a column is
+    only replaced by a payload at least as recent (created_at, id) as the
+    stored one, so concurrent creates cannot roll the state back. Returns
+    what the row now holds for the columns in ``values``.
+    """
+    if db.query(DeviceState.user_email).filter(DeviceState.user_email == user_email).first() is None:
+        seed = pg_insert(DeviceState).values(user_email=user_email, **get_latest_device_controls(db, user_email))
+        seed = seed.on_conflict_do_nothing(index_elements=[DeviceState.user_email])
+        seeded = db.execute(seed.returning(*[DeviceState.__table__.c[name] for name in values])).first()
+        if seeded is not None:
+            return dict(seeded._mapping)
+
+    stmt = pg_insert(DeviceState).values(user_email=user_email, **values)
+    columns = DeviceState.__table__.c
+    set_ = {}
+    for name in values:
+        incoming = stmt.excluded[name]
+        if only_newer:
+            stored = columns[name]
+            incoming = case((or_(stored.is_(None), _payload_key(stored) <= _payload_key(incoming)), incoming), else_=stored)
+        set_[name] = incoming
+    stmt = stmt.on_conflict_do_update(index_elements=[DeviceState.user_email], set_={**set_, "updated_at": func.now()})
+    return dict(db.execute(stmt.returning(*[columns[name] for name in values])).one()._mapping)
+
+
+def _set_device_state(db: Session, name: str, db_control) -> dict:
+    """Record a freshly flushed history row as the user's current value for ``name``"""
+    payload = DEVICE_CONTROL_SCHEMAS[name].model_validate(db_control).model_dump(mode="json")
+    return _upsert_device_state(db, db_control.user_email, {name: payload}, only_newer=True)[name]
+
+
+def _refresh_device_state(db: Session, name: str, user_email: str) -> Optional[dict]:
+    """Recompute ``name`` from history after a row was edited or removed"""
+    model = DEVICE_CONTROL_MODELS[name]
+    latest = (
+        db.query(model)
+        .filter(model.user_email == user_email)
+        .order_by(model.created_at.desc(), model.id.desc())
+        .first()
+    )
+    payload = DEVICE_CONTROL_SCHEMAS[name].model_validate(latest).model_dump(mode="json") if latest else None
+    _upsert_device_state(db, user_email, {name: payload})
+    return payload
+
+
+def _publish_device_change(user_email: str, name: str, action: str, control_id, current: Optional[dict]) -> None:
+    """Push a committed change to anyone subscribed to this user's device controls"""
+    device_events.publish(user_email, {
+        "type": "device_control",
+        "control": name,
+        "action": action,
+        "id": str(control_id),
+        "current": current,
+    })
+
+
+def get_device_state(db: Session, user_email: str) -> dict:
+    """Current value of every device control for a user, read by primary key.
+
+    Users whose state row predates the device_state table get it seeded
+    from history on first read; after that the create/update/delete paths
+    keep it current and the history tables are never touched here.
+    """
+    state = db.get(DeviceState, user_email)
+    if state is None:
+        snapshot = get_latest_device_controls(db, user_email)
+        stmt = pg_insert(DeviceState).values(user_email=user_email, **snapshot)
+        db.execute(stmt.on_conflict_do_nothing(index_elements=[DeviceState.user_email]))
+        db.commit()
+        return snapshot
+    return {name: getattr(state, name) for name in DEVICE_CONTROL_MODELS}
+
+
+def get_device_state_version(db: Session, user_email: str) -> Optional[datetime]:
+    """``updated_at`` of the user's device_state row (None if not seeded yet), without loading the payloads"""
+    return db.query(DeviceState.updated_at).filter(DeviceState.user_email == user_email).scalar()
+
 
 # Sound CRUD operations
 def create_sound(db: Session, sound: SoundCreate, current_user_email: str) -> Sound:
@@ -23,8 +159,11 @@ def create_sound(db: Session, sound: SoundCreate, current_user_email: str) -> So
         updated_by=current_user_email   # Set updated_b
     )
     db.add(db_sound)
+    db.flush()
+    current = _set_device_state(db, "sound", db_sound)
     db.commit()
     db.refresh(db_sound)
+    _publish_device_change(db_sound.user_email, "sound", "created", db_sound.id, current)
     return db_sound
 
 
@@ -36,8 +175,9 @@ def get_sound_by_user_email(db: Session, user_email: str) -> Optional[Sound]:
     return db.query(Sound).filter(Sound.user_email == user_email).order_by(Sound.created_at.desc()).first()
 
 
-def get_sounds_by_user_email(db: Session, user_email: str, skip: int = 0, limit: int = 100) -> List[Sound]:
-    return db.query(Sound).filter(Sound.user_email == user_email).order_by(Sound.created_at.desc()).offset(skip).limit(limit).all()
+def get_sounds_by_user_email(db: Session, user_email: str, skip: int = 0, limit: int = 100, cursor: Optional[str] = None) -> List[Sound]:
+    query = db.query(Sound).filter(Sound.user_email == user_email)
+    return paginate(query, Sound.created_at, Sound.id, cursor, skip, limit)
 
 
 def update_sound(db: Session, sound_id: UUID, sound_update: SoundUpdate) -> Optional[Sound]:
@@ -46,16 +186,23 @@ def update_sound(db: Session, sound_id: UUID, sound_update: SoundUpdate) -> Opti
         update_data = sound_update.dict(exclude_unset=True)
         for key, value in update_data.items():
             setattr(db_sound, key, value)
+        db.flush()
+        current = _refresh_device_state(db, "sound", db_sound.user_email)
         db.commit()
         db.refresh(db_sound)
+        _publish_device_change(db_sound.user_email, "sound", "updated", db_sound.id, current)
     return db_sound
 
 
 def delete_sound(db: Session, sound_id: UUID) -> bool:
     db_sound = get_sound(db, sound_id)
     if db_sound:
+        user_email = db_sound.user_email
         db.delete(db_sound)
+        db.flush()
+        current = _refresh_device_state(db, "sound", user_email)
         db.commit()
+        _publish_device_change(user_email, "sound", "deleted", sound_id, current)
         return True
     return False
 
@@ -68,8 +215,11 @@ def create_steam(db: Session, steam: SteamCreate) -> Steam:
         created_by=steam.created_by
     )
     db.add(db_steam)
+    db.flush()
+    current = _set_device_state(db, "steam", db_steam)
     db.commit()
     db.refresh(db_steam)
+    _publish_device_change(db_steam.user_email, "steam", "created", db_steam.id, current)
     return db_steam
 
 
@@ -81,8 +231,9 @@ def get_steam_by_user_email(db: Session, user_email: str) -> Optional[Steam]:
     return db.query(Steam).filter(Steam.user_email == user_email).order_by(Steam.created_at.desc()).first()
 
 
-def get_steams_by_user_email(db: Session, user_email: str, skip: int = 0, limit: int = 100) -> List[Steam]:
-    return db.query(Steam).filter(Steam.user_email == user_email).order_by(Steam.created_at.desc()).offset(skip).limit(limit).all()
+def get_steams_by_user_email(db: Session, user_email: str, skip: int = 0, limit: int = 100, cursor: Optional[str] = None) -> List[Steam]:
+    query = db.query(Steam).filter(Steam.user_email == user_email)
+    return paginate(query, Steam.created_at, Steam.id, cursor, skip, limit)
 
 
 def update_steam(db: Session, steam_id: UUID, steam_update: SteamUpdate) -> Optional[Steam]:
@@ -91,16 +242,23 @@ def update_steam(db: Session, steam_id: UUID, steam_update: SteamUpdate) -> Opti
         update_data = steam_update.dict(exclude_unset=True)
         for key, value in update_data.items():
             setattr(db_steam, key, value)
+        db.flush()
+        current = _refresh_device_state(db, "steam", db_steam.user_email)
         db.commit()
         db.refresh(db_steam)
+        _publish_device_change(db_steam.user_email, "steam", "updated", db_steam.id, current)
     return db_steam
 
 
 def delete_steam(db: Session, steam_id: UUID) -> bool:
     db_steam = get_steam(db, steam_id)
     if db_steam:
+        user_email = db_steam.user_email
         db.delete(db_steam)
+        db.flush()
+        current = _refresh_device_state(db, "steam", user_email)
         db.commit()
+        _publish_device_change(user_email, "steam", "deleted", steam_id, current)
         return True
     return False
 
@@ -113,8 +271,11 @@ def create_temp_tank(db: Session, temp_tank: TempTankCreate) -> TempTank:
         created_by=temp_tank.created_by
     )
     db.add(db_temp_tank)
+    db.flush()
+    current = _set_device_state(db, "temp_tank", db_temp_tank)
     db.commit()
     db.refresh(db_temp_tank)
+    _publish_device_change(db_temp_tank.user_email, "temp_tank", "created", db_temp_tank.id, current)
     return db_temp_tank
 
 
@@ -126,8 +287,9 @@ def get_temp_tank_by_user_email(db: Session, user_email: str) -> Optional[TempTa
     return db.query(TempTank).filter(TempTank.user_email == user_email).order_by(TempTank.created_at.desc()).first()
 
 
-def get_temp_tanks_by_user_email(db: Session, user_email: str, skip: int = 0, limit: int = 100) -> List[TempTank]:
-    return db.query(TempTank).filter(TempTank.user_email == user_email).order_by(TempTank.created_at.desc()).offset(skip).limit(limit).all()
+def get_temp_tanks_by_user_email(db: Session, user_email: str, skip: int = 0, limit: int = 100, cursor: Optional[str] = None) -> List[TempTank]:
+    query = db.query(TempTank).filter(TempTank.user_email == user_email)
+    return paginate(query, TempTank.created_at, TempTank.id, cursor, skip, limit)
 
 
 def update_temp_tank(db: Session, temp_tank_id: UUID, temp_tank_update: TempTankUpdate) -> Optional[TempTank]:
@@ -136,16 +298,23 @@ def update_temp_tank(db: Session, temp_tank_id: UUID, temp_tank_update: TempTank
         update_data = temp_tank_update.dict(exclude_unset=True)
         for key, value in update_data.items():
             setattr(db_temp_tank, key, value)
+        db.flush()
+        current = _refresh_device_state(db, "temp_tank", db_temp_tank.user_email)
         db.commit()
         db.refresh(db_temp_tank)
+        _publish_device_change(db_temp_tank.user_email, "temp_tank", "updated", db_temp_tank.id, current)
     return db_temp_tank
 
 
 def delete_temp_tank(db: Session, temp_tank_id: UUID) -> bool:
     db_temp_tank = get_temp_tank(db, temp_tank_id)
     if db_temp_tank:
+        user_email = db_temp_tank.user_email
         db.delete(db_temp_tank)
+        db.flush()
+        current = _refresh_device_state(db, "temp_tank", user_email)
         db.commit()
+        _publish_device_change(user_email, "temp_tank", "deleted", temp_tank_id, current)
         return True
     return False
 
@@ -158,8 +327,11 @@ def create_water_pump(db: Session, water_pump: WaterPumpCreate) -> WaterPump:
         created_by=water_pump.created_by
     )
     db.add(db_water_pump)
+    db.flush()
+    current = _set_device_state(db, "water_pump", db_water_pump)
     db.commit()
     db.refresh(db_water_pump)
+    _publish_device_change(db_water_pump.user_email, "water_pump", "created", db_water_pump.id, current)
     return db_water_pump
 
 
@@ -171,8 +343,9 @@ def get_water_pump_by_user_email(db: Session, user_email: str) -> Optional[Water
     return db.query(WaterPump).filter(WaterPump.user_email == user_email).order_by(WaterPump.created_at.desc()).first()
 
 
-def get_water_pumps_by_user_email(db: Session, user_email: str, skip: int = 0, limit: int = 100) -> List[WaterPump]:
-    return db.query(WaterPump).filter(WaterPump.user_email == user_email).order_by(WaterPump.created_at.desc()).offset(skip).limit(limit).all()
+def get_water_pumps_by_user_email(db: Session, user_email: str, skip: int = 0, limit: int = 100, cursor: Optional[str] = None) -> List[WaterPump]:
+    query = db.query(WaterPump).filter(WaterPump.user_email == user_email)
+    return paginate(query, WaterPump.created_at, WaterPump.id, cursor, skip, limit)
 
 
 def update_water_pump(db: Session, water_pump_id: UUID, water_pump_update: WaterPumpUpdate) -> Optional[WaterPump]:
@@ -181,16 +354,23 @@ def update_water_pump(db: Session, water_pump_id: UUID, water_pump_update: Water
         update_data = water_pump_update.dict(exclude_unset=True)
         for key, value in update_data.items():
             setattr(db_water_pump, key, value)
+        db.flush()
+        current = _refresh_device_state(db, "water_pump", db_water_pump.user_email)
         db.commit()
         db.refresh(db_water_pump)
+        _publish_device_change(db_water_pump.user_email, "water_pump", "updated", db_water_pump.id, current)
     return db_water_pump
 
 
 def delete_water_pump(db: Session, water_pump_id: UUID) -> bool:
     db_water_pump = get_water_pump(db, water_pump_id)
     if db_water_pump:
+        user_email = db_water_pump.user_email
         db.delete(db_water_pump)
+        db.flush()
+        current = _refresh_device_state(db, "water_pump", user_email)
         db.commit()
+        _publish_device_change(user_email, "water_pump", "deleted", water_pump_id, current)
         return True
     return False
 
@@ -203,8 +383,11 @@ def create_nano_flicker(db: Session, nano_flicker: NanoFlickerCreate) -> NanoFli
         created_by=nano_flicker.created_by
     )
     db.add(db_nano_flicker)
+    db.flush()
+    current = _set_device_state(db, "nano_flicker", db_nano_flicker)
     db.commit()
     db.refresh(db_nano_flicker)
+    _publish_device_change(db_nano_flicker.user_email, "nano_flicker", "created", db_nano_flicker.id, current)
     return db_nano_flicker
 
 
@@ -216,8 +399,9 @@ def get_nano_flicker_by_user_email(db: Session, user_email: str) -> Optional[Nan
     return db.query(NanoFlicker).filter(NanoFlicker.user_email == user_email).order_by(NanoFlicker.created_at.desc()).first()
 
 
-def get_nano_flickers_by_user_email(db: Session, user_email: str, skip: int = 0, limit: int = 100) -> List[NanoFlicker]:
-    return db.query(NanoFlicker).filter(NanoFlicker.user_email == user_email).order_by(NanoFlicker.created_at.desc()).offset(skip).limit(limit).all()
+def get_nano_flickers_by_user_email(db: Session, user_email: str, skip: int = 0, limit: int = 100, cursor: Optional[str] = None) -> List[NanoFlicker]:
+    query = db.query(NanoFlicker).filter(NanoFlicker.user_email == user_email)
+    return paginate(query, NanoFlicker.created_at, NanoFlicker.id, cursor, skip, limit)
 
 
 def update_nano_flicker(db: Session, nano_flicker_id: UUID, nano_flicker_update: NanoFlickerUpdate) -> Optional[NanoFlicker]:
@@ -226,16 +410,23 @@ def update_nano_flicker(db: Session, nano_flicker_id: UUID, nano_flicker_update:
         update_data = nano_flicker_update.dict(exclude_unset=True)
         for key, value in update_data.items():
             setattr(db_nano_flicker, key, value)
+        db.flush()
+        current = _refresh_device_state(db, "nano_flicker", db_nano_flicker.user_email)
         db.commit()
         db.refresh(db_nano_flicker)
+        _publish_device_change(db_nano_flicker.user_email, "nano_flicker", "updated", db_nano_flicker.id, current)
     return db_nano_flicker
 
 
 def delete_nano_flicker(db: Session, nano_flicker_id: UUID) -> bool:
     db_nano_flicker = get_nano_flicker(db, nano_flicker_id)
     if db_nano_flicker:
+        user_email = db_nano_flicker.user_email
         db.delete(db_nano_flicker)
+        db.flush()
+        current = _refresh_device_state(db, "nano_flicker", user_email)
         db.commit()
+        _publish_device_change(user_email, "nano_flicker", "deleted", nano_flicker_id, current)
         return True
     return False
 
@@ -248,8 +439,11 @@ def create_led_color(db: Session, led_color: LedColorCreate) -> LedColor:
         created_by=led_color.created_by
     )
     db.add(db_led_color)
+    db.flush()
+    current = _set_device_state(db, "led_color", db_led_color)
     db.commit()
     db.refresh(db_led_color)
+    _publish_device_change(db_led_color.user_email, "led_color", "created", db_led_color.id, current)
     return db_led_color
 
 
@@ -261,8 +455,9 @@ def get_led_color_by_user_email(db: Session, user_email: str) -> Optional[LedCol
     return db.query(LedColor).filter(LedColor.user_email == user_email).order_by(LedColor.created_at.desc()).first()
 
 
-def get_led_colors_by_user_email(db: Session, user_email: str, skip: int = 0, limit: int = 100) -> List[LedColor]:
-    return db.query(LedColor).filter(LedColor.user_email == user_email).order_by(LedColor.created_at.desc()).offset(skip).limit(limit).all()
+def get_led_colors_by_user_email(db: Session, user_email: str, skip: int = 0, limit: int = 100, cursor: Optional[str] = None) -> List[LedColor]:
+    query = db.query(LedColor).filter(LedColor.user_email == user_email)
+    return paginate(query, LedColor.created_at, LedColor.id, cursor, skip, limit)
 
 
 def update_led_color(db: Session, led_color_id: UUID, led_color_update: LedColorUpdate) -> Optional[LedColor]:
@@ -271,16 +466,23 @@ def update_led_color(db: Session, led_color_id: UUID, led_color_update: LedColor
         update_data = led_color_update.dict(exclude_unset=True)
         for key, value in update_data.items():
             setattr(db_led_color, key, value)
+        db.flush()
+        current = _refresh_device_state(db, "led_color", db_led_color.user_email)
         db.commit()
         db.refresh(db_led_color)
+        _publish_device_change(db_led_color.user_email, "led_color", "updated", db_led_color.id, current)
     return db_led_color
 
 
 def delete_led_color(db: Session, led_color_id: UUID) -> bool:
     db_led_color = get_led_color(db, led_color_id)
     if db_led_color:
+        user_email = db_led_color.user_email
         db.delete(db_led_color)
+        db.flush()
+        current = _refresh_device_state(db, "led_color", user_email)
         db.commit()
+        _publish_device_change(user_email, "led_color", "deleted", led_color_id, current)
         return True
     return False
 
@@ -1,9 +1,16 @@
+import uuid
+from datetime import datetime, timedelta
 from uuid import UUID
-from typing import List, Optional
+from typing import List, Optional, Sequence
 
+from sqlalchemy import Float, func, insert
+from sqlalchemy.engine import Row
 from sqlalchemy.orm import Session
 
-from app.models import Biofeedback, BurnProgress, BrainMonitoring, HeartBrainSynchronicity
+from app.core.pagination import paginate
+
+from app.models import Biofeedback, BurnProgress, BrainMonitoring, HeartBrainSynchronicity, TelemetryRollupMinute, TelemetryRollupHour
+from app.services.retention import ROLLUP_MODELS, raw_retention_cutoff
 from app.schemas.health_monitoring import (
     BiofeedbackCreate, BiofeedbackUpdate,
     BurnProgressCreate, BurnProgressUpdate,
@@ -12,6 +19,119 @@ from app.schemas.health_monitoring import (
 )
 
 
+def _bulk_insert(db: Session, model, readings: Sequence) -> List[Row]:
+    """Insert many readings in one multi-row INSERT and a single commit.
+
+    Returns the ``(id, created_at)`` of every inserted row, in request order,
+    straight from ``RETURNING`` so no per-row refresh is needed.
+    """
+    rows = [{"id": uuid.uuid4(), **reading.dict()} for reading in readings]
+    stmt = insert(model).returning(model.id, model.created_at, sort_by_parameter_order=True)
+    inserted = db.execute(stmt, rows).all()
+    db.commit()
+    return inserted
+
+
+def _metric_columns(model) -> list:
+    return [column for column in model.__table__.columns if isinstance(column.type, Float)]
+
+
+def _bucket_expression(time_column, bucket_seconds: int):
+    return func.to_timestamp(func.floor(func.extract("epoch", time_column) / bucket_seconds) * bucket_seconds)
+
+
+def _raw_buckets(db: Session, model, columns: list, user_email: str, start: datetime, end: datetime, bucket_seconds: int) -> dict:
+    bucket_start = _bucket_expression(model.created_at, bucket_seconds).label("bucket_start")
+    aggregates = []
+    for column in columns:
+        aggregates.extend([
+            func.min(column).label(f"{column.name}__min"),
+            func.max(column).label(f"{column.name}__max"),
+            func.sum(column).label(f"{column.name}__sum"),
+            func.count(column).label(f"{column.name}__count"),
+        ])
+    rows = (
+        db.query(bucket_start, func.count().label("samples"), *aggregates)
+        .filter(model.user_email == user_email, model.created_at >= start, model.created_at < end)
+        .group_by("bucket_start")
+        .all()
+    )
+    buckets = {}
+    for row in rows:
+        values = row._mapping
+        buckets[values["bucket_start"]] = {
+            "samples": values["samples"],
+            "metrics": {
+                column.name: [values[f"{column.name}__{part}"] for part in ("min", "max", "sum", "count")]
+                for column in columns
+            },
+        }
+    return buckets
+
+
+def _merge_rollup_buckets(buckets: dict, db: Session, model, columns: list, user_email: str, start: datetime, end: datetime, bucket_seconds: int) -> None:
+    """Add the minute and hour rollups of ``model`` in ``[start, end)`` into ``buckets``"""
+    for rollup, width in ((TelemetryRollupMinute, timedelta(minutes=1)), (TelemetryRollupHour, timedelta(hours=1))):
+        # A rollup bucket that began before ``start`` is counted in the first requested bucket
+        bucket_start = _bucket_expression(func.greatest(rollup.bucket_start, start), bucket_seconds)
+        rows = (
+            db.query(
+                bucket_start, rollup.metric,
+                func.min(rollup.min_value), func.max(rollup.max_value), func.sum(rollup.sum_value),
+                func.sum(rollup.value_count), func.sum(rollup.samples),
+            )
+            .filter(
+                rollup.family == model.__tablename__, rollup.user_email == user_email,
+                rollup.bucket_start > start - width, rollup.bucket_start < end,
+            )
+            .group_by(bucket_start, rollup.metric)
+            .all()
+        )
+        samples = {}
+        for bucket, metric, low, high, total, count, metric_samples in rows:
+            entry = buckets.setdefault(bucket, {"samples": 0, "metrics": {c.name: [None, None, None, 0] for c in columns}})
+            current = entry["metrics"].get(metric)
+            if current is None:
+                continue
+            entry["metrics"][metric] = [
+                low if current[0] is None else current[0] if low is None else min(low, current[0]),
+                high if current[1] is None else current[1] if high is None else max(high, current[1]),
+                total if current[2] is None else current[2] if total is None else total + current[2],
+                current[3] + count,
+            ]
+            # Every metric row of a rollup bucket carries the same sample count
+            samples[bucket] = max(samples.get(bucket, 0), metric_samples)
+        for bucket, count in samples.items():
+            buckets[bucket]["samples"] += count
+
+
+def _get_series(db: Session, model, user_email: str, start: datetime, end: datetime, bucket_seconds: int) -> List[dict]:
+    """Aggregate a user's readings into fixed-width time buckets inside the database.
+
+    Every float column gets min/max/avg/count per bucket, so the result size
+    depends on the number of buckets in ``[start, end)``, not on the number
+    of stored samples. Ranges reaching past the raw retention window also
+    read the minute/hour rollups, at their coarser resolution.
+    """
+    columns = _metric_columns(model)
+    buckets = _raw_buckets(db, model, columns, user_email, start, end, bucket_seconds)
+    cutoff = raw_retention_cutoff()
+    if model in ROLLUP_MODELS and cutoff is not None and start < cutoff:
+        _merge_rollup_buckets(buckets, db, model, columns, user_email, start, end, bucket_seconds)
+    points = []
+    for bucket in sorted(buckets):
+        entry = buckets[bucket]
+        points.append({
+            "bucket_start": bucket,
+            "count": entry["samples"],
+            "metrics": {
+                name: {"min": low, "max": high, "avg": total / count if count else None, "count": count}
+                for name, (low, high, total, count) in entry["metrics"].items()
+            },
+        })
+    return points
+
+
 # Biofeedback CRUD operations
 def create_biofeedback(db: Session, biofeedback: BiofeedbackCreate) -> Biofeedback:
     db_biofeedback = Biofeedback(
@@ -35,6 +155,10 @@ def create_biofeedback(db: Session, biofeedback: BiofeedbackCreate) -> Biofeedba
     return db_biofeedback
 
 
+def create_biofeedbacks_bulk(db: Session, readings: List[BiofeedbackCreate]) -> List[Row]:
+    return _bulk_insert(db, Biofeedback, readings)
+
+
 def get_biofeedback(db: Session, biofeedback_id: UUID) -> Optional[Biofeedback]:
     return db.query(Biofeedback).filter(Biofeedback.id == biofeedback_id).first()
 
@@ -43,8 +167,13 @@ def get_biofeedback_by_user_email(db: Session, user_email: str) -> Optional[Biof
     return db.query(Biofeedback).filter(Biofeedback.user_email == user_email).order_by(Biofeedback.created_at.desc()).first()
 
 
-def get_biofeedbacks_by_user_email(db: Session, user_email: str, skip: int = 0, limit: int = 100) -> List[Biofeedback]:
-    return db.query(Biofeedback).filter(Biofeedback.user_email == user_email).order_by(Biofeedback.created_at.desc()).offset(skip).limit(limit).all()
+def get_biofeedbacks_by_user_email(db: Session, user_email: str, skip: int = 0, limit: int = 100, cursor: Optional[str] = None) -> List[Biofeedback]:
+    query = db.query(Biofeedback).filter(Biofeedback.user_email == user_email)
+    return paginate(query, Biofeedback.created_at, Biofeedback.id, cursor, skip, limit)
+
+
+def get_biofeedback_series(db: Session, user_email: str, start: datetime, end: datetime, bucket_seconds: int) -> List[dict]:
+    return _get_series(db, Biofeedback, user_email, start, end, bucket_seconds)
 
 
 def update_biofeedback(db: Session, biofeedback_id: UUID, biofeedback_update: BiofeedbackUpdate) -> Optional[Biofeedback]:
@@ -93,6 +222,10 @@ def create_burn_progress(db: Session, burn_progress: BurnProgressCreate) -> Burn
     return db_burn_progress
 
 
+def create_burn_progresses_bulk(db: Session, readings: List[BurnProgressCreate]) -> List[Row]:
+    return _bulk_insert(db, BurnProgress, readings)
+
+
 def get_burn_progress(db: Session, burn_progress_id: UUID) -> Optional[BurnProgress]:
     return db.query(BurnProgress).filter(BurnProgress.id == burn_progress_id).first()
 
@@ -101,8 +234,13 @@ def get_burn_progress_by_user_email(db: Session, user_email: str) -> Optional[Bu
     return db.query(BurnProgress).filter(BurnProgress.user_email == user_email).order_by(BurnProgress.created_at.desc()).first()
 
 
-def get_burn_progresses_by_user_email(db: Session, user_email: str, skip: int = 0, limit: int = 100) -> List[BurnProgress]:
-    return db.query(BurnProgress).filter(BurnProgress.user_email == user_email).order_by(BurnProgress.created_at.desc()).offset(skip).limit(limit).all()
+def get_burn_progresses_by_user_email(db: Session, user_email: str, skip: int = 0, limit: int = 100, cursor: Optional[str] = None) -> List[BurnProgress]:
+    query = db.query(BurnProgress).filter(BurnProgress.user_email == user_email)
+    return paginate(query, BurnProgress.created_at, BurnProgress.id, cursor, skip, limit)
+
+
+def get_burn_progress_series(db: Session, user_email: str, start: datetime, end: datetime, bucket_seconds: int) -> List[dict]:
+    return _get_series(db, BurnProgress, user_email, start, end, bucket_seconds)
 
 
 def update_burn_progress(db: Session, burn_progress_id: UUID, burn_progress_update: BurnProgressUpdate) -> Optional[BurnProgress]:
@@ -147,6 +285,10 @@ def create_brain_monitoring(db: Session, brain_monitoring: BrainMonitoringCreate
     return db_brain_monitoring
 
 
+def create_brain_monitorings_bulk(db: Session, readings: List[BrainMonitoringCreate]) -> List[Row]:
+    return _bulk_insert(db, BrainMonitoring, readings)
+
+
 def get_brain_monitoring(db: Session, brain_monitoring_id: UUID) -> Optional[BrainMonitoring]:
     return db.query(BrainMonitoring).filter(BrainMonitoring.id == brain_monitoring_id).first()
 
@@ -155,8 +297,13 @@ def get_brain_monitoring_by_user_email(db: Session, user_email: str) -> Optional
     return db.query(BrainMonitoring).filter(BrainMonitoring.user_email == user_email).order_by(BrainMonitoring.created_at.desc()).first()
 
 
-def get_brain_monitorings_by_user_email(db: Session, user_email: str, skip: int = 0, limit: int = 100) -> List[BrainMonitoring]:
-    return db.query(BrainMonitoring).filter(BrainMonitoring.user_email == user_email).order_by(BrainMonitoring.created_at.desc()).offset(skip).limit(limit).all()
+def get_brain_monitorings_by_user_email(db: Session, user_email: str, skip: int = 0, limit: int = 100, cursor: Optional[str] = None) -> List[BrainMonitoring]:
+    query = db.query(BrainMonitoring).filter(BrainMonitoring.user_email == user_email)
+    return paginate(query, BrainMonitoring.created_at, BrainMonitoring.id, cursor, skip, limit)
+
+
+def get_brain_monitoring_series(db: Session, user_email: str, start: datetime, end: datetime, bucket_seconds: int) -> List[dict]:
+    return _get_series(db, BrainMonitoring, user_email, start, end, bucket_seconds)
 
 
 def update_brain_monitoring(db: Session, brain_monitoring_id: UUID, brain_monitoring_update: BrainMonitoringUpdate) -> Optional[BrainMonitoring]:
@@ -200,6 +347,10 @@ def create_heart_brain_synchronicity(db: Session, heart_brain_synchronicity: Hea
     return db_heart_brain_synchronicity
 
 
+def create_heart_brain_synchronicities_bulk(db: Session, readings: List[HeartBrainSynchronicityCreate]) -> List[Row]:
+    return _bulk_insert(db, HeartBrainSynchronicity, readings)
+
+
 def get_heart_brain_synchronicity(db: Session, heart_brain_synchronicity_id: UUID) -> Optional[HeartBrainSynchronicity]:
     return db.query(HeartBrainSynchronicity).filter(HeartBrainSynchronicity.id == heart_brain_synchronicity_id).first()
 
@@ -208,8 +359,13 @@ def get_heart_brain_synchronicity_by_user_email(db: Session, user_email: str) ->
     return db.query(HeartBrainSynchronicity).filter(HeartBrainSynchronicity.user_email == user_email).order_by(HeartBrainSynchronicity.created_at.desc()).first()
 
 
-def get_heart_brain_synchronicities_by_user_email(db: Session, user_email: str, skip: int = 0, limit: int = 100) -> List[HeartBrainSynchronicity]:
-    return db.query(HeartBrainSynchronicity).filter(HeartBrainSynchronicity.user_email == user_email).order_by(HeartBrainSynchronicity.created_at.desc()).offset(skip).limit(limit).all()
+def get_heart_brain_synchronicities_by_user_email(db: Session, user_email: str, skip: int = 0, limit: int = 100, cursor: Optional[str] = None) -> List[HeartBrainSynchronicity]:
+    query = db.query(HeartBrainSynchronicity).filter(HeartBrainSynchronicity.user_email == user_email)
+    return paginate(query, HeartBrainSynchronicity.created_at, HeartBrainSynchronicity.id, cursor, skip, limit)
+
+
+def get_heart_brain_synchronicity_series(db: Session, user_email: str, start: datetime, end: datetime, bucket_seconds: int) -> List[dict]:
+    return _get_series(db, HeartBrainSynchronicity, user_email, start, end, bucket_seconds)
 
 
 def update_heart_brain_synchronicity(db: Session, heart_brain_synchronicity_id: UUID, heart_brain_synchronicity_update: HeartBrainSynchronicityUpdate) -> Optional[HeartBrainSynchronicity]:
@@ -4,6 +4,8 @@ from uuid import UUID
 from typing import List, Optional
 
 from sqlalchemy.orm import Session
+from app.core.cache import PUBLIC_LIVE_SESSION, invalidate_public
+from app.core.pagination import paginate
 from app.models.live_session import LiveSession
 from app.schemas.live_session import LiveSessionCreate, LiveSessionUpdate
 
@@ -11,20 +13,15 @@ def create_live_session(db: Session, data: LiveSessionCreate) -> LiveSession:
     db_live_session = LiveSession(**data.dict())
     db.add(db_live_session)
     db.commit()
+    invalidate_public(PUBLIC_LIVE_SESSION)
     db.refresh(db_live_session)
     return db_live_session
 
 def get_live_session(db: Session, live_session_id: UUID) -> Optional[LiveSession]:
     return db.query(LiveSession).filter(LiveSession.id == live_session_id).first()
 
-def get_all_live_sessions(db: Session, skip: int = 0, limit: int = 100) -> List[LiveSession]:
-    return (
-        db.query(LiveSession)
-        .order_by(LiveSession.date_time.desc())
-        .offset(skip)
-        .limit(limit)
-        .all()
-    )
+def get_all_live_sessions(db: Session, skip: int = 0, limit: int = 100, cursor: Optional[str] = None) -> List[LiveSession]:
+    return paginate(db.query(LiveSession), LiveSession.date_time, LiveSession.id, cursor, skip, limit)
 
 def get_latest_live_session(db: Session) -> Optional[LiveSession]:
     """Get the latest live session for public display"""
@@ -40,6 +37,7 @@ def update_live_session(db: Session, live_session_id: UUID, data: LiveSessionUpd
         for key, value in data.dict(exclude_unset=True).items():
             setattr(db_live_session, key, value)
         db.commit()
+        invalidate_public(PUBLIC_LIVE_SESSION)
         db.refresh(db_live_session)
     return db_live_session
 
@@ -48,5 +46,6 @@ def delete_live_session(db: Session, live_session_id: UUID) -> bool:
     if db_live_session:
         db.delete(db_live_session)
         db.commit()
+        invalidate_public(PUBLIC_LIVE_SESSION)
         return True
     return False
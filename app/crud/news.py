@@ -1,21 +1,25 @@
 # app/crud/news.py
 from sqlalchemy.orm import Session
+from app.core.cache import PUBLIC_NEWS, invalidate_public
+from app.core.pagination import paginate
 from app.models.news import News
 from app.schemas.news import NewsCreate, NewsUpdate
 from uuid import UUID
+from typing import Optional
 
 def create_news(db: Session, news: NewsCreate) -> News:
     db_news = News(**news.dict())
     db.add(db_news)
     db.commit()
+    invalidate_public(PUBLIC_NEWS)
     db.refresh(db_news)
     return db_news
 
 def get_news(db: Session, news_id: UUID) -> News:
     return db.query(News).filter(News.id == news_id).first()
 
-def get_all_news(db: Session, skip: int = 0, limit: int = 100):
-    return db.query(News).order_by(News.publish_date.desc()).offset(skip).limit(limit).all()
+def get_all_news(db: Session, skip: int = 0, limit: int = 100, cursor: Optional[str] = None):
+    return paginate(db.query(News), News.publish_date, News.id, cursor, skip, limit)
 
 def get_latest_news(db: Session, limit: int = 2):
     """Get the latest news items for public display"""
@@ -27,6 +31,7 @@ def update_news(db: Session, news_id: UUID, news_update: NewsUpdate) -> News:
         for key, value in news_update.dict(exclude_unset=True).items():
             setattr(db_news, key, value)
         db.commit()
+        invalidate_public(PUBLIC_NEWS)
         db.refresh(db_news)
     return db_news
 
@@ -35,5 +40,6 @@ def delete_news(db: Session, news_id: UUID):
     if db_news:
         db.delete(db_news)
         db.commit()
+        invalidate_public(PUBLIC_NEWS)
         return True
     return False
@@ -1,21 +1,29 @@
-from app.models import User, Sound, Steam, TempTank, WaterPump, NanoFlicker, LedColor
-from app.models import Biofeedback, BurnProgress, BrainMonitoring, HeartBrainSynchronicity
+from app.models import User, UserDeletionJob, DeletionStatus
 from app.schemas import UserCreate
 from passlib.context import CryptContext
 from app.models.user import UserStatus
+from sqlalchemy import func
 from sqlalchemy.orm import Session
+from app.core.cache import user_cache
+from app.core.pagination import paginate
 from uuid import UUID
 from typing import List, Optional
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 
+class UserDeletionInProgress(Exception):
+    """A change was refused because the user has an unfinished deletion job"""
+
+
 def get_password_hash(password):
     return pwd_context.hash(password)
 
 
-def create_user(db: Session, user: UserCreate):
-    hashed_password = get_password_hash(user.password)
+def create_user(db: Session, user: UserCreate, hashed_password: Optional[str] = None):
+    # Callers on the request path hash on the bounded pool and pass the result in
+    if hashed_password is None:
+        hashed_password = get_password_hash(user.password)
     db_user = User(email=user.email,
         password_hash=hashed_password,
         role=user.role,
@@ -55,28 +63,67 @@ def set_refresh_token(db: Session, user: User, token: str):
 def get_user_by_id(db: Session, user_id: UUID) -> Optional[User]:
     return db.query(User).filter(User.id == user_id).first()
 
-def list_users(db: Session, skip: int = 0, limit: int = 100) -> List[User]:
-    return db.query(User).offset(skip).limit(limit).all()
+def list_users(db: Session, skip: int = 0, limit: int = 100, cursor: Optional[str] = None) -> List[User]:
+    return paginate(db.query(User), User.created_at, User.id, cursor, skip, limit)
+
+def get_unfinished_user_deletion_job(db: Session, user_id: UUID) -> Optional[UserDeletionJob]:
+    """The user's deletion job that has not completed (pending, running or failed), if any"""
+    return (
+        db.query(UserDeletionJob)
+        .filter(UserDeletionJob.user_id == user_id, UserDeletionJob.status != DeletionStatus.completed.value)
+        .first()
+    )
+
 
 def update_user(db: Session, user_id: UUID, update_data: dict) -> Optional[User]:
-    user = get_user_by_id(db, user_id)
+    """
+    Apply ``update_data`` to the user; None if there is no such user. While a
+    deletion is queued the user stays inactive and keeps the email its job
+    deletes by, so changes to either raise UserDeletionInProgress.
+    """
+    # Locking the row serializes this with request_user_deletion
+    user = db.query(User).filter(User.id == user_id).with_for_update().first()
     if not user:
         return None
+    if {"user_status", "email"} & update_data.keys() and get_unfinished_user_deletion_job(db, user_id):
+        db.rollback()
+        raise UserDeletionInProgress(user_id)
+    previous_email = user.email
     for field, value in update_data.items():
         setattr(user, field, value)
     db.commit()
     db.refresh(user)
+    # Status, role or email may have changed; drop the cached authorization fields
+    user_cache.invalidate(previous_email)
+    user_cache.invalidate(user.email)
     return user
 
-def delete_user_and_related(db: Session, user_id: UUID) -> bool:
-    user = get_user_by_id(db, user_id)
+def request_user_deletion(db: Session, user_id: UUID, requested_by: Optional[str] = None) -> Optional[UserDeletionJob]:
+    """
+    Lock the user out and queue their deletion; the rows are removed later,
+    in chunks, by the user-deletion worker. Returns the job (the existing one
+    if a deletion is already under way, re-queued if it had failed), or None
+    if there is no such user.
+    """
+    user = db.query(User).filter(User.id == user_id).with_for_update().first()
     if not user:
-        return False
-    email = user.email
-    # delete all records linked by user_email
-    for model in (Sound, Steam, TempTank, WaterPump, NanoFlicker, LedColor,
-                  Biofeedback, BurnProgress, BrainMonitoring, HeartBrainSynchronicity):
-        db.query(model).filter(model.user_email == email).delete(synchronize_session=False)
-    db.delete(user)
+        return None
+    job = get_unfinished_user_deletion_job(db, user_id)
+    if job is None:
+        job = UserDeletionJob(user_id=user.id, user_email=user.email, requested_by=requested_by)
+        db.add(job)
+    elif job.status == DeletionStatus.failed.value:
+        job.status = DeletionStatus.pending.value
+        job.attempts = 0
+        job.next_attempt_at = func.now()
+    # Login is refused for inactive users, and refresh needs the stored token
+    user.user_status = UserStatus.inactive
+    user.refresh_token = None
     db.commit()
-    return True
\ No newline at end of file
+    db.refresh(job)
+    user_cache.invalidate(user.email)
+    return job
+
+
+def get_user_deletion_job(db: Session, job_id: UUID) -> Optional[UserDeletionJob]:
+    return db.query(UserDeletionJob).filter(UserDeletionJob.id == job_id).first()
@@ -1,8 +1,10 @@
 # app/crud/user_hub.py
 from sqlalchemy.orm import Session
+from app.core.pagination import paginate
 from app.models.user_hub import UserHub
 from app.schemas.user_hub import UserHubCreate, UserHubUpdate
 from uuid import UUID
+from typing import Optional
 
 def create_user_hub(db: Session, user_hub: UserHubCreate) -> UserHub:
     db_user_hub = UserHub(**user_hub.dict())
@@ -17,17 +19,18 @@ def get_user_hub(db: Session, hub_id: UUID) -> UserHub:
 def get_user_hub_by_email(db: Session, email: str) -> UserHub:
     return db.query(UserHub).filter(UserHub.email == email).first()
 
-def get_all_user_hubs(db: Session, skip: int = 0, limit: int = 100, status_filter: bool = None):
+def get_all_user_hubs(db: Session, skip: int = 0, limit: int = 100, status_filter: bool = None, cursor: Optional[str] = None):
     query = db.query(UserHub)
     if status_filter is not None:
         query = query.filter(UserHub.status == status_filter)
-    return query.order_by(UserHub.created_at.desc()).offset(skip).limit(limit).all()
+    return paginate(query, UserHub.created_at, UserHub.id, cursor, skip, limit)
 
-def get_user_hubs_by_category(db: Session, category: str, skip: int = 0, limit: int = 100):
-    return db.query(UserHub).filter(
+def get_user_hubs_by_category(db: Session, category: str, skip: int = 0, limit: int = 100, cursor: Optional[str] = None):
+    query = db.query(UserHub).filter(
         UserHub.category == category,
         UserHub.status == True
-    ).order_by(UserHub.created_at.desc()).offset(skip).limit(limit).all()
+    )
+    return paginate(query, UserHub.created_at, UserHub.id, cursor, skip, limit)
 
 def update_user_hub(db: Session, hub_id: UUID, hub_update: UserHubUpdate) -> UserHub:
     db_user_hub = get_user_hub(db, hub_id)
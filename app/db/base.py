@@ -3,15 +3,67 @@ import os
 from app.core.config import settings
 from dotenv import load_dotenv
 from sqlalchemy import create_engine
+from sqlalchemy.engine import URL, make_url
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import declarative_base, sessionmaker
 
+from app.db.pool import InstrumentedAsyncAdaptedQueuePool, InstrumentedQueuePool
+
 load_dotenv()
 
 DATABASE_URL = os.getenv("DATABASE_URL")
 
-engine = create_engine(settings.DATABASE_URL or "", echo=True)
+
+def pool_options() -> dict:
+    return {
+        "echo": settings.DB_ECHO,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+    }
+
+
+def statement_timeout_args(driver: str) -> dict:
+    """connect_args setting statement_timeout for every new connection of ``driver``"""
+    if not settings.DB_STATEMENT_TIMEOUT_MS:
+        return {}
+    if driver == "asyncpg":
+        return {"server_settings": {"statement_timeout": str(settings.DB_STATEMENT_TIMEOUT_MS)}}
+    return {"options": f"-c statement_timeout={settings.DB_STATEMENT_TIMEOUT_MS}"}
+
+
+engine = create_engine(
+    settings.DATABASE_URL or "",
+    poolclass=InstrumentedQueuePool,
+    connect_args=statement_timeout_args("psycopg2"),
+    **pool_options(),
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+
+def async_database_url(url: str) -> URL:
+    """Point a postgresql:// URL at the asyncpg driver (which spells sslmode as ssl)"""
+    url = make_url(url)
+    if url.get_backend_name() != "postgresql":
+        return url
+    url = url.set(drivername="postgresql+asyncpg")
+    if "sslmode" in url.query:
+        url = url.update_query_dict({"ssl": url.query["sslmode"]}).difference_update_query(["sslmode"])
+    return url
+
+
+# Async engine for the request path: routes awaiting it hold a pool
+# connection while waiting on Postgres, not a threadpool slot.
+async_engine = create_async_engine(
+    async_database_url(settings.DATABASE_URL),
+    poolclass=InstrumentedAsyncAdaptedQueuePool,
+    connect_args=statement_timeout_args("asyncpg"),
+    **pool_options(),
+)
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
 Base = declarative_base()
 
 
@@ -22,3 +74,14 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    """
+    Async counterpart of ``get_db``. The CRUD functions in ``app/crud`` are
+    written against ``Session``; run them on this session with
+    ``await db.run_sync(crud.fn, *args)`` and they execute over asyncpg
+    on the event loop.
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -1,18 +1,43 @@
 from app.api import admin_live_session, admin_news,user_news
-from app.api import  auth_routes, user_routes,device_controls_routes, health_monitoring_routes,admin_health_monitoring,admin_device_controls, public_routes, admin_contact, admin_about, file_upload, admin_admin_hub, admin_user_hub, user_user_hub
+from app.api import  auth_routes, user_routes,device_controls_routes, health_monitoring_routes,admin_health_monitoring,admin_device_controls, public_routes, admin_contact, admin_about, file_upload, admin_admin_hub, admin_user_hub, user_user_hub, admin_metrics, media
+from app.core.compression import CompressionMiddleware
+from app.core.pagination import NEXT_CURSOR_HEADER
+from app.core.upload_limit import UploadLimitMiddleware
 from app.db.base import Base, engine
+from app.services.email_service import email_outbox_worker
+from app.services.images import shutdown_image_pool
+from app.services.uploads import MAX_UPLOAD_REQUEST_BYTES, upload_sweeper
+from app.services.retention import retention_worker
+from app.services.user_deletion import user_deletion_worker
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
-from fastapi.staticfiles import StaticFiles
 from app.models import * 
 from fastapi.middleware.cors import CORSMiddleware
 
 Base.metadata.create_all(bind=engine)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Background workers run for the lifetime of each server process
+    email_outbox_worker.start()
+    upload_sweeper.start()
+    user_deletion_worker.start()
+    retention_worker.start()
+    yield
+    email_outbox_worker.stop()
+    upload_sweeper.stop()
+    user_deletion_worker.stop()
+    retention_worker.stop()
+    shutdown_image_pool()
+
+
 app = FastAPI(
     title="WOMB Backend",
     description="Backend API for WOMB platform",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 origins = [
@@ -28,14 +53,21 @@ origins = [
     "https://saunaura.online"
 ]
 
+# Multipart bodies are spooled before any endpoint runs, so their size is capped here
+app.add_middleware(UploadLimitMiddleware, max_body_bytes=MAX_UPLOAD_REQUEST_BYTES, detail="File size too large. Maximum 5MB allowed")
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=origins,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
+# gzip/brotli/zstd for JSON and other text responses; /uploads is left alone
+app.add_middleware(CompressionMiddleware)
+
 # mount your routers
 app.include_router(auth_routes.router, prefix="/auth", )
 app.include_router(user_routes.router, prefix="/users", )
@@ -56,9 +88,10 @@ app.include_router(admin_admin_hub.router)
 app.include_router(admin_user_hub.router)
 app.include_router(user_user_hub.router)
 app.include_router(file_upload.router)
+app.include_router(admin_metrics.router)
 
-# Mount static files for uploaded images
-app.mount("/uploads", StaticFiles(directory="uploads"), name="uploads")
+# Uploaded images, with caching headers and variant negotiation
+app.include_router(media.router)
 
 @app.get("/debug/routes")
 async def debug_routes():
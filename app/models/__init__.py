@@ -1,9 +1,13 @@
 from .user import User, UserRole, UserStatus, Gender, MaritalStatus, ExerciseFrequency, SmokingStatus, AlcoholConsumption
 from .device_controls import Sound, Steam, TempTank, WaterPump, NanoFlicker, LedColor
+from .device_state import DeviceState
 from .health_monitoring import Biofeedback, BurnProgress, BrainMonitoring, HeartBrainSynchronicity
 from .news import News
 from .live_session import LiveSession
 from .contact import Contact
 from .about import About
 from .admin_hub import AdminHub
-from .user_hub import UserHub
\ No newline at end of file
+from .user_hub import UserHub
+from .email_outbox import EmailOutbox, EmailStatus
+from .user_deletion_job import UserDeletionJob, DeletionStatus
+from .telemetry_rollup import TelemetryRollupMinute, TelemetryRollupHour
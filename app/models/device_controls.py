@@ -1,6 +1,6 @@
 import uuid
 from app.db.base import Base
-from sqlalchemy import Boolean, Column, DateTime, Float, String, ForeignKey, Text
+from sqlalchemy import Boolean, Column, DateTime, Float, ForeignKey, Index, String, Text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 
@@ -16,6 +16,12 @@ class Sound(Base):
     created_by = Column(String, nullable=True)
     updated_by = Column(String, nullable=True)
 
+    # Fetch created_at via RETURNING at flush so device_state can be written before commit
+    __mapper_args__ = {"eager_defaults": True}
+    __table_args__ = (
+        Index("ix_sounds_user_email_created_at", user_email, created_at.desc(), id.desc()),
+    )
+
 
 class Steam(Base):
     __tablename__ = "steams"
@@ -28,6 +34,12 @@ class Steam(Base):
     created_by = Column(String, nullable=True)
     updated_by = Column(String, nullable=True)
 
+    # Fetch created_at via RETURNING at flush so device_state can be written before commit
+    __mapper_args__ = {"eager_defaults": True}
+    __table_args__ = (
+        Index("ix_steams_user_email_created_at", user_email, created_at.desc(), id.desc()),
+    )
+
 
 class TempTank(Base):
     __tablename__ = "temp_tanks"
@@ -40,6 +52,12 @@ class TempTank(Base):
     created_by = Column(String, nullable=True)
     updated_by = Column(String, nullable=True)
 
+    # Fetch created_at via RETURNING at flush so device_state can be written before commit
+    __mapper_args__ = {"eager_defaults": True}
+    __table_args__ = (
+        Index("ix_temp_tanks_user_email_created_at", user_email, created_at.desc(), id.desc()),
+    )
+
 
 class WaterPump(Base):
     __tablename__ = "water_pumps"
@@ -52,6 +70,12 @@ class WaterPump(Base):
     created_by = Column(String, nullable=True)
     updated_by = Column(String, nullable=True)
 
+    # Fetch created_at via RETURNING at flush so device_state can be written before commit
+    __mapper_args__ = {"eager_defaults": True}
+    __table_args__ = (
+        Index("ix_water_pumps_user_email_created_at", user_email, created_at.desc(), id.desc()),
+    )
+
 
 class NanoFlicker(Base):
     __tablename__ = "nano_flickers"
@@ -64,6 +88,12 @@ class NanoFlicker(Base):
     created_by = Column(String, nullable=True)
     updated_by = Column(String, nullable=True)
 
+    # Fetch created_at via RETURNING at flush so device_state can be written before commit
+    __mapper_args__ = {"eager_defaults": True}
+    __table_args__ = (
+        Index("ix_nano_flickers_user_email_created_at", user_email, created_at.desc(), id.desc()),
+    )
+
 
 class LedColor(Base):
     __tablename__ = "led_colors"
@@ -75,3 +105,9 @@ class LedColor(Base):
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     created_by = Column(String, nullable=True)
     updated_by = Column(String, nullable=True)
+
+    # Fetch created_at via RETURNING at flush so device_state can be written before commit
+    __mapper_args__ = {"eager_defaults": True}
+    __table_args__ = (
+        Index("ix_led_colors_user_email_created_at", user_email, created_at.desc(), id.desc()),
+    )
@@ -0,0 +1,26 @@
+# app/models/device_state.py
+from sqlalchemy import Column, DateTime, ForeignKey, String
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.sql import func
+
+from app.db.base import Base
+
+
+class DeviceState(Base):
+    """Current value of every device control for a user, one row per user.
+
+    The append-only control tables stay the audit history; this row is kept
+    up to date in the same transaction as each history write so "what is the
+    pod doing right now" is a primary-key lookup. Each column holds the
+    serialized ``*Out`` payload of the latest history row for that control.
+    """
+    __tablename__ = "device_state"
+
+    user_email = Column(String, ForeignKey("users.email"), primary_key=True)
+    sound = Column(JSONB(none_as_null=True), nullable=True)
+    steam = Column(JSONB(none_as_null=True), nullable=True)
+    temp_tank = Column(JSONB(none_as_null=True), nullable=True)
+    water_pump = Column(JSONB(none_as_null=True), nullable=True)
+    nano_flicker = Column(JSONB(none_as_null=True), nullable=True)
+    led_color = Column(JSONB(none_as_null=True), nullable=True)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
@@ -0,0 +1,35 @@
+# app/models/email_outbox.py
+from sqlalchemy import Column, DateTime, Index, Integer, String, Text
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+import enum
+import uuid
+
+from app.db.base import Base
+
+
+class EmailStatus(str, enum.Enum):
+    pending = "Pending"
+    sent = "Sent"
+    failed = "Failed"
+
+
+class EmailOutbox(Base):
+    """Outgoing email, written in the same transaction as the change that
+    triggers it and delivered later by the outbox worker."""
+    __tablename__ = "email_outbox"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    recipient = Column(String(255), nullable=False)
+    subject = Column(String(255), nullable=False)
+    body = Column(Text, nullable=False)
+    status = Column(String(20), nullable=False, default=EmailStatus.pending.value)
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    last_error = Column(Text)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    sent_at = Column(DateTime(timezone=True))
+
+    __table_args__ = (
+        Index("ix_email_outbox_status_next_attempt_at", status, next_attempt_at),
+    )
@@ -1,6 +1,6 @@
 import uuid
 from app.db.base import Base
-from sqlalchemy import Column, DateTime, Float, String, ForeignKey
+from sqlalchemy import Column, DateTime, Float, ForeignKey, Index, String
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 
@@ -26,6 +26,10 @@ class Biofeedback(Base):
     created_by = Column(String, nullable=True)
     updated_by = Column(String, nullable=True)
 
+    __table_args__ = (
+        Index("ix_biofeedbacks_user_email_created_at", user_email, created_at.desc(), id.desc()),
+    )
+
 
 class BurnProgress(Base):
     __tablename__ = "burn_progresses"
@@ -51,6 +55,10 @@ class BurnProgress(Base):
     created_by = Column(String, nullable=True)
     updated_by = Column(String, nullable=True)
 
+    __table_args__ = (
+        Index("ix_burn_progresses_user_email_created_at", user_email, created_at.desc(), id.desc()),
+    )
+
 
 class BrainMonitoring(Base):
     __tablename__ = "brain_monitorings"
@@ -72,6 +80,10 @@ class BrainMonitoring(Base):
     created_by = Column(String, nullable=True)
     updated_by = Column(String, nullable=True)
 
+    __table_args__ = (
+        Index("ix_brain_monitorings_user_email_created_at", user_email, created_at.desc(), id.desc()),
+    )
+
 
 class HeartBrainSynchronicity(Base):
     __tablename__ = "heart_brain_synchronicities"
@@ -90,4 +102,8 @@ class HeartBrainSynchronicity(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     created_by = Column(String, nullable=True)
-    updated_by = Column(String, nullable=True)
\ No newline at end of file
+    updated_by = Column(String, nullable=True)
+
+    __table_args__ = (
+        Index("ix_heart_brain_synchronicities_user_email_created_at", user_email, created_at.desc(), id.desc()),
+    )
@@ -0,0 +1,51 @@
+# app/models/telemetry_rollup.py
+from sqlalchemy import BigInteger, Column, DateTime, Float, ForeignKey, Index, Integer, String, UniqueConstraint
+
+from app.db.base import Base
+
+
+class TelemetryRollupMinute(Base):
+    """Per-minute aggregate of one metric column of a raw telemetry table.
+
+    Raw readings older than RETENTION_RAW_DAYS are folded in here by the
+    retention worker and then deleted. ``family`` is the source table name;
+    sum and count (not avg) are stored so buckets can be merged exactly.
+    """
+    __tablename__ = "telemetry_rollups_minute"
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    family = Column(String(64), nullable=False)
+    user_email = Column(String, ForeignKey("users.email"), nullable=False)
+    bucket_start = Column(DateTime(timezone=True), nullable=False)
+    metric = Column(String(64), nullable=False)
+    min_value = Column(Float, nullable=True)
+    max_value = Column(Float, nullable=True)
+    sum_value = Column(Float, nullable=True)
+    value_count = Column(Integer, nullable=False, default=0)
+    samples = Column(Integer, nullable=False, default=0)  # readings in the bucket, with or without this metric
+
+    __table_args__ = (
+        UniqueConstraint(user_email, family, bucket_start, metric, name="uq_telemetry_rollups_minute_bucket"),
+        Index("ix_telemetry_rollups_minute_bucket_start", bucket_start),
+    )
+
+
+class TelemetryRollupHour(Base):
+    """Per-hour aggregate, compacted from minute rollups older than RETENTION_MINUTE_ROLLUP_DAYS"""
+    __tablename__ = "telemetry_rollups_hour"
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    family = Column(String(64), nullable=False)
+    user_email = Column(String, ForeignKey("users.email"), nullable=False)
+    bucket_start = Column(DateTime(timezone=True), nullable=False)
+    metric = Column(String(64), nullable=False)
+    min_value = Column(Float, nullable=True)
+    max_value = Column(Float, nullable=True)
+    sum_value = Column(Float, nullable=True)
+    value_count = Column(Integer, nullable=False, default=0)
+    samples = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        UniqueConstraint(user_email, family, bucket_start, metric, name="uq_telemetry_rollups_hour_bucket"),
+        Index("ix_telemetry_rollups_hour_bucket_start", bucket_start),
+    )
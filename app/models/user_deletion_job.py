@@ -0,0 +1,40 @@
+# app/models/user_deletion_job.py
+from sqlalchemy import Column, DateTime, Index, Integer, String, Text
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+import enum
+import uuid
+
+from app.db.base import Base
+
+
+class DeletionStatus(str, enum.Enum):
+    pending = "Pending"
+    running = "Running"
+    completed = "Completed"
+    failed = "Failed"
+
+
+class UserDeletionJob(Base):
+    """A requested user deletion, carried out in small chunks by the
+    user-deletion worker. Kept after completion as an audit record, so
+    it references the user by value rather than by foreign key."""
+    __tablename__ = "user_deletion_jobs"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    user_id = Column(UUID(as_uuid=True), nullable=False, index=True)
+    user_email = Column(String, nullable=False)
+    status = Column(String(20), nullable=False, default=DeletionStatus.pending.value)
+    current_table = Column(String(64))
+    rows_deleted = Column(Integer, nullable=False, default=0)
+    attempts = Column(Integer, nullable=False, default=0)  # failed steps in a row
+    next_attempt_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    last_error = Column(Text)
+    requested_by = Column(String)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    completed_at = Column(DateTime(timezone=True))
+
+    __table_args__ = (
+        Index("ix_user_deletion_jobs_status_next_attempt_at", status, next_attempt_at),
+    )
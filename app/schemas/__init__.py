@@ -17,7 +17,10 @@ from .health_monitoring import (
     BiofeedbackCreate, BiofeedbackUpdate, BiofeedbackOut,
     BurnProgressCreate, BurnProgressUpdate, BurnProgressOut,
     BrainMonitoringCreate, BrainMonitoringUpdate, BrainMonitoringOut,
-    HeartBrainSynchronicityCreate, HeartBrainSynchronicityUpdate, HeartBrainSynchronicityOut
+    HeartBrainSynchronicityCreate, HeartBrainSynchronicityUpdate, HeartBrainSynchronicityOut,
+    BiofeedbackBulkCreate, BurnProgressBulkCreate, BrainMonitoringBulkCreate,
+    HeartBrainSynchronicityBulkCreate, HealthMonitoringBulkOut,
+    SeriesBucket, HealthMonitoringSeriesOut
 )
 
 # News
@@ -1,8 +1,16 @@
 from datetime import datetime
+from enum import Enum
 from uuid import UUID
-from typing import Optional
+from typing import Dict, List, Optional
 
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, Field
+
+
+# Upper bound on readings accepted by a single bulk ingestion request
+MAX_BULK_READINGS = 1000
+
+# Upper bound on buckets returned by a single series query
+MAX_SERIES_BUCKETS = 10000
 
 
 # Base class for all health monitoring schemas
@@ -28,6 +36,54 @@ class HealthMonitoringOut(HealthMonitoringBase):
     model_config = {"from_attributes": True}
 
 
+class HealthMonitoringBulkItemOut(BaseModel):
+    id: UUID
+    created_at: datetime
+
+    model_config = {"from_attributes": True}
+
+
+class HealthMonitoringBulkOut(BaseModel):
+    inserted: int
+    items: List[HealthMonitoringBulkItemOut]
+
+
+# Downsampled history schemas
+class SeriesBucket(str, Enum):
+    one_second = "1s"
+    ten_seconds = "10s"
+    one_minute = "1m"
+    one_hour = "1h"
+
+
+SERIES_BUCKET_SECONDS = {
+    SeriesBucket.one_second: 1,
+    SeriesBucket.ten_seconds: 10,
+    SeriesBucket.one_minute: 60,
+    SeriesBucket.one_hour: 3600,
+}
+
+
+class MetricAggregate(BaseModel):
+    min: Optional[float] = None
+    max: Optional[float] = None
+    avg: Optional[float] = None
+    count: int
+
+
+class HealthMonitoringSeriesPoint(BaseModel):
+    bucket_start: datetime
+    count: int
+    metrics: Dict[str, MetricAggregate]
+
+
+class HealthMonitoringSeriesOut(BaseModel):
+    bucket: SeriesBucket
+    start: datetime
+    end: datetime
+    points: List[HealthMonitoringSeriesPoint]
+
+
 # Biofeedback schemas
 class BiofeedbackBase(HealthMonitoringBase):
     heart_rate: Optional[float] = None
@@ -65,6 +121,10 @@ class BiofeedbackOut(BiofeedbackBase, HealthMonitoringOut):
     pass
 
 
+class BiofeedbackBulkCreate(BaseModel):
+    readings: List[BiofeedbackCreate] = Field(..., min_length=1, max_length=MAX_BULK_READINGS)
+
+
 # BurnProgress schemas
 class BurnProgressBase(HealthMonitoringBase):
     wound_size_depth: Optional[float] = None
@@ -108,6 +168,10 @@ class BurnProgressOut(BurnProgressBase, HealthMonitoringOut):
     pass
 
 
+class BurnProgressBulkCreate(BaseModel):
+    readings: List[BurnProgressCreate] = Field(..., min_length=1, max_length=MAX_BULK_READINGS)
+
+
 # BrainMonitoring schemas
 class BrainMonitoringBase(HealthMonitoringBase):
     alpha_waves: Optional[float] = None
@@ -143,6 +207,10 @@ class BrainMonitoringOut(BrainMonitoringBase, HealthMonitoringOut):
     pass
 
 
+class BrainMonitoringBulkCreate(BaseModel):
+    readings: List[BrainMonitoringCreate] = Field(..., min_length=1, max_length=MAX_BULK_READINGS)
+
+
 # HeartBrainSynchronicity schemas
 class HeartBrainSynchronicityBase(HealthMonitoringBase):
     heart_rate_variability: Optional[float] = None
@@ -173,4 +241,8 @@ class HeartBrainSynchronicityUpdate(HealthMonitoringUpdate):
 
 
 class HeartBrainSynchronicityOut(HeartBrainSynchronicityBase, HealthMonitoringOut):
-    pass
\ No newline at end of file
+    pass
+
+
+class HeartBrainSynchronicityBulkCreate(BaseModel):
+    readings: List[HeartBrainSynchronicityCreate] = Field(..., min_length=1, max_length=MAX_BULK_READINGS)
@@ -1,4 +1,4 @@
-from datetime import date
+from datetime import date, datetime
 from enum import Enum
 from uuid import UUID
 from typing import Optional
@@ -116,4 +116,21 @@ class UserOut(BaseModel):
     alcohol_consumption: Optional[AlcoholConsumption] = None
     user_status: Optional[UserStatus] = None
 
-    model_config = {"from_attributes": True}
\ No newline at end of file
+    model_config = {"from_attributes": True}
+
+class UserDeletionJobOut(BaseModel):
+    id: UUID
+    user_id: UUID
+    user_email: EmailStr
+    status: str
+    current_table: Optional[str] = None
+    rows_deleted: int
+    attempts: int = 0
+    next_attempt_at: Optional[datetime] = None
+    last_error: Optional[str] = None
+    requested_by: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+
+    model_config = {"from_attributes": True}
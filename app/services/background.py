@@ -0,0 +1,43 @@
+import logging
+import threading
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+
+class PeriodicWorker:
+    """Call ``task`` on a daemon thread every ``interval`` seconds until stopped.
+
+    ``task`` returns how much work it did; while it keeps finding work it is
+    called again straight away, so a backlog drains without waiting a full
+    interval between batches. Exceptions are logged and the loop carries on.
+    """
+
+    def __init__(self, name: str, task: Callable[[], int], interval: float):
+        self.name = name
+        self.task = task
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 10):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout)
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                did_work = self.task()
+            except Exception:
+                logger.exception("%s failed", self.name)
+                did_work = 0
+            if not did_work:
+                self._stop.wait(self.interval)
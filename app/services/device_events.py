@@ -0,0 +1,60 @@
+import asyncio
+import threading
+from collections import defaultdict
+from typing import Dict, Set, Tuple
+
+# Events buffered per subscriber before the oldest ones are dropped
+SUBSCRIBER_QUEUE_SIZE = 100
+
+
+def _offer(queue: asyncio.Queue, event: dict):
+    # A slow subscriber only needs the most recent changes, so drop the oldest
+    if queue.full():
+        queue.get_nowait()
+    queue.put_nowait(event)
+
+
+class InProcessDeviceEventHub:
+    """Fan device-control changes out to the subscribers of this process.
+
+    ``publish`` is called by the crud layer right after a commit, usually from
+    a threadpool worker, so it hands each event to the subscriber's own event
+    loop with ``call_soon_threadsafe``. With several workers this hub only
+    reaches sockets connected to the same process; swap ``device_events`` for
+    an implementation with the same ``subscribe``/``unsubscribe``/``publish``
+    methods backed by Postgres LISTEN/NOTIFY.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers: Dict[str, Set[Tuple[asyncio.AbstractEventLoop, asyncio.Queue]]] = defaultdict(set)
+
+    def subscribe(self, user_email: str) -> asyncio.Queue:
+        """Register the calling coroutine's loop for a user's events"""
+        queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        with self._lock:
+            self._subscribers[user_email].add((asyncio.get_running_loop(), queue))
+        return queue
+
+    def unsubscribe(self, user_email: str, queue: asyncio.Queue):
+        with self._lock:
+            subscribers = self._subscribers.get(user_email)
+            if not subscribers:
+                return
+            subscribers.difference_update({entry for entry in subscribers if entry[1] is queue})
+            if not subscribers:
+                del self._subscribers[user_email]
+
+    def publish(self, user_email: str, event: dict):
+        """Deliver an event to every subscriber of ``user_email``; safe from any thread"""
+        with self._lock:
+            targets = list(self._subscribers.get(user_email, ()))
+        for loop, queue in targets:
+            try:
+                loop.call_soon_threadsafe(_offer, queue, event)
+            except RuntimeError:
+                # The subscriber's loop has shut down; its socket is gone too
+                self.unsubscribe(user_email, queue)
+
+
+device_events = InProcessDeviceEventHub()
@@ -1,15 +1,29 @@
+import logging
 import smtplib
+from datetime import datetime, timedelta, timezone
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
+
+from sqlalchemy.orm import Session
+
 from app.core.config import settings
+from app.db.base import SessionLocal
+from app.models import EmailOutbox, EmailStatus
+from app.services.background import PeriodicWorker
+
+logger = logging.getLogger(__name__)
+
+
+def queue_email(db: Session, recipient: str, subject: str, body: str) -> EmailOutbox:
+    """Add an email to the outbox. Nothing is committed here: the row is
+    written by the caller's commit, together with the change that caused it."""
+    email = EmailOutbox(recipient=recipient, subject=subject, body=body)
+    db.add(email)
+    return email
 
-def send_signup_notification(user_name: str, user_email: str):
-    """Send email notification to admin when a new user signs up"""
-    msg = MIMEMultipart()
-    msg["From"] = settings.EMAIL_SENDER
-    msg["To"] = settings.ADMIN_EMAIL
-    msg["Subject"] = "New User Registration - Action Required"
 
+def queue_signup_notification(db: Session, user_name: str, user_email: str) -> EmailOutbox:
+    """Queue the email telling the admin a new user has signed up"""
     body = f"""
     Hi Admin,
 
@@ -25,16 +39,100 @@ def send_signup_notification(user_name: str, user_email: str):
     Best regards,
     System Notification
     """
+    return queue_email(db, settings.ADMIN_EMAIL, "New User Registration - Action Required", body)
+
+
+class SMTPMailer:
+    """Keep one authenticated SMTP connection open across sends and
+    reconnect once if the server has dropped it."""
+
+    def __init__(self):
+        self._server = None
+
+    def _connect(self):
+        server = smtplib.SMTP(settings.SMTP_SERVER, settings.SMTP_PORT, timeout=settings.SMTP_TIMEOUT_SECONDS)
+        if settings.SMTP_STARTTLS:
+            server.starttls()
+        if settings.SMTP_LOGIN:
+            server.login(settings.EMAIL_SENDER, settings.EMAIL_PASSWORD)
+        return server
+
+    def send(self, recipient: str, subject: str, body: str):
+        msg = MIMEMultipart()
+        msg["From"] = settings.EMAIL_SENDER
+        msg["To"] = recipient
+        msg["Subject"] = subject
+        msg.attach(MIMEText(body, "plain"))
 
-    msg.attach(MIMEText(body, "plain"))
+        if self._server is None:
+            self._server = self._connect()
+        try:
+            self._server.sendmail(settings.EMAIL_SENDER, recipient, msg.as_string())
+        except OSError as e:
+            # SMTPException subclasses OSError; only a dropped connection is worth a reconnect.
+            # Refused recipients or rejected data go back to the outbox backoff.
+            if isinstance(e, smtplib.SMTPException) and not isinstance(e, smtplib.SMTPServerDisconnected):
+                raise
+            self.close()
+            self._server = self._connect()
+            self._server.sendmail(settings.EMAIL_SENDER, recipient, msg.as_string())
 
+    def close(self):
+        if self._server is None:
+            return
+        try:
+            self._server.quit()
+        except (smtplib.SMTPException, OSError):
+            pass
+        self._server = None
+
+
+def retry_delay(attempts: int) -> timedelta:
+    """Exponential backoff after ``attempts`` failed deliveries, capped at one hour"""
+    return timedelta(seconds=min(settings.EMAIL_OUTBOX_BACKOFF_SECONDS * 2 ** (attempts - 1), 3600))
+
+
+def deliver_pending_emails(mailer: SMTPMailer) -> int:
+    """Send one batch of due outbox emails; returns how many were attempted"""
+    db = SessionLocal()
     try:
-        server = smtplib.SMTP(settings.SMTP_SERVER, settings.SMTP_PORT)
-        server.starttls()
-        server.login(settings.EMAIL_SENDER, settings.EMAIL_PASSWORD)
-        server.sendmail(settings.EMAIL_SENDER, settings.ADMIN_EMAIL, msg.as_string())
-        server.quit()
-        return True
-    except Exception as e:
-        print(f"Error sending signup notification email: {e}")
-        return False
\ No newline at end of file
+        # SKIP LOCKED lets several workers drain the outbox without sending twice
+        batch = (
+            db.query(EmailOutbox)
+            .filter(EmailOutbox.status == EmailStatus.pending.value, EmailOutbox.next_attempt_at <= datetime.now(timezone.utc))
+            .order_by(EmailOutbox.next_attempt_at)
+            .limit(settings.EMAIL_OUTBOX_BATCH_SIZE)
+            .with_for_update(skip_locked=True)
+            .all()
+        )
+        for email in batch:
+            try:
+                mailer.send(email.recipient, email.subject, email.body)
+                email.status = EmailStatus.sent.value
+                email.sent_at = datetime.now(timezone.utc)
+            except Exception as e:
+                mailer.close()
+                email.attempts += 1
+                email.last_error = str(e)
+                if email.attempts >= settings.EMAIL_OUTBOX_MAX_ATTEMPTS:
+                    email.status = EmailStatus.failed.value
+                    logger.error("Giving up on email %s to %s: %s", email.id, email.recipient, e)
+                else:
+                    email.next_attempt_at = datetime.now(timezone.utc) + retry_delay(email.attempts)
+        db.commit()
+        return len(batch)
+    finally:
+        db.close()
+
+
+class EmailOutboxWorker(PeriodicWorker):
+    def __init__(self):
+        self.mailer = SMTPMailer()
+        super().__init__("email-outbox", lambda: deliver_pending_emails(self.mailer), settings.EMAIL_OUTBOX_POLL_SECONDS)
+
+    def stop(self, timeout: float = 10):
+        super().stop(timeout)
+        self.mailer.close()
+
+
+email_outbox_worker = EmailOutboxWorker()
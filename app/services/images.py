@@ -0,0 +1,167 @@
+import asyncio
+import json
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Optional
+
+from PIL import Image, ImageOps
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Widths generated for every uploaded image; narrower originals skip the larger ones
+VARIANT_WIDTHS = (320, 640, 1280)
+JPEG_QUALITY = 85
+WEBP_QUALITY = 80
+
+# Image.info entries that Pillow writes back out on save and that can carry camera or location details
+METADATA_INFO_KEYS = ("exif", "xmp", "XML:com.adobe.xmp", "comment")
+
+# Formats Pillow should write each source extension back as
+SAVE_FORMATS = {".jpg": "JPEG", ".jpeg": "JPEG", ".png": "PNG", ".webp": "WEBP", ".gif": "GIF"}
+
+
+def manifest_path(image_path: Path) -> Path:
+    return image_path.with_name(f"{image_path.stem}.variants.json")
+
+
+def variant_path(image_path: Path, width: Optional[int], extension: str) -> Path:
+    size = f".w{width}" if width else ""
+    return image_path.with_name(f"{image_path.stem}{size}{extension}")
+
+
+def _save(img: Image.Image, path: Path, fmt: str):
+    # No exif/icc/pnginfo arguments are passed, so metadata is not carried over
+    options = {"optimize": True}
+    if fmt == "JPEG":
+        options["quality"] = JPEG_QUALITY
+        options["progressive"] = True
+        if img.mode not in ("RGB", "L"):
+            img = img.convert("RGB")
+    elif fmt == "WEBP":
+        options = {"quality": WEBP_QUALITY, "method": 4}
+    tmp = path.with_name(f".{path.name}.part")
+    img.save(tmp, fmt, **options)
+    os.replace(tmp, path)
+
+
+def strip_metadata(image_path: str, extension: str) -> None:
+    """
+    Re-encode an upload in place as ``extension``'s format without its EXIF/XMP
+    metadata (camera, GPS), applying the EXIF orientation first so it still
+    displays upright. Raises ValueError if Pillow cannot read it as an image.
+    """
+    path = Path(image_path)
+    fmt = SAVE_FORMATS.get(extension, "PNG")
+    try:
+        source = Image.open(path)
+        source.load()
+    except (OSError, Image.DecompressionBombError) as e:
+        raise ValueError(f"Not a readable image: {e}")
+    with source:
+        if getattr(source, "is_animated", False):
+            img = source
+        else:
+            img = ImageOps.exif_transpose(source)
+        for key in METADATA_INFO_KEYS:
+            img.info.pop(key, None)
+        if img is source:
+            tmp = path.with_name(f".{path.name}.strip")
+            img.save(tmp, fmt, save_all=True)
+            os.replace(tmp, path)
+        else:
+            _save(img, path, fmt)
+
+
+def generate_variants(image_path: str) -> dict:
+    """
+    Write the resized and WebP derivatives of an uploaded image plus a
+    ``<stem>.variants.json`` manifest next to it, and return the manifest.
+    CPU-bound, so it runs in the process pool.
+    """
+    path = Path(image_path)
+    url_prefix = "/uploads/"
+    with Image.open(path) as source:
+        animated = getattr(source, "is_animated", False)
+        img = ImageOps.exif_transpose(source)
+        width, height = img.size
+        manifest = {"original": url_prefix + path.name, "width": width, "height": height, "variants": []}
+
+        if not animated:
+            fmt = SAVE_FORMATS.get(path.suffix.lower(), "PNG")
+            if img.mode == "P":
+                img = img.convert("RGBA")
+            sizes = [w for w in VARIANT_WIDTHS if w < width] + [None]
+            for target in sizes:
+                resized = img if target is None else img.resize((target, round(height * target / width)), Image.LANCZOS)
+                # A WebP source needs no WebP twin, and the original was already stripped on upload
+                outputs = [] if target is None else [(path.suffix.lower(), fmt)]
+                if fmt != "WEBP":
+                    outputs.append((".webp", "WEBP"))
+                for extension, out_fmt in outputs:
+                    out = variant_path(path, target, extension)
+                    _save(resized, out, out_fmt)
+                    manifest["variants"].append({
+                        "url": url_prefix + out.name,
+                        "width": target or width,
+                        "format": out_fmt.lower(),
+                    })
+
+    tmp = manifest_path(path).with_name(f".{manifest_path(path).name}.part")
+    tmp.write_text(json.dumps(manifest))
+    os.replace(tmp, manifest_path(path))
+    return manifest
+
+
+def load_variants(image_path: Path) -> Optional[dict]:
+    """Manifest written by generate_variants, or None if it has not run (yet)"""
+    try:
+        return json.loads(manifest_path(image_path).read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def variant_files(image_path: Path) -> list:
+    """Every derivative file of ``image_path`` plus its manifest, whether or not they exist"""
+    manifest = load_variants(image_path) or {"variants": []}
+    return [image_path.with_name(v["url"].rsplit("/", 1)[-1]) for v in manifest["variants"]] + [manifest_path(image_path)]
+
+
+_executor = None
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    global _executor
+    if _executor is None:
+        # spawn, not fork: the server process has threads (threadpool, workers)
+        _executor = ProcessPoolExecutor(
+            max_workers=settings.IMAGE_PROCESS_WORKERS,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _executor
+
+
+def _log_failure(future):
+    if not future.cancelled() and future.exception():
+        logger.error("Image variant generation failed: %s", future.exception())
+
+
+def schedule_variants(image_path: Path):
+    """Queue derivative generation for an upload without waiting for it"""
+    _get_executor().submit(generate_variants, str(image_path.resolve())).add_done_callback(_log_failure)
+
+
+async def strip_metadata_in_pool(image_path: Path, extension: str):
+    """Run ``strip_metadata`` in the process pool and wait for it"""
+    await asyncio.wrap_future(_get_executor().submit(strip_metadata, str(image_path), extension))
+
+
+def shutdown_image_pool():
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
@@ -0,0 +1,103 @@
+import hashlib
+import json
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+from fastapi import HTTPException, Request, Response
+from fastapi.responses import FileResponse
+
+from app.core.conditional import etag_matches
+from app.services.images import SAVE_FORMATS, manifest_path
+from app.services.uploads import UPLOAD_DIR
+
+# Upload names are random UUIDs (or content hashes), optionally with a ".w<width>"
+# variant suffix; the bytes behind such a name never change.
+IMMUTABLE_NAME = re.compile(
+    r"^(?:[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}|[0-9a-f]{64})(?:\.w\d+)?\.[a-z0-9]+$"
+)
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+# Anything else may be replaced in place, so caches must revalidate
+MUTABLE_CACHE_CONTROL = "public, no-cache"
+
+
+@lru_cache(maxsize=1024)
+def _read_manifest(path: str, mtime_ns: int) -> Optional[dict]:
+    # Keyed on mtime so a rewritten manifest is picked up
+    try:
+        return json.loads(Path(path).read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def _load_manifest(image_path: Path) -> Optional[dict]:
+    path = manifest_path(image_path)
+    try:
+        return _read_manifest(str(path), path.stat().st_mtime_ns)
+    except OSError:
+        return None
+
+
+def choose_representation(image_path: Path, manifest: dict, width: Optional[int], accepts_webp: bool) -> Path:
+    """
+    Pick the file to send for a request of ``image_path``: the narrowest
+    variant at least ``width`` wide (or the full-size image), in WebP when
+    the client accepts it and such a variant exists.
+    """
+    original_format = SAVE_FORMATS.get(image_path.suffix.lower(), "").lower()
+    candidates = manifest["variants"] + [{"url": image_path.name, "width": manifest["width"], "format": original_format}]
+    formats = {original_format, "webp"} if accepts_webp else {original_format}
+    candidates = [c for c in candidates if c["format"] in formats]
+    if width:
+        wide_enough = [c for c in candidates if c["width"] >= width]
+        target = min(c["width"] for c in wide_enough) if wide_enough else max(c["width"] for c in candidates)
+    else:
+        target = manifest["width"]
+    at_target = [c for c in candidates if c["width"] == target]
+    # WebP first when allowed, it is the smaller encoding
+    chosen = sorted(at_target, key=lambda c: c["format"] != "webp")[0]
+    return image_path.with_name(chosen["url"].rsplit("/", 1)[-1])
+
+
+def _etag(path: Path, stat) -> str:
+    # Strong validator that differs for every representation. An immutable name already
+    # identifies its bytes, and its mtime is bumped whenever the same content is uploaded
+    # again, so only files that can be rewritten in place include it.
+    base = f"{path.name}:{stat.st_size}"
+    if not IMMUTABLE_NAME.match(path.name):
+        base += f":{stat.st_mtime_ns}"
+    return f'"{hashlib.md5(base.encode(), usedforsecurity=False).hexdigest()}"'
+
+
+def serve_upload(request: Request, filename: str, width: Optional[int] = None) -> Response:
+    """
+    Serve a file from UPLOAD_DIR with long-lived caching for immutable names,
+    a strong ETag answered with 304 on If-None-Match, byte ranges (via
+    FileResponse), and WebP / resized variants when available.
+    """
+    if filename.startswith(".") or "/" in filename or "\\" in filename:
+        raise HTTPException(status_code=404, detail="File not found")
+    path = UPLOAD_DIR / filename
+    if not path.is_file():
+        raise HTTPException(status_code=404, detail="File not found")
+
+    headers = {}
+    manifest = _load_manifest(path)
+    if manifest and manifest.get("variants"):
+        accepts_webp = "image/webp" in request.headers.get("accept", "")
+        path = choose_representation(path, manifest, width, accepts_webp)
+        if any(v["format"] == "webp" for v in manifest["variants"]):
+            headers["Vary"] = "Accept"
+        if not path.is_file():
+            path = UPLOAD_DIR / filename
+
+    stat = path.stat()
+    headers["ETag"] = _etag(path, stat)
+    headers["Cache-Control"] = IMMUTABLE_CACHE_CONTROL if IMMUTABLE_NAME.match(filename) else MUTABLE_CACHE_CONTROL
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and etag_matches(if_none_match, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+
+    return FileResponse(path, headers=headers, stat_result=stat)
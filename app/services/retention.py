@@ -0,0 +1,177 @@
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from sqlalchemy import Float, and_, delete, exists, func, literal, select, union_all
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from app.core.config import settings
+from app.db.base import SessionLocal
+from app.models import (
+    Biofeedback, BrainMonitoring, HeartBrainSynchronicity,
+    Sound, Steam, TempTank, WaterPump, NanoFlicker, LedColor,
+    TelemetryRollupMinute, TelemetryRollupHour,
+)
+from app.services.background import PeriodicWorker
+
+# Raw tables compacted into rollups. burn_progresses is a clinical record and is kept as is.
+ROLLUP_MODELS = (Biofeedback, BrainMonitoring, HeartBrainSynchronicity)
+
+# Device-control history has nothing to average; old rows are only deleted
+CONTROL_MODELS = (Sound, Steam, TempTank, WaterPump, NanoFlicker, LedColor)
+
+ROLLUP_COLUMNS = ("family", "user_email", "bucket_start", "metric", "min_value", "max_value", "sum_value", "value_count", "samples")
+
+
+def retention_cutoff(days: int) -> Optional[datetime]:
+    """Oldest timestamp kept by a ``days`` policy, or None when the policy keeps everything"""
+    if days <= 0:
+        return None
+    return datetime.now(timezone.utc) - timedelta(days=days)
+
+
+def raw_retention_cutoff() -> Optional[datetime]:
+    return retention_cutoff(settings.RETENTION_RAW_DAYS)
+
+
+def metric_columns(model) -> list:
+    return [column for column in model.__table__.columns if isinstance(column.type, Float)]
+
+
+def _oldest_first(table, time_column, cutoff: datetime, batch_size: int):
+    # SKIP LOCKED lets workers in several processes take disjoint batches
+    return (
+        select(table.c.id)
+        .where(time_column < cutoff)
+        .order_by(time_column)
+        .limit(batch_size)
+        .with_for_update(skip_locked=True)
+    )
+
+
+def _merge_into(rollup, rows):
+    """INSERT ... SELECT of aggregated buckets that folds into rows already present"""
+    stmt = pg_insert(rollup).from_select(list(ROLLUP_COLUMNS), rows)
+    target, new = rollup.__table__.c, stmt.excluded
+    return stmt.on_conflict_do_update(
+        index_elements=[target.user_email, target.family, target.bucket_start, target.metric],
+        set_={
+            "min_value": func.least(target.min_value, new.min_value),
+            "max_value": func.greatest(target.max_value, new.max_value),
+            "sum_value": func.coalesce(target.sum_value, 0) + func.coalesce(new.sum_value, 0),
+            "value_count": target.value_count + new.value_count,
+            "samples": target.samples + new.samples,
+        },
+    )
+
+
+def compact_raw_batch(db, model, cutoff: datetime, batch_size: int) -> int:
+    """
+    Move up to ``batch_size`` raw readings older than ``cutoff`` into the
+    minute rollups: one statement deletes them (RETURNING) and upserts their
+    per-minute min/max/sum/count for every metric column, so a reading is
+    always either raw or rolled up, never both or neither. Returns the
+    number of rollup rows written, 0 when nothing was old enough.
+    """
+    table = model.__table__
+    metrics = metric_columns(model)
+    moved = (
+        delete(table)
+        .where(table.c.id.in_(_oldest_first(table, table.c.created_at, cutoff, batch_size)))
+        .returning(table.c.user_email, table.c.created_at, *metrics)
+        .cte("moved")
+    )
+    bucket = func.date_trunc("minute", moved.c.created_at)
+    readings = union_all(*[
+        select(moved.c.user_email, bucket.label("bucket_start"), literal(column.name).label("metric"), moved.c[column.name].label("value"))
+        for column in metrics
+    ]).subquery("readings")
+    rows = (
+        select(
+            literal(table.name), readings.c.user_email, readings.c.bucket_start, readings.c.metric,
+            func.min(readings.c.value), func.max(readings.c.value), func.sum(readings.c.value),
+            func.count(readings.c.value), func.count(),
+        )
+        .group_by(readings.c.user_email, readings.c.bucket_start, readings.c.metric)
+    )
+    # A data-modifying CTE has to sit at the top of the statement
+    result = db.execute(_merge_into(TelemetryRollupMinute, rows).add_cte(moved))
+    db.commit()
+    return result.rowcount
+
+
+def compact_minute_batch(db, cutoff: datetime, batch_size: int) -> int:
+    """Fold up to ``batch_size`` minute rollups older than ``cutoff`` into the hour rollups"""
+    table = TelemetryRollupMinute.__table__
+    moved = (
+        delete(table)
+        .where(table.c.id.in_(_oldest_first(table, table.c.bucket_start, cutoff, batch_size)))
+        .returning(*[table.c[name] for name in ROLLUP_COLUMNS])
+        .cte("moved")
+    )
+    bucket = func.date_trunc("hour", moved.c.bucket_start)
+    rows = (
+        select(
+            moved.c.family, moved.c.user_email, bucket, moved.c.metric,
+            func.min(moved.c.min_value), func.max(moved.c.max_value), func.sum(moved.c.sum_value),
+            func.sum(moved.c.value_count), func.sum(moved.c.samples),
+        )
+        .group_by(moved.c.family, moved.c.user_email, bucket, moved.c.metric)
+    )
+    result = db.execute(_merge_into(TelemetryRollupHour, rows).add_cte(moved))
+    db.commit()
+    return result.rowcount
+
+
+def _delete_batch(db, model, time_column, cutoff: datetime, batch_size: int, *conditions) -> int:
+    table = model.__table__
+    ids = _oldest_first(table, time_column, cutoff, batch_size).where(*conditions)
+    deleted = db.execute(delete(table).where(table.c.id.in_(ids))).rowcount
+    db.commit()
+    return deleted
+
+
+def trim_control_batch(db, model, cutoff: datetime, batch_size: int) -> int:
+    """Delete control history older than ``cutoff``, except each user's newest row"""
+    newer = model.__table__.alias("newer")
+    table = model.__table__
+    has_newer = exists().where(and_(
+        newer.c.user_email == table.c.user_email,
+        newer.c.created_at > table.c.created_at,
+    ))
+    return _delete_batch(db, model, table.c.created_at, cutoff, batch_size, has_newer)
+
+
+def run_retention_step() -> int:
+    """
+    One batch of the first retention stage that has work left, in its own
+    transaction. Returns 0 once everything is within policy, so the worker
+    drains a backlog batch after batch and then sleeps.
+    """
+    batch_size = settings.RETENTION_BATCH_SIZE
+    raw_cutoff = raw_retention_cutoff()
+    minute_cutoff = retention_cutoff(settings.RETENTION_MINUTE_ROLLUP_DAYS)
+    hour_cutoff = retention_cutoff(settings.RETENTION_HOUR_ROLLUP_DAYS)
+    control_cutoff = retention_cutoff(settings.RETENTION_CONTROL_DAYS)
+    db = SessionLocal()
+    try:
+        if raw_cutoff:
+            for model in ROLLUP_MODELS:
+                if compact_raw_batch(db, model, raw_cutoff, batch_size):
+                    return 1
+        if minute_cutoff:
+            if compact_minute_batch(db, minute_cutoff, batch_size):
+                return 1
+        if hour_cutoff:
+            hours = TelemetryRollupHour.__table__
+            if _delete_batch(db, TelemetryRollupHour, hours.c.bucket_start, hour_cutoff, batch_size):
+                return 1
+        if control_cutoff:
+            for model in CONTROL_MODELS:
+                if trim_control_batch(db, model, control_cutoff, batch_size):
+                    return 1
+        return 0
+    finally:
+        db.close()
+
+
+retention_worker = PeriodicWorker("telemetry-retention", run_retention_step, settings.RETENTION_INTERVAL_SECONDS)
@@ -0,0 +1,189 @@
+import hashlib
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional
+
+from fastapi import HTTPException, UploadFile
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.base import SessionLocal
+from app.models import About, AdminHub, LiveSession, News
+from app.services.background import PeriodicWorker
+from app.services.images import manifest_path, schedule_variants, strip_metadata_in_pool, variant_files
+
+# Create uploads directory if it doesn't exist
+UPLOAD_DIR = Path("uploads")
+UPLOAD_DIR.mkdir(exist_ok=True)
+
+# Allowed file extensions
+ALLOWED_EXTENSIONS = {".jpg", ".jpeg", ".png", ".gif", ".webp"}
+
+# Spellings of the same format share one stored file
+EXTENSION_ALIASES = {".jpeg": ".jpg"}
+
+MAX_UPLOAD_BYTES = 5 * 1024 * 1024  # 5MB
+# Whole multipart request: the file plus room for the framing and the other form fields
+MAX_UPLOAD_REQUEST_BYTES = MAX_UPLOAD_BYTES + 1024 * 1024
+UPLOAD_CHUNK_SIZE = 256 * 1024
+
+# Every column that can hold an /uploads/... URL; the orphan sweeper keeps what they reference
+UPLOAD_REFERENCE_COLUMNS = (
+    AdminHub.image_url,
+    News.image_url,
+    About.image_url,
+    About.image_url_2,
+    LiveSession.image_url,
+)
+
+
+def is_allowed_file(filename: str) -> bool:
+    """Check if file extension is allowed"""
+    return Path(filename).suffix.lower() in ALLOWED_EXTENSIONS
+
+
+def _too_large() -> HTTPException:
+    return HTTPException(status_code=400, detail="File size too large. Maximum 5MB allowed")
+
+
+def _reuse_existing(tmp, destination: Path) -> bool:
+    """Drop the temp file if identical content is already stored at ``destination``"""
+    if not destination.exists():
+        return False
+    _discard(tmp)
+    # Restart the orphan grace period: the caller is about to reference it again
+    os.utime(destination)
+    return True
+
+
+def _discard(tmp):
+    tmp.close()
+    try:
+        os.remove(tmp.name)
+    except OSError:
+        pass
+
+
+async def save_upload(file: UploadFile) -> str:
+    """
+    Validate an uploaded image and store it in UPLOAD_DIR; returns its URL path.
+    By the time this runs Starlette has already spooled the multipart body, so
+    what the server accepts is bounded earlier, by UploadLimitMiddleware at
+    MAX_UPLOAD_REQUEST_BYTES. Here the file itself is held to MAX_UPLOAD_BYTES
+    while it is copied in UPLOAD_CHUNK_SIZE chunks to a temp file beside the
+    destination. Disk I/O runs in the threadpool, and the final os.replace
+    means a file under /uploads is always complete.
+
+    Before it is stored the image is re-encoded without its EXIF/XMP metadata,
+    so camera and GPS details are never served. Files are named by the
+    SHA-256 of the uploaded bytes: uploading bytes that are already stored
+    returns the existing URL and writes nothing. Because one file can back
+    several records, uploads are never deleted directly;
+    ``sweep_orphaned_uploads`` removes the ones no record points to.
+    """
+    if not file.filename:
+        raise HTTPException(status_code=400, detail="No file provided")
+
+    if not is_allowed_file(file.filename):
+        raise HTTPException(
+            status_code=400,
+            detail=f"File type not allowed. Allowed types: {', '.join(ALLOWED_EXTENSIONS)}"
+        )
+
+    # The multipart parser already knows the file's size; reject before copying anything
+    if file.size is not None and file.size > MAX_UPLOAD_BYTES:
+        raise _too_large()
+
+    tmp = await run_in_threadpool(tempfile.NamedTemporaryFile, dir=UPLOAD_DIR, prefix=".upload-", suffix=".part", delete=False)
+    try:
+        written = 0
+        digest = hashlib.sha256()
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            written += len(chunk)
+            if written > MAX_UPLOAD_BYTES:
+                raise _too_large()
+            digest.update(chunk)
+            await run_in_threadpool(tmp.write, chunk)
+
+        extension = Path(file.filename).suffix.lower()
+        extension = EXTENSION_ALIASES.get(extension, extension)
+        unique_filename = f"{digest.hexdigest()}{extension}"
+        destination = UPLOAD_DIR / unique_filename
+        created = not await run_in_threadpool(_reuse_existing, tmp, destination)
+        if created:
+            await run_in_threadpool(tmp.close)
+            try:
+                await strip_metadata_in_pool(Path(tmp.name), extension)
+            except ValueError:
+                raise HTTPException(status_code=400, detail="File is not a valid image")
+            await run_in_threadpool(os.replace, tmp.name, destination)
+    except HTTPException:
+        await run_in_threadpool(_discard, tmp)
+        raise
+    except Exception as e:
+        await run_in_threadpool(_discard, tmp)
+        raise HTTPException(status_code=500, detail=f"Failed to save file: {str(e)}")
+    except BaseException:
+        # Request cancelled mid-copy: clean up without awaiting
+        _discard(tmp)
+        raise
+
+    if created or not manifest_path(UPLOAD_DIR / unique_filename).exists():
+        # Resized and WebP variants are produced in the background
+        schedule_variants(UPLOAD_DIR / unique_filename)
+    return f"/uploads/{unique_filename}"
+
+
+def referenced_upload_names(db: Session) -> set:
+    """Names of the files in UPLOAD_DIR that some record points to"""
+    names = set()
+    for column in UPLOAD_REFERENCE_COLUMNS:
+        for (url,) in db.query(column).filter(column.like("%/uploads/%")).distinct():
+            names.add(url.rsplit("/uploads/", 1)[-1].split("?", 1)[0])
+    return names
+
+
+def sweep_orphaned_uploads(db: Session, grace_seconds: Optional[int] = None) -> dict:
+    """
+    Delete uploads (with their variants) that no record references. Files
+    modified within ``grace_seconds`` are kept, since an upload is made
+    before the record that will point to it is saved.
+    """
+    grace_seconds = settings.UPLOAD_ORPHAN_GRACE_SECONDS if grace_seconds is None else grace_seconds
+    keep = set()
+    for name in referenced_upload_names(db):
+        path = UPLOAD_DIR / name
+        keep.add(path.name)
+        keep.update(p.name for p in variant_files(path))
+
+    cutoff = time.time() - grace_seconds
+    deleted = kept = 0
+    for path in UPLOAD_DIR.iterdir():
+        if not path.is_file():
+            continue
+        try:
+            if path.name in keep or path.stat().st_mtime > cutoff:
+                kept += 1
+                continue
+            # Orphans and temp files left behind by interrupted uploads
+            os.remove(path)
+            deleted += 1
+        except OSError:
+            pass  # Removed concurrently; nothing to do
+    return {"deleted": deleted, "kept": kept}
+
+
+def _sweep_task() -> int:
+    db = SessionLocal()
+    try:
+        sweep_orphaned_uploads(db)
+    finally:
+        db.close()
+    # One pass per interval is enough
+    return 0
+
+
+upload_sweeper = PeriodicWorker("upload-sweeper", _sweep_task, settings.UPLOAD_SWEEP_INTERVAL_SECONDS)
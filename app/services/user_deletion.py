@@ -0,0 +1,110 @@
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.cache import user_cache
+from app.core.config import settings
+from app.db.base import SessionLocal
+from app.models import (
+    User, UserDeletionJob, DeletionStatus, Sound, Steam, TempTank, WaterPump, NanoFlicker, LedColor, DeviceState,
+    Biofeedback, BurnProgress, BrainMonitoring, HeartBrainSynchronicity, TelemetryRollupMinute, TelemetryRollupHour,
+)
+from app.services.background import PeriodicWorker
+
+logger = logging.getLogger(__name__)
+
+# Every table holding rows keyed by a user's email, emptied in this order before the user row goes
+USER_DATA_MODELS = (
+    Sound, Steam, TempTank, WaterPump, NanoFlicker, LedColor,
+    Biofeedback, BurnProgress, BrainMonitoring, HeartBrainSynchronicity,
+    TelemetryRollupMinute, TelemetryRollupHour,
+)
+
+
+def _delete_chunk(db: Session, model, user_email: str, chunk_size: int) -> int:
+    ids = select(model.id).where(model.user_email == user_email).limit(chunk_size).scalar_subquery()
+    return db.query(model).filter(model.id.in_(ids)).delete(synchronize_session=False)
+
+
+def _finish(db: Session, job: UserDeletionJob) -> None:
+    # Readings that arrived after their table was emptied are few; take them with the user row
+    for model in (*USER_DATA_MODELS, DeviceState):
+        job.rows_deleted += db.query(model).filter(model.user_email == job.user_email).delete(synchronize_session=False)
+    db.query(User).filter(User.id == job.user_id).delete(synchronize_session=False)
+    job.status = DeletionStatus.completed.value
+    job.current_table = None
+    job.completed_at = datetime.now(timezone.utc)
+
+
+def retry_delay(attempts: int) -> timedelta:
+    """Exponential backoff after ``attempts`` failed steps in a row, capped at one hour"""
+    return timedelta(seconds=min(settings.USER_DELETION_BACKOFF_SECONDS * 2 ** (attempts - 1), 3600))
+
+
+def _record_failure(db: Session, job_id, user_email: str, error: Exception) -> None:
+    job = db.query(UserDeletionJob).filter(UserDeletionJob.id == job_id).with_for_update().one()
+    job.attempts += 1
+    job.last_error = str(error)
+    if job.attempts >= settings.USER_DELETION_MAX_ATTEMPTS:
+        job.status = DeletionStatus.failed.value
+        logger.error("Giving up on deleting user %s after %d attempts", user_email, job.attempts)
+    else:
+        # Back off, and let the other due jobs go first meanwhile
+        job.status = DeletionStatus.pending.value
+        job.next_attempt_at = datetime.now(timezone.utc) + retry_delay(job.attempts)
+    db.commit()
+
+
+def run_user_deletion_step(chunk_size: Optional[int] = None) -> int:
+    """
+    Advance the due deletion job with the earliest next attempt by one chunk,
+    in its own short transaction: at most ``chunk_size`` rows of one table, or
+    the final removal of the user once their tables are empty. A failing step
+    is retried with backoff and the job is marked Failed after
+    USER_DELETION_MAX_ATTEMPTS in a row. Returns how many rows went (or 1 for
+    a finished job), 0 when there is nothing to do.
+    """
+    chunk_size = chunk_size or settings.USER_DELETION_CHUNK_SIZE
+    db = SessionLocal()
+    try:
+        # SKIP LOCKED keeps workers in several processes off the same job
+        job = (
+            db.query(UserDeletionJob)
+            .filter(
+                UserDeletionJob.status.in_([DeletionStatus.pending.value, DeletionStatus.running.value]),
+                UserDeletionJob.next_attempt_at <= datetime.now(timezone.utc),
+            )
+            .order_by(UserDeletionJob.next_attempt_at)
+            .with_for_update(skip_locked=True)
+            .first()
+        )
+        if job is None:
+            return 0
+        job_id, user_email = job.id, job.user_email
+        try:
+            job.status = DeletionStatus.running.value
+            job.attempts = 0
+            for model in USER_DATA_MODELS:
+                deleted = _delete_chunk(db, model, job.user_email, chunk_size)
+                if deleted:
+                    job.current_table = model.__tablename__
+                    job.rows_deleted += deleted
+                    db.commit()
+                    return deleted
+            _finish(db, job)
+            db.commit()
+            user_cache.invalidate(user_email)
+            return 1
+        except Exception as e:
+            db.rollback()
+            logger.exception("Deleting user %s failed", user_email)
+            _record_failure(db, job_id, user_email, e)
+            return 0
+    finally:
+        db.close()
+
+
+user_deletion_worker = PeriodicWorker("user-deletion", run_user_deletion_step, settings.USER_DELETION_POLL_SECONDS)
@@ -3,27 +3,23 @@ from app.core.security import (authenticate_user, create_access_token,
 from app.crud import user as user_crud
 from app.models import User
 from app.schemas import UserCreate
-from app.services.email_service import send_signup_notification
+from app.services.email_service import queue_signup_notification
 from fastapi import HTTPException
+from typing import Optional
 from sqlalchemy.orm import Session
 
 
-def handle_signup(user_data: UserCreate, db: Session) -> User:
+def handle_signup(user_data: UserCreate, db: Session, hashed_password: Optional[str] = None) -> User:
    
 
     existing_user = user_crud.get_user_by_email(db, user_data.email)
     if existing_user:
         raise HTTPException(status_code=400, detail="Email already registered")
 
-    new_user = user_crud.create_user(db, user_data)
-    
-    # Send email notification to admin
-    try:
-        send_signup_notification(new_user.name, new_user.email)
-    except Exception as e:
-        print(f"Failed to send signup notification email: {e}")
-        # Don't raise exception here to avoid breaking signup process
-   
+    # The admin notification goes into the outbox and is committed by
+    # create_user together with the user; the outbox worker sends it.
+    queue_signup_notification(db, user_data.full_name, user_data.email)
+    new_user = user_crud.create_user(db, user_data, hashed_password)
     return new_user
 
 
@@ -64,5 +60,7 @@ def handle_token_refresh(refresh_token: str, db: Session) -> dict:
 
 
 def handle_logout(user: User, db: Session):
-    user_crud.set_refresh_token(user, db, None)
+    db_user = user_crud.get_user_by_email(db, user.email)
+    if db_user:
+        user_crud.set_refresh_token(db, db_user, None)
     return {"message": "Successfully logged out"}
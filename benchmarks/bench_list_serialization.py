@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the list-endpoint serialization fast path.
+
+Builds N transient Biofeedback rows (no database needed) and times turning
+them into a response body two ways:
+
+  * pydantic: what FastAPI does for ``response_model=List[BiofeedbackOut]``,
+    i.e. validate every ORM object into the schema, dump it in JSON mode
+    and encode with the stdlib ``json`` module (JSONResponse);
+  * fast path: ``rows_response`` from app.core.serialization, which copies
+    the schema fields straight off the rows and encodes with orjson.
+
+Both bodies are decoded and compared before timing, so the speedup is only
+reported for identical output.
+
+    DATABASE_URL=postgresql://u:p@localhost/db python benchmarks/bench_list_serialization.py --rows 10000
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from random import Random
+from typing import List
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+
+from app.core.serialization import rows_response
+from app.models import Biofeedback
+from app.schemas import BiofeedbackOut
+
+
+def make_rows(count: int) -> list:
+    rng = Random(42)
+    now = datetime.now(timezone.utc)
+    return [
+        Biofeedback(
+            id=uuid.uuid4(),
+            heart_rate=60 + rng.random() * 60,
+            heart_rate_variability=rng.random() * 100,
+            respiration_rate=12 + rng.random() * 8,
+            temperature=36 + rng.random() * 2,
+            oxygen_saturation=95 + rng.random() * 5,
+            user_email="bench-user@example.com",
+            created_at=now - timedelta(seconds=i),
+            created_by="bench-user@example.com",
+        )
+        for i in range(count)
+    ]
+
+
+def pydantic_body(rows: list, adapter: TypeAdapter) -> bytes:
+    validated = adapter.validate_python(rows, from_attributes=True)
+    return JSONResponse(adapter.dump_python(validated, mode="json")).body
+
+
+def fast_body(rows: list) -> bytes:
+    return rows_response(rows, BiofeedbackOut).body
+
+
+def measure(label: str, fn, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - started) * 1000)
+    median = statistics.median(timings)
+    print(f"=== {label}: median {median:.2f} ms, min {min(timings):.2f} ms")
+    return median
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+    adapter = TypeAdapter(List[BiofeedbackOut])
+
+    if json.loads(pydantic_body(rows, adapter)) != json.loads(fast_body(rows)):
+        sys.exit("❌ Fast path output differs from the Pydantic response")
+    print(f"✅ Identical output for {args.rows} rows ({len(fast_body(rows)) / 1024:.0f} KiB)\n")
+
+    slow = measure("pydantic + json", lambda: pydantic_body(rows, adapter), args.repeat)
+    fast = measure("rows_response (orjson)", lambda: fast_body(rows), args.repeat)
+    print(f"\nSpeedup: {slow / fast:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the (user_email, created_at DESC, id DESC) telemetry indexes.
+
+Seeds a few million biofeedback rows spread over a set of throwaway users,
+then times and EXPLAINs the exact SQL issued by
+``get_biofeedback_by_user_email`` and ``get_biofeedbacks_by_user_email``
+(first page and a deep cursor page). With the index in place every plan
+should be a plain Index Scan on ``ix_biofeedbacks_user_email_created_at``
+with no Sort node, and the deep page should cost the same as the first.
+
+Run it against a scratch database only:
+
+    DATABASE_URL=postgresql://... python benchmarks/bench_user_email_indexes.py --rows 3000000
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import event, text
+
+from app.core.pagination import encode_cursor
+from app.crud import health_monitoring as crud
+from app.db.base import Base, SessionLocal, engine
+from app.models import Biofeedback, User
+
+INDEX_NAME = "ix_biofeedbacks_user_email_created_at"
+USER_PATTERN = "bench-user-%@example.com"
+
+
+def bench_email(i: int) -> str:
+    return f"bench-user-{i}@example.com"
+
+
+def seed(db, rows: int, users: int):
+    """Create the benchmark users and bulk-load ``rows`` biofeedback samples"""
+    existing = db.execute(text("SELECT count(*) FROM biofeedbacks WHERE user_email LIKE :p"), {"p": USER_PATTERN}).scalar()
+    if existing >= rows:
+        print(f"ℹ️  {existing} benchmark rows already present, skipping seed")
+        return
+    for i in range(users):
+        if not db.query(User).filter(User.email == bench_email(i)).first():
+            db.add(User(email=bench_email(i), password_hash="!", full_name="Benchmark"))
+    db.commit()
+    print(f"Seeding {rows} biofeedback rows across {users} users...")
+    started = time.perf_counter()
+    db.execute(text("""
+        INSERT INTO biofeedbacks (id, heart_rate, temperature, user_email, created_at)
+        SELECT gen_random_uuid(), 60 + random() * 60, 36 + random() * 2,
+               'bench-user-' || (g % :users) || '@example.com',
+               now() - make_interval(secs => g)
+        FROM generate_series(1, :rows) AS g
+    """), {"rows": rows - existing, "users": users})
+    db.commit()
+    db.execute(text("ANALYZE biofeedbacks"))
+    db.commit()
+    print(f"✅ Seeded in {time.perf_counter() - started:.1f}s")
+
+
+class LastStatement:
+    """Remember the last SQL statement the engine sent, so it can be EXPLAINed verbatim"""
+
+    def __init__(self):
+        self.statement = None
+        self.parameters = None
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        self.statement = statement
+        self.parameters = parameters
+
+
+def measure(label: str, fn, last: LastStatement, repeat: int):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - started) * 1000)
+    with engine.connect() as conn:
+        plan = conn.exec_driver_sql("EXPLAIN (ANALYZE, BUFFERS) " + last.statement, last.parameters).scalars().all()
+    uses_index = any(INDEX_NAME in line for line in plan)
+    sorts = any("Sort" in line for line in plan)
+    print(f"\n=== {label}: median {statistics.median(timings):.2f} ms, p95 {sorted(timings)[int(len(timings) * 0.95) - 1]:.2f} ms")
+    print(f"    index scan on {INDEX_NAME}: {'yes' if uses_index else 'NO'}, sort node: {'YES' if sorts else 'no'}")
+    for line in plan:
+        print("    " + line)
+
+
+def run_queries(db, user_email: str, deep_page: int, page_size: int, repeat: int):
+    last = LastStatement()
+    event.listen(engine, "before_cursor_execute", last)
+    try:
+        # Cursor pointing at the last row of page ``deep_page``, as a client would hold it
+        anchor = (
+            db.query(Biofeedback.created_at, Biofeedback.id)
+            .filter(Biofeedback.user_email == user_email)
+            .order_by(Biofeedback.created_at.desc(), Biofeedback.id.desc())
+            .offset(deep_page * page_size - 1)
+            .first()
+        )
+        deep_cursor = encode_cursor(anchor.created_at, anchor.id) if anchor else None
+
+        measure("latest (get_biofeedback_by_user_email)",
+                lambda: crud.get_biofeedback_by_user_email(db, user_email), last, repeat)
+        measure("page 1 (get_biofeedbacks_by_user_email)",
+                lambda: crud.get_biofeedbacks_by_user_email(db, user_email, limit=page_size), last, repeat)
+        if deep_cursor:
+            measure(f"page {deep_page + 1} via cursor",
+                    lambda: crud.get_biofeedbacks_by_user_email(db, user_email, limit=page_size, cursor=deep_cursor), last, repeat)
+    finally:
+        event.remove(engine, "before_cursor_execute", last)
+
+
+def cleanup(db):
+    db.execute(text("DELETE FROM biofeedbacks WHERE user_email LIKE :p"), {"p": USER_PATTERN})
+    db.execute(text("DELETE FROM users WHERE email LIKE :p"), {"p": USER_PATTERN})
+    db.commit()
+    print("🧹 Benchmark rows removed")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=3_000_000)
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--deep-page", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--compare", action="store_true", help="also measure with the index dropped first")
+    parser.add_argument("--cleanup", action="store_true", help="delete the benchmark rows when done")
+    args = parser.parse_args()
+
+    Base.metadata.create_all(bind=engine)
+    engine.echo = False
+    db = SessionLocal()
+    try:
+        seed(db, args.rows, args.users)
+        user_email = bench_email(0)
+
+        if args.compare:
+            db.execute(text(f"DROP INDEX IF EXISTS {INDEX_NAME}"))
+            db.commit()
+            print("\n##### without index #####")
+            run_queries(db, user_email, args.deep_page, args.page_size, max(3, args.repeat // 10))
+            db.execute(text(f"CREATE INDEX {INDEX_NAME} ON biofeedbacks (user_email, created_at DESC, id DESC)"))
+            db.execute(text("ANALYZE biofeedbacks"))
+            db.commit()
+
+        print("\n##### with index #####")
+        run_queries(db, user_email, args.deep_page, args.page_size, args.repeat)
+
+        if args.cleanup:
+            cleanup(db)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+import os
+import sys
+
+# Add the parent directory to the path to import app modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.images import strip_metadata, variant_files
+from app.services.uploads import ALLOWED_EXTENSIONS, EXTENSION_ALIASES, UPLOAD_DIR
+
+
+def strip_upload_metadata():
+    """Remove EXIF/XMP metadata from originals uploaded before it was stripped on upload"""
+    originals = [
+        path for path in UPLOAD_DIR.iterdir()
+        if path.is_file() and not path.name.startswith(".") and path.suffix.lower() in ALLOWED_EXTENSIONS
+    ]
+    # Derivatives were always written without metadata
+    derivatives = {p.name for path in originals for p in variant_files(path)}
+
+    stripped = 0
+    for path in originals:
+        if path.name in derivatives:
+            continue
+        extension = EXTENSION_ALIASES.get(path.suffix.lower(), path.suffix.lower())
+        try:
+            strip_metadata(str(path), extension)
+            stripped += 1
+        except Exception as e:
+            print(f"❌ Error stripping {path.name}: {e}")
+    print(f"✅ Stripped metadata from {stripped} uploaded images")
+
+
+if __name__ == "__main__":
+    print("Starting upload metadata cleanup...")
+    strip_upload_metadata()